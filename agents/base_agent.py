@@ -1,20 +1,18 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any
-from langchain_openai import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate
-from langchain.chains import LLMChain
+from langchain_core.prompts import ChatPromptTemplate
 from utils.logger import logger
 from utils.exceptions import PromptError
+from utils.llm import invoke_llm, get_chat_model
+from utils.token_budget import to_prompt_json
+from data.research_digest import slice_digest
 from config import config
 
 class BaseAgent(ABC):
     """기본 에이전트 클래스"""
     def __init__(self, prompt_file: str) -> None:
-        self.llm = ChatOpenAI(
-            model_name=config.openai.model_name,
-            temperature=config.openai.temperature,
-            max_tokens=config.openai.max_tokens
-        )
+        # 모든 에이전트가 같은 연결 풀의 모델 클라이언트를 공유
+        self.llm = get_chat_model()
         self.logger = logger
         self.prompt = self._load_prompt(prompt_file)
 
@@ -29,8 +27,29 @@ class BaseAgent(ABC):
             self.logger.error(f"Error loading prompt {prompt_file}: {e}")
             raise PromptError(f"Failed to load prompt {prompt_file}: {e}")
 
-    def _create_chain(self) -> LLMChain:
+    def _invoke(self, variables: Dict[str, Any]) -> Any:
+        """프롬프트를 렌더링하여 LLM 호출 (템플릿에 선언된 변수만 전달, 응답 캐시 경유)"""
+        variables = {key: value for key, value in variables.items() if key in self.prompt.input_variables}
+        return invoke_llm(self.llm, self.prompt.invoke(variables), label=type(self).__name__)
+
+    def _research_context(self, state: Dict[str, Any], agent: str) -> Any:
+        """
+        프롬프트에 넣을 연구 데이터
+        compact 스테이지의 요약본이 있으면 에이전트에 필요한 부분만 예산 이내로 잘라 사용
+        """
+        digest = state.get("research_digest")
+        if not digest or not config.token_budget.enabled:
+            return state["research_data"]
+        return to_prompt_json(slice_digest(
+            digest,
+            agent,
+            budget=config.token_budget.agent_budgets.get(agent),
+            model=config.token_budget.encoding_model
+        ))
+
+    def _create_chain(self) -> "LLMChain":
         """LLM 체인 생성"""
+        from langchain.chains import LLMChain
         return LLMChain(llm=self.llm, prompt=self.prompt)
 
     @abstractmethod
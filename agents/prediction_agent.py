@@ -1,4 +1,3 @@
-from langchain.prompts import ChatPromptTemplate
 import json
 import logging
 from datetime import datetime
@@ -23,9 +22,8 @@ class PredictionAgent(BaseAgent):
             tech_summary = state["tech_summary"]
             
             # 예측 생성
-            chain = self.prompt | self.llm
-            response = chain.invoke({
-                "research_data": research_data,
+            response = self._invoke({
+                "research_data": self._research_context(state, "prediction"),
                 "tech_summary": tech_summary,
                 "tech_roadmap": research_data.get("tech_roadmap", {})
             })
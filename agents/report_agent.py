@@ -1,11 +1,12 @@
 import logging
 from typing import Dict, Any, List, Tuple
 from datetime import datetime
-from langchain.prompts import ChatPromptTemplate
 from pathlib import Path
 from utils.decorators import log_execution_time, retry
-from utils.pdf_generator import PDFGenerator
+from utils.render_pool import get_render_pool
+from concurrent.futures import Future
 from .base_agent import BaseAgent
+from data.models import Paper, NewsItem, Patent, as_records
 from config import config
 import random
 import os
@@ -13,7 +14,6 @@ import os
 class ReportAgent(BaseAgent):
     def __init__(self) -> None:
         super().__init__("report_prompt.txt")
-        self.pdf_generator = PDFGenerator()
         
         # 트렌드 및 키워드 데이터베이스 - 더 현실적인 참고 자료 생성용
         self.tech_journals = [
@@ -99,40 +99,20 @@ class ReportAgent(BaseAgent):
     def __call__(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """최종 보고서 생성"""
         try:
-            self._validate_state(state, [
-                "topic",
-                "tech_summary",
-                "trend_prediction",
-                "risk_analysis",
-                "quality_metrics"
-            ])
-            
-            # 일관성을 위해 timestamp 명시적 추가
-            if "timestamp" not in state:
-                state["timestamp"] = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
-            # 참고 문헌 데이터 추가 (강화된 버전)
-            references = self._prepare_enhanced_references(state)
-            state["references"] = references
-            
-            # 보고서 생성 전에 먼저 데이터 품질 체크
-            quality_metrics = state.get("quality_metrics", {})
-            if self._is_low_quality_data(quality_metrics):
-                self.logger.warning("Low quality data detected, enhancing report generation with more detailed instructions")
-                # 데이터 품질이 낮을 경우 보고서 생성 지시를 강화
-                state["generation_instructions"] = "데이터 품질이 제한적이므로, 주제에 대한 깊은 전문지식을 바탕으로 상세하고 통찰력 있는 보고서를 작성해주세요. 각 섹션에 충분한 깊이와 맥락을 제공하고, 실제 가능한 기술 동향과 전망을 다양한 측면에서 다루어주세요. 보고서 분량은 기존보다 2-3배 이상 늘려서 작성해주세요."
-            else:
-                state["generation_instructions"] = "제공된 데이터를 바탕으로 상세하고 통찰력 있는 보고서를 작성해주세요. 보고서 분량은 기존보다 2-3배 이상 늘려서 작성해주세요."
-            
-            # 보고서 생성
-            chain = self.prompt | self.llm
-            response = chain.invoke(state)
-            
-            # 상태 업데이트
-            state.update({
-                "final_report": response.content,
-                "report_timestamp": state.get("timestamp")
-            })
+            state = self.compose(state)
+            
+            # 백그라운드 렌더링: 마크다운만 저장하고 PDF/HTML은 Future로 반환
+            if config.render.background:
+                md_path = self.save_markdown(state)
+                pdf_future = self.render_pdf_async(state)
+                html_future = self.render_html_async(state)
+                state.update({
+                    "report_md_path": md_path,
+                    "report_pdf_path": self._report_path(state, "pdf"),
+                    "report_html_path": self._report_path(state, "html"),
+                    "render_futures": {"pdf": pdf_future, "html": html_future}
+                })
+                return state
             
             # 보고서 저장 (마크다운, PDF 및 HTML)
             md_path, pdf_path, html_path = self._save_report(state)
@@ -152,6 +132,44 @@ class ReportAgent(BaseAgent):
             self.logger.error(f"Error in ReportAgent: {e}")
             raise
 
+    def compose(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """보고서 본문(마크다운) 생성"""
+        self._validate_state(state, [
+            "topic",
+            "tech_summary",
+            "trend_prediction",
+            "risk_analysis",
+            "quality_metrics"
+        ])
+        
+        # 일관성을 위해 timestamp 명시적 추가
+        if "timestamp" not in state:
+            state["timestamp"] = datetime.now().strftime("%Y%m%d_%H%M%S")
+        
+        # 참고 문헌 데이터 추가 (강화된 버전)
+        references = self._prepare_enhanced_references(state)
+        state["references"] = references
+        
+        # 보고서 생성 전에 먼저 데이터 품질 체크
+        quality_metrics = state.get("quality_metrics", {})
+        if self._is_low_quality_data(quality_metrics):
+            self.logger.warning("Low quality data detected, enhancing report generation with more detailed instructions")
+            # 데이터 품질이 낮을 경우 보고서 생성 지시를 강화
+            state["generation_instructions"] = "데이터 품질이 제한적이므로, 주제에 대한 깊은 전문지식을 바탕으로 상세하고 통찰력 있는 보고서를 작성해주세요. 각 섹션에 충분한 깊이와 맥락을 제공하고, 실제 가능한 기술 동향과 전망을 다양한 측면에서 다루어주세요. 보고서 분량은 기존보다 2-3배 이상 늘려서 작성해주세요."
+        else:
+            state["generation_instructions"] = "제공된 데이터를 바탕으로 상세하고 통찰력 있는 보고서를 작성해주세요. 보고서 분량은 기존보다 2-3배 이상 늘려서 작성해주세요."
+        
+        # 보고서 생성
+        response = self._invoke(state)
+        
+        # 상태 업데이트
+        state.update({
+            "final_report": response.content,
+            "report_timestamp": state.get("timestamp")
+        })
+        
+        return state
+
     def _is_low_quality_data(self, quality_metrics: Dict[str, Any]) -> bool:
         """데이터 품질이 낮은지 확인"""
         if not quality_metrics:
@@ -173,59 +191,45 @@ class ReportAgent(BaseAgent):
         # 연구 데이터에서 참고 문헌 추출
         research_data = state.get("research_data", {})
         
-        # 논문 데이터 추가
-        for paper in research_data.get("papers", []):
-            if paper and "title" in paper and "authors" in paper:
-                year = ""
-                if "publication_date" in paper:
-                    year = paper["publication_date"][:4] if paper["publication_date"] else ""
-                
-                authors = ", ".join(paper["authors"]) if isinstance(paper["authors"], list) else paper["authors"]
-                reference = f"{authors} ({year}). {paper['title']}."
-                
-                # 저널 정보가 있으면 추가
-                if "journal" in paper and paper["journal"]:
-                    reference += f" {paper['journal']}."
-                # 없으면 랜덤 저널 추가
-                else:
-                    random_journal = random.choice(self.tech_journals)
-                    reference += f" {random_journal}."
+        # 중복 확인은 집합으로 (목록 순서는 유지)
+        seen = set()
+        
+        def add_reference(reference: str) -> None:
+            if reference not in seen:
+                seen.add(reference)
+                references.append(reference)
+        
+        # 논문 데이터 추가 (체크포인트에서 복원된 사전도 레코드로 변환)
+        for paper in as_records(research_data.get("papers"), Paper):
+            if paper.authors:
+                year = paper.publication_date.year if paper.publication_date else ""
+                reference = f"{', '.join(paper.authors)} ({year}). {paper.title}."
                 
-                if reference not in references:
-                    references.append(reference)
+                # 저널 정보가 있으면 추가, 없으면 랜덤 저널 추가
+                reference += f" {paper.journal or random.choice(self.tech_journals)}."
+                add_reference(reference)
         
         # 뉴스 데이터 추가
-        for news in research_data.get("news", []):
-            if news and "title" in news and "source" in news:
-                year = ""
-                if "date" in news:
-                    year = news["date"][:4] if news["date"] else ""
-                
-                reference = f"{news['source']} ({year}). {news['title']}."
+        for news in as_records(research_data.get("news"), NewsItem):
+            if news.source:
+                year = news.date.year if news.date else ""
+                reference = f"{news.source} ({year}). {news.title}."
                 
                 # URL 추가
-                if "url" in news and news["url"]:
-                    reference += f" Retrieved from {news['url']}."
-                
-                if reference not in references:
-                    references.append(reference)
+                if news.url:
+                    reference += f" Retrieved from {news.url}."
+                add_reference(reference)
         
         # 특허 데이터 추가
-        for patent in research_data.get("patents", []):
-            if patent and "title" in patent and "inventors" in patent:
-                year = ""
-                if "filing_date" in patent:
-                    year = patent["filing_date"][:4] if patent["filing_date"] else ""
-                
-                inventors = ", ".join(patent["inventors"]) if isinstance(patent["inventors"], list) else patent["inventors"]
-                reference = f"{inventors} ({year}). {patent['title']} [Patent]."
+        for patent in as_records(research_data.get("patents"), Patent):
+            if patent.inventors:
+                year = patent.filing_date.year if patent.filing_date else ""
+                reference = f"{', '.join(patent.inventors)} ({year}). {patent.title} [Patent]."
                 
                 # 특허 번호나 기타 정보 추가
-                if "patent_number" in patent and patent["patent_number"]:
-                    reference += f" Patent No. {patent['patent_number']}."
-                
-                if reference not in references:
-                    references.append(reference)
+                if patent.patent_number:
+                    reference += f" Patent No. {patent.patent_number}."
+                add_reference(reference)
         
         # 참고 문헌이 없는 경우 향상된 샘플 데이터 생성
         if not references:
@@ -371,48 +375,64 @@ class ReportAgent(BaseAgent):
     def _save_report(self, state: Dict[str, Any]) -> Tuple[str, str, str]:
         """최종 보고서를 마크다운, PDF 및 HTML로 저장"""
         try:
-            # 파일명 생성
-            topic = state.get("topic", "report").replace(" ", "_")
-            timestamp = state.get("timestamp", datetime.now().strftime("%Y%m%d_%H%M%S"))
-            filename_base = f"{topic}_{timestamp}"
-            
-            # 마크다운 파일 저장
-            markdown_content = state.get("final_report", "")
-            md_path = config.paths.reports_dir / f"{filename_base}.md"
-            
-            with open(md_path, 'w', encoding='utf-8') as md_file:
-                md_file.write(markdown_content)
-            
-            self.logger.info(f"Report saved to {md_path}")
-            
-            # PDF 생성
-            metadata = {
-                "title": state.get("topic", "기술 트렌드 분석 보고서"),
-                "author": "AI 기술 분석 시스템",
-                "date": datetime.now().strftime("%Y년 %m월 %d일")
-            }
-            
-            pdf_path = self.pdf_generator.generate_pdf(
-                markdown_content=markdown_content,
-                output_path=str(config.paths.reports_dir / f"{filename_base}.pdf"),
-                metadata=metadata
-            )
-            
-            # HTML 생성 (추가)
-            html_path = config.paths.reports_dir / f"{filename_base}.html"
-            self.pdf_generator.generate_html(
-                markdown_content=markdown_content,
-                output_path=str(html_path),
-                metadata=metadata
-            )
-            
-            self.logger.info(f"HTML report saved to {html_path}")
-            
-            return str(md_path), pdf_path, str(html_path)
+            md_path = self.save_markdown(state)
+            # PDF와 HTML은 렌더링 풀에서 동시에 생성
+            pdf_future = self.render_pdf_async(state)
+            html_future = self.render_html_async(state)
+            return md_path, pdf_future.result(), html_future.result()
             
         except Exception as e:
             self.logger.error(f"Error saving report: {e}")
             raise
+
+    def _report_path(self, state: Dict[str, Any], extension: str) -> str:
+        """보고서 파일 경로"""
+        topic = state.get("topic", "report").replace(" ", "_")
+        timestamp = state.get("timestamp", datetime.now().strftime("%Y%m%d_%H%M%S"))
+        return str(config.paths.reports_dir / f"{topic}_{timestamp}.{extension}")
+
+    def _report_metadata(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """PDF/HTML 문서 메타데이터"""
+        return {
+            "title": state.get("topic", "기술 트렌드 분석 보고서"),
+            "author": "AI 기술 분석 시스템",
+            "date": datetime.now().strftime("%Y년 %m월 %d일")
+        }
+
+    def save_markdown(self, state: Dict[str, Any]) -> str:
+        """마크다운 보고서 저장"""
+        markdown_content = state.get("final_report", "")
+        md_path = self._report_path(state, "md")
+        
+        with open(md_path, 'w', encoding='utf-8') as md_file:
+            md_file.write(markdown_content)
+        
+        self.logger.info(f"Report saved to {md_path}")
+        return md_path
+
+    def render_pdf_async(self, state: Dict[str, Any]) -> "Future[str]":
+        """PDF 렌더링을 렌더링 풀에 제출"""
+        return get_render_pool().submit_pdf(
+            state.get("final_report", ""),
+            self._report_path(state, "pdf"),
+            self._report_metadata(state)
+        )
+
+    def render_html_async(self, state: Dict[str, Any]) -> "Future[str]":
+        """HTML 렌더링을 렌더링 풀에 제출"""
+        return get_render_pool().submit_html(
+            state.get("final_report", ""),
+            self._report_path(state, "html"),
+            self._report_metadata(state)
+        )
+
+    def render_pdf(self, state: Dict[str, Any]) -> str:
+        """PDF 보고서 생성 (완료까지 대기)"""
+        return self.render_pdf_async(state).result()
+
+    def render_html(self, state: Dict[str, Any]) -> str:
+        """HTML 보고서 생성 (완료까지 대기)"""
+        return self.render_html_async(state).result()
     
     def _open_in_browser(self, html_path: str) -> None:
         """HTML 보고서를 브라우저에서 열기"""
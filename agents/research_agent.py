@@ -1,6 +1,4 @@
 # agents/research_agent.py (업데이트)
-from langchain.agents import AgentExecutor
-from langchain.prompts import ChatPromptTemplate
 import json
 import logging
 import os
@@ -9,9 +7,6 @@ from typing import Dict, Any, List
 from dotenv import load_dotenv
 from utils.decorators import log_execution_time, retry
 from data.data_collector import DataCollector
-from analysis.text_analysis import TextAnalyzer
-from analysis.trend_analysis import TrendAnalyzer
-from analysis.network_analysis import NetworkAnalyzer
 from .base_agent import BaseAgent
 
 logger = logging.getLogger(__name__)
@@ -20,9 +15,31 @@ class ResearchAgent(BaseAgent):
     def __init__(self) -> None:
         super().__init__("research_prompt.txt")
         self.data_collector = DataCollector()
-        self.text_analyzer = TextAnalyzer()
-        self.trend_analyzer = TrendAnalyzer()
-        self.network_analyzer = NetworkAnalyzer()
+        # 분석기는 NLTK, scikit-learn, networkx 등 무거운 의존성을 불러오므로 처음 사용할 때 생성
+        self._text_analyzer = None
+        self._trend_analyzer = None
+        self._network_analyzer = None
+
+    @property
+    def text_analyzer(self):
+        if self._text_analyzer is None:
+            from analysis.text_analysis import TextAnalyzer
+            self._text_analyzer = TextAnalyzer()
+        return self._text_analyzer
+
+    @property
+    def trend_analyzer(self):
+        if self._trend_analyzer is None:
+            from analysis.trend_analysis import TrendAnalyzer
+            self._trend_analyzer = TrendAnalyzer()
+        return self._trend_analyzer
+
+    @property
+    def network_analyzer(self):
+        if self._network_analyzer is None:
+            from analysis.network_analysis import NetworkAnalyzer
+            self._network_analyzer = NetworkAnalyzer()
+        return self._network_analyzer
         
     @log_execution_time
     @retry(max_attempts=3)
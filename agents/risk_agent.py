@@ -1,4 +1,3 @@
-from langchain.prompts import ChatPromptTemplate
 import json
 import logging
 from datetime import datetime
@@ -19,13 +18,11 @@ class RiskAnalysisAgent(BaseAgent):
         try:
             self._validate_state(state, ["research_data", "trend_prediction"])
             
-            research_data = state["research_data"]
             trend_prediction = state["trend_prediction"]
             
             # 리스크 분석 수행
-            chain = self.prompt | self.llm
-            response = chain.invoke({
-                "research_data": research_data,
+            response = self._invoke({
+                "research_data": self._research_context(state, "risk"),
                 "trend_prediction": trend_prediction
             })
             
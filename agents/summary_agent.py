@@ -1,4 +1,3 @@
-from langchain.prompts import ChatPromptTemplate
 import json
 import logging
 from datetime import datetime
@@ -74,9 +73,8 @@ class SummaryAgent(BaseAgent):
             research_data = state["research_data"]
             
             # 요약 생성
-            chain = self.prompt | self.llm
-            response = chain.invoke({
-                "research_data": research_data,
+            response = self._invoke({
+                "research_data": self._research_context(state, "summary"),
                 "tech_categories": research_data.get("tech_categories", {}),
                 "\n    \"executive_summary\"": ""  # 빈 값으로 초기화
             })
@@ -0,0 +1,233 @@
+"""
+고정 메모리 스트리밍 키워드 스케치
+Count-Min 스케치(임의 키워드의 빈도 상한)와 Space-Saving(상위 키워드 후보와 오차)을
+시간 구간(window)별로 유지하여, 끝없는 뉴스 피드처럼 전체 토큰을 모을 수 없는 스트림에서도
+텍스트 청크를 들어오는 대로 반영하고 구간별 상위 k개 키워드를 오차 범위와 함께 반환합니다.
+메모리는 구간 수 × (width × depth 카운터 + capacity개 후보)로 고정됩니다.
+"""
+import math
+import zlib
+import heapq
+from array import array
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Any, Hashable, Iterable, List, Optional, Tuple
+
+
+class CountMinSketch:
+    """
+    Count-Min 스케치
+
+    추정값은 실제 빈도 이상이며, 확률 1 - e^-depth 이상으로 실제 빈도 + (e / width) × 전체 건수 이하입니다.
+
+    Args:
+        width: 행별 카운터 수
+        depth: 해시 행 수
+    """
+    def __init__(self, width: int = 2048, depth: int = 4) -> None:
+        self.width = max(1, width)
+        self.depth = max(1, depth)
+        self.total = 0
+        self._rows = [array('q', bytes(8 * self.width)) for _ in range(self.depth)]
+
+    @classmethod
+    def from_error(cls, epsilon: float, delta: float) -> "CountMinSketch":
+        """상대 오차 epsilon을 확률 1 - delta로 보장하는 크기로 생성"""
+        return cls(width=math.ceil(math.e / epsilon), depth=math.ceil(math.log(1 / delta)))
+
+    def _indexes(self, item: str) -> List[int]:
+        # 두 해시의 선형 결합으로 행별 위치 계산 (프로세스와 무관하게 같은 위치)
+        data = item.encode("utf-8")
+        first, second = zlib.crc32(data), zlib.adler32(data) | 1
+        return [(first + row * second) % self.width for row in range(self.depth)]
+
+    def add(self, item: str, count: int = 1) -> None:
+        self.total += count
+        for row, index in zip(self._rows, self._indexes(item)):
+            row[index] += count
+
+    def estimate(self, item: str) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(item)))
+
+    @property
+    def error_bound(self) -> float:
+        """추정값이 실제 빈도를 넘을 수 있는 최대량 (확률 1 - e^-depth)"""
+        return math.e / self.width * self.total
+
+
+class SpaceSaving:
+    """
+    Space-Saving 상위 빈도 항목 요약
+
+    추적 중인 항목의 실제 빈도는 count - error 이상 count 이하이며,
+    추적하지 않는 항목의 실제 빈도는 min_count 이하입니다.
+
+    Args:
+        capacity: 추적할 최대 항목 수
+    """
+    def __init__(self, capacity: int = 1000) -> None:
+        self.capacity = max(1, capacity)
+        self._counts: Dict[str, List[int]] = {}
+        # 지연 삭제 최소 힙 (count가 바뀐 항목의 이전 값은 꺼낼 때 건너뜀)
+        self._heap: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _min_item(self) -> str:
+        while True:
+            count, item = self._heap[0]
+            entry = self._counts.get(item)
+            if entry is not None and entry[0] == count:
+                return item
+            heapq.heappop(self._heap)
+
+    def _push(self, item: str, count: int) -> None:
+        heapq.heappush(self._heap, (count, item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(entry[0], key) for key, entry in self._counts.items()]
+            heapq.heapify(self._heap)
+
+    def add(self, item: str, count: int = 1) -> None:
+        entry = self._counts.get(item)
+        if entry is not None:
+            entry[0] += count
+        elif len(self._counts) < self.capacity:
+            entry = self._counts[item] = [count, 0]
+        else:
+            # 가장 작은 항목을 내보내고 그 빈도를 새 항목의 오차로 물려받음
+            evicted = self._min_item()
+            floor = self._counts.pop(evicted)[0]
+            entry = self._counts[item] = [floor + count, floor]
+        self._push(item, entry[0])
+
+    @property
+    def min_count(self) -> int:
+        """추적하지 않는 항목의 빈도 상한 (가득 차기 전에는 0)"""
+        if len(self._counts) < self.capacity:
+            return 0
+        return self._counts[self._min_item()][0]
+
+    def get(self, item: str) -> Optional[Tuple[int, int]]:
+        """(count, error) 또는 추적하지 않으면 None"""
+        entry = self._counts.get(item)
+        return (entry[0], entry[1]) if entry is not None else None
+
+    def items(self) -> Iterable[Tuple[str, int, int]]:
+        return ((item, entry[0], entry[1]) for item, entry in self._counts.items())
+
+
+class _Window:
+    __slots__ = ("sketch", "summary", "documents")
+
+    def __init__(self, width: int, depth: int, capacity: int) -> None:
+        self.sketch = CountMinSketch(width, depth)
+        self.summary = SpaceSaving(capacity)
+        self.documents = 0
+
+
+class StreamingKeywordSketch:
+    """
+    구간별 스트리밍 상위 키워드 추적기
+
+    Args:
+        tokenize: 문서를 키워드 토큰으로 나누는 함수 (예: TokenPipeline.process)
+        width, depth: 구간별 Count-Min 스케치 크기
+        capacity: 구간별 Space-Saving 후보 수 (top_k보다 충분히 크게)
+        max_windows: 유지할 최근 구간 수 (초과 시 가장 오래된 구간부터 삭제)
+    """
+    def __init__(self, tokenize: Callable[[str], Iterable[str]], width: int = 2048, depth: int = 4,
+                 capacity: int = 1000, max_windows: int = 12) -> None:
+        self.tokenize = tokenize
+        self.width = width
+        self.depth = depth
+        self.capacity = capacity
+        self.max_windows = max(1, max_windows)
+        self._windows: "OrderedDict[Hashable, _Window]" = OrderedDict()
+
+    @property
+    def windows(self) -> List[Hashable]:
+        return list(self._windows)
+
+    def _states(self, window: Optional[Hashable]) -> List[_Window]:
+        if window is None:
+            return list(self._windows.values())
+        return [self._windows[window]] if window in self._windows else []
+
+    def _window(self, window: Hashable) -> _Window:
+        state = self._windows.get(window)
+        if state is None:
+            state = self._windows[window] = _Window(self.width, self.depth, self.capacity)
+            while len(self._windows) > self.max_windows:
+                self._windows.popitem(last=False)
+        return state
+
+    def update(self, texts: Iterable[str], window: Hashable = "all") -> None:
+        """텍스트 청크 반영 (청크 안에서 먼저 집계하여 구조 갱신 횟수를 줄임)"""
+        state = self._window(window)
+        counts: Counter = Counter()
+        for text in texts:
+            counts.update(self.tokenize(text))
+            state.documents += 1
+        self._add_counts(state, counts)
+
+    def update_tokens(self, tokens: Iterable[str], window: Hashable = "all") -> None:
+        """이미 토큰화된 키워드 반영"""
+        self._add_counts(self._window(window), Counter(tokens))
+
+    @staticmethod
+    def _add_counts(state: _Window, counts: Counter) -> None:
+        for item, count in counts.items():
+            state.sketch.add(item, count)
+            state.summary.add(item, count)
+
+    def top_k(self, k: int = 10, window: Optional[Hashable] = None) -> List[Dict[str, Any]]:
+        """
+        구간(None이면 유지 중인 전체 구간)의 상위 k개 키워드
+
+        frequency는 Space-Saving 상한과 Count-Min 추정 중 작은 값이며,
+        실제 빈도는 lower_bound 이상 upper_bound 이하입니다.
+        """
+        states = self._states(window)
+        total = sum(state.sketch.total for state in states)
+        candidates = {item for state in states for item, _, _ in state.summary.items()}
+
+        results = []
+        for item in candidates:
+            upper = lower = estimate = 0
+            for state in states:
+                tracked = state.summary.get(item)
+                if tracked is not None:
+                    upper += tracked[0]
+                    lower += tracked[0] - tracked[1]
+                else:
+                    upper += state.summary.min_count
+                estimate += state.sketch.estimate(item)
+            frequency = min(upper, estimate)
+            results.append({
+                "keyword": item,
+                "frequency": frequency,
+                "score": frequency / total if total else 0.0,
+                "lower_bound": lower,
+                "upper_bound": frequency
+            })
+        results.sort(key=lambda entry: (-entry["frequency"], -entry["lower_bound"], entry["keyword"]))
+        return results[:k]
+
+    def estimate(self, keyword: str, window: Optional[Hashable] = None) -> int:
+        """임의 키워드의 빈도 추정 (Count-Min 상한)"""
+        return sum(state.sketch.estimate(keyword) for state in self._states(window))
+
+    def trends(self, k: int = 5) -> Dict[Hashable, List[Dict[str, Any]]]:
+        """구간별 상위 k개 키워드 (구간 생성 순서)"""
+        return {window: self.top_k(k, window) for window in self._windows}
+
+    def window_stats(self, window: Hashable) -> Dict[str, Any]:
+        """구간의 문서/토큰 수와 오차 한계"""
+        state = self._windows[window]
+        return {
+            "documents": state.documents,
+            "tokens": state.sketch.total,
+            "tracked": len(state.summary),
+            "sketch_error_bound": state.sketch.error_bound,
+            "untracked_max": state.summary.min_count
+        }
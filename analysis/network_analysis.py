@@ -5,6 +5,7 @@ import networkx as nx
 import community
 from utils.logger import logger
 from utils.exceptions import ValidationError
+from data.models import Paper, Patent, Investment, as_records
 
 class NetworkAnalyzer:
     def __init__(self) -> None:
@@ -14,13 +15,13 @@ class NetworkAnalyzer:
         """협력 네트워크 분석"""
         try:
             # 논문 저자 네트워크 생성
-            author_network = self._create_author_network(data.get("papers", []))
+            author_network = self._create_author_network(as_records(data.get("papers"), Paper))
             
             # 특허 발명자 네트워크 생성
-            inventor_network = self._create_inventor_network(data.get("patents", []))
+            inventor_network = self._create_inventor_network(as_records(data.get("patents"), Patent))
             
             # 기업 협력 네트워크 생성
-            company_network = self._create_company_network(data.get("investments", []))
+            company_network = self._create_company_network(as_records(data.get("investments"), Investment))
 
             return {
                 "author_network": self._analyze_network(author_network),
@@ -35,12 +36,12 @@ class NetworkAnalyzer:
             logger.error(f"Error in collaboration network analysis: {e}")
             raise
 
-    def _create_author_network(self, papers: List[Dict[str, Any]]) -> nx.Graph:
+    def _create_author_network(self, papers: List[Paper]) -> nx.Graph:
         """논문 저자 네트워크 생성"""
         try:
             G = nx.Graph()
             for paper in papers:
-                authors = paper.get("authors", [])
+                authors = paper.authors
                 for i in range(len(authors)):
                     for j in range(i + 1, len(authors)):
                         if not G.has_edge(authors[i], authors[j]):
@@ -53,12 +54,12 @@ class NetworkAnalyzer:
             logger.error(f"Error in author network creation: {e}")
             raise
 
-    def _create_inventor_network(self, patents: List[Dict[str, Any]]) -> nx.Graph:
+    def _create_inventor_network(self, patents: List[Patent]) -> nx.Graph:
         """특허 발명자 네트워크 생성"""
         try:
             G = nx.Graph()
             for patent in patents:
-                inventors = patent.get("inventors", [])
+                inventors = patent.inventors
                 # 발명자 간 연결 생성
                 for i in range(len(inventors)):
                     for j in range(i + 1, len(inventors)):
@@ -72,13 +73,13 @@ class NetworkAnalyzer:
             logger.error(f"Error in inventor network creation: {e}")
             return nx.Graph()
 
-    def _create_company_network(self, investments: List[Dict[str, Any]]) -> nx.Graph:
+    def _create_company_network(self, investments: List[Investment]) -> nx.Graph:
         """기업 협력 네트워크 생성"""
         try:
             G = nx.Graph()
             for investment in investments:
-                company = investment.get("company")
-                investors = investment.get("investors", [])
+                company = investment.company
+                investors = investment.investors
                 # 기업-투자자 간 연결 생성
                 for investor in investors:
                     if not G.has_edge(company, investor):
@@ -151,4 +152,22 @@ class NetworkAnalyzer:
 
         except Exception as e:
             logger.error(f"Error in network analysis integration: {e}")
-            return {}
\ No newline at end of file
+            return {}
+
+    def _analyze_collaboration_patterns(self, G: nx.Graph) -> Dict[str, Any]:
+        """연결 요소, 군집 계수, 반복 협력(가중치 2 이상 연결) 분석"""
+        if G.number_of_nodes() == 0:
+            return {}
+        components = [len(component) for component in nx.connected_components(G)]
+        return {
+            "num_components": len(components),
+            "largest_component_size": max(components),
+            "average_clustering": nx.average_clustering(G),
+            "repeat_collaborations": sum(1 for _, _, weight in G.edges(data="weight") if weight > 1)
+        }
+
+    def _identify_key_players(self, G: nx.Graph, top_n: int = 10) -> List[Dict[str, Any]]:
+        """가중 연결 수 기준 핵심 참여자"""
+        strength = dict(G.degree(weight="weight"))
+        top = sorted(strength.items(), key=lambda item: item[1], reverse=True)[:top_n]
+        return [{"name": name, "connections": G.degree(name), "weight": weight} for name, weight in top]
@@ -0,0 +1,131 @@
+"""
+한국어/영어 혼합 기술 문서용 정규식 토크나이저
+미리 컴파일한 정규식 하나로 영숫자 단어와 한글 어절을 분리하고, 한글 어절은 끝의 조사/어미를
+최장 일치로 떼어 냅니다(받침에 따라 모양이 바뀌는 조사는 앞 음절과 맞을 때만). NLTK 데이터(Punkt, stopwords, WordNet) 없이 동작하며,
+불용어와 조사 목록은 모듈 로드 시점에 한 번만 준비합니다.
+"""
+import re
+from functools import lru_cache
+from typing import List
+
+# 영문/숫자 단어 또는 한글 음절 연속 (소문자 입력 기준)
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+|[가-힣]+')
+
+# 어절 끝에서 떼어 낼 조사/어미 (최장 일치 우선으로 정렬)
+KOREAN_PARTICLES = tuple(sorted({
+    "은", "는", "이", "가", "을", "를", "에", "의", "와", "과", "로", "한",
+    "에서", "에게", "으로", "부터", "까지", "보다", "처럼", "만큼", "마다", "조차",
+    "이나", "이라", "라는", "이라는", "과의", "와의", "에는", "에도", "로서", "로써",
+    "으로서", "으로써", "으로는", "으로도", "에서는", "에서도", "에서의", "에게서", "으로부터", "에서부터",
+    "하는", "하고", "하며", "하여", "해서", "했다", "한다", "된", "되는", "된다", "되어", "이다", "입니다", "있는"
+}, key=len, reverse=True))
+
+# 조사처럼 끝나지만 떼어 내면 뜻이 바뀌는 명사 (어절이 이 명사로 끝나면 끝 음절을 떼지 않음, 예: 연구결과)
+KOREAN_NO_STRIP = frozenset({
+    "전문가", "투자가", "분석가", "기업가", "사업가", "발명가", "평론가", "자본가", "정치가", "예술가",
+    "주가", "추가", "결과", "효과", "성과", "통과", "학과", "길이", "높이", "깊이", "넓이",
+    "마이크로", "매크로", "하이드로", "회로", "경로", "도로", "통로", "항로", "선로", "진로",
+    "주의", "회의", "정의", "합의", "협의", "논의", "동의", "권한", "기한", "제한", "무한"
+})
+
+# 앞 음절의 받침 유무에 따라 모양이 바뀌는 조사 (받침 뒤에만 / 받침 없는 음절이나 ㄹ 받침 뒤에만 붙음)
+_AFTER_BATCHIM = frozenset({
+    "이", "을", "은", "과", "이나", "이라", "이라는", "과의",
+    "으로", "으로서", "으로써", "으로는", "으로도", "으로부터"
+})
+_AFTER_VOWEL = frozenset({"가", "를", "는", "와", "와의", "라는", "로", "로서", "로써"})
+_RIEUL = 8  # 종성 인덱스의 ㄹ
+
+KOREAN_STOPWORDS = frozenset({
+    "것", "수", "등", "및", "이", "그", "저", "이것", "그것", "저것", "여기", "거기",
+    "또한", "그리고", "하지만", "그러나", "그래서", "따라서", "또는", "혹은", "즉",
+    "위해", "위한", "대한", "대해", "통해", "통한", "따라", "따른", "관련", "관한",
+    "있다", "있는", "있음", "없다", "없는", "같은", "같이", "이러한", "그러한", "이런", "그런",
+    "더", "덜", "가장", "매우", "너무", "아주", "잘", "많은", "많이", "모든", "각", "여러",
+    "때문", "경우", "중", "내", "외", "위", "간", "후", "전", "약", "이번", "현재", "최근",
+    "하다", "한다", "했다", "되다", "된다", "이다", "입니다", "합니다", "됩니다", "있습니다",
+    "은", "는", "가", "을", "를", "에", "의", "와", "과", "도", "로", "으로", "에서", "에게"
+})
+
+# NLTK english stopwords와 같은 목록 (런타임 다운로드 없이 사용)
+ENGLISH_STOPWORDS = frozenset("""
+i me my myself we our ours ourselves you your yours yourself yourselves he him his himself she her
+hers herself it its itself they them their theirs themselves what which who whom this that these
+those am is are was were be been being have has had having do does did doing a an the and but if or
+because as until while of at by for with about against between into through during before after
+above below to from up down in out on off over under again further then once here there when where
+why how all any both each few more most other some such no nor not only own same so than too very
+s t can will just don should now d ll m o re ve y ain aren couldn didn doesn hadn hasn haven isn ma
+mightn mustn needn shan shouldn wasn weren won wouldn
+""".split())
+
+STOPWORDS = KOREAN_STOPWORDS | ENGLISH_STOPWORDS
+
+# s로 끝나지만 복수형이 아니거나 규칙과 다르게 변하는 단어
+ENGLISH_LEMMA_EXCEPTIONS = {
+    **{word: word for word in """
+    news series species means physics economics robotics electronics analytics statistics mathematics
+    ethics logistics genomics diagnostics semantics dynamics optics graphics mechanics photonics
+    kubernetes devops mlops always perhaps bias alias atlas canvas chaos lens
+    """.split()},
+    **{word: word[:-1] for word in "movies cookies calories zombies rookies selfies ties lies pies dies".split()}
+}
+
+
+def _batchim(syllable: str) -> int:
+    """한글 음절의 종성 인덱스 (0이면 받침 없음)"""
+    return (ord(syllable) - 0xAC00) % 28
+
+
+def _particle_fits(stem: str, particle: str) -> bool:
+    """조사가 어간의 끝 음절 받침 규칙에 맞는지 (이/가, 을/를, 은/는, 과/와, 으로/로)"""
+    if particle in _AFTER_BATCHIM:
+        final = _batchim(stem[-1])
+        return final != 0 and not (particle.startswith("으로") and final == _RIEUL)
+    if particle in _AFTER_VOWEL:
+        final = _batchim(stem[-1])
+        return final == 0 or (particle.startswith("로") and final == _RIEUL)
+    return True
+
+
+@lru_cache(maxsize=100_000)
+def strip_particle(token: str) -> str:
+    """
+    한글 어절 끝의 조사/어미 제거
+
+    남는 어간이 두 글자 이상이거나 불용어이고, 받침에 따라 모양이 바뀌는 조사는 어간의
+    끝 음절과 맞을 때만 떼어 냅니다 (디스플레이, 재평가의 끝 음절은 조사가 아님).
+    """
+    if any(token.endswith(noun) for noun in KOREAN_NO_STRIP):
+        return token
+    for particle in KOREAN_PARTICLES:
+        if token.endswith(particle):
+            stem = token[:-len(particle)]
+            if (len(stem) >= 2 or stem in KOREAN_STOPWORDS) and _particle_fits(stem, particle):
+                return stem
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """소문자 문서를 영숫자 단어와 조사를 뗀 한글 어절로 분리"""
+    tokens = TOKEN_PATTERN.findall(text)
+    if text.isascii():
+        return tokens
+    # 토큰은 영숫자만 또는 한글만으로 이루어지므로 첫 글자로 구분
+    return [strip_particle(token) if token[0] >= "가" else token for token in tokens]
+
+
+def lemmatize(token: str) -> str:
+    """영어 복수형을 단수로 바꾸는 가벼운 표제어 변환 (한글/숫자는 그대로)"""
+    if len(token) <= 3 or not token.isascii() or not token.isalpha():
+        return token
+    exception = ENGLISH_LEMMA_EXCEPTIONS.get(token)
+    if exception is not None:
+        return exception
+    if token.endswith("ies"):
+        return token[:-3] + "y"
+    if token.endswith(("sses", "xes", "ches", "shes")):
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
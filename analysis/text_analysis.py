@@ -1,20 +1,55 @@
-from typing import List, Dict, Any
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from collections import Counter
+from functools import partial
+from typing import List, Dict, Any, Optional
 from utils.logger import logger
 from utils.exceptions import ValidationError
+from analysis import regex_tokenizer
+from analysis.tokenization import TokenPipeline
+from analysis.keyword_sketch import StreamingKeywordSketch
+from config import config
+
+TOKENIZERS = ("nltk", "regex")
+
+
+def build_pipeline(tokenizer: str = "nltk") -> TokenPipeline:
+    """
+    토큰화/표제어 파이프라인 (프로세스 풀 워커에서도 같은 함수로 생성)
+
+    nltk: Punkt 토큰화 + WordNet 표제어 + 영어 불용어
+    regex: 한국어/영어 혼합 정규식 토큰화 + 조사 제거 + 한국어/영어 불용어 (NLTK 불필요)
+    """
+    if tokenizer == "regex":
+        tokenize, lemmatize, stop_words = (
+            regex_tokenizer.tokenize, regex_tokenizer.lemmatize, regex_tokenizer.STOPWORDS
+        )
+    elif tokenizer == "nltk":
+        from nltk.tokenize import word_tokenize
+        from nltk.corpus import stopwords
+        from nltk.stem import WordNetLemmatizer
+        tokenize, lemmatize, stop_words = word_tokenize, WordNetLemmatizer().lemmatize, stopwords.words('english')
+    else:
+        raise ValidationError(f"Unknown tokenizer: {tokenizer}. Available: {TOKENIZERS}")
+    return TokenPipeline(
+        tokenize,
+        lemmatize,
+        stop_words,
+        lemma_cache_size=config.text_analysis.lemma_cache_size,
+        document_cache_size=config.text_analysis.document_cache_size,
+        factory=partial(build_pipeline, tokenizer)
+    )
+
 
 class TextAnalyzer:
-    def __init__(self) -> None:
-        self._initialize_nltk()
-        self.lemmatizer = WordNetLemmatizer()
-        self.stop_words = set(stopwords.words('english'))
+    def __init__(self, tokenizer: Optional[str] = None) -> None:
+        self.tokenizer = tokenizer or config.text_analysis.tokenizer
+        if self.tokenizer == "nltk":
+            self._initialize_nltk()
+        # 표제어/문서 토큰 캐시는 인스턴스 수명 동안 extract_keywords 호출 간에 공유
+        self.pipeline = build_pipeline(self.tokenizer)
+        self.stop_words = self.pipeline.stop_words
 
     def _initialize_nltk(self) -> None:
         """NLTK 데이터 초기화"""
+        import nltk
         try:
             nltk.data.find('tokenizers/punkt')
             nltk.data.find('corpora/stopwords')
@@ -30,24 +65,20 @@ class TextAnalyzer:
             raise ValidationError("Empty text list provided")
 
         try:
-            words = []
-            for text in texts:
-                tokens = word_tokenize(text.lower())
-                tokens = [
-                    self.lemmatizer.lemmatize(token) 
-                    for token in tokens 
-                    if token.isalnum() and token not in self.stop_words
-                ]
-                words.extend(tokens)
-
-            word_freq = Counter(words)
+            word_freq = self.pipeline.count(
+                texts,
+                workers=config.text_analysis.workers,
+                min_parallel=config.text_analysis.parallel_min_documents,
+                chunk_size=config.text_analysis.chunk_size
+            )
+            total = sum(word_freq.values())
             top_keywords = word_freq.most_common(top_n)
 
             return [
                 {
                     "keyword": word,
                     "frequency": freq,
-                    "score": freq / len(words)
+                    "score": freq / total
                 }
                 for word, freq in top_keywords
             ]
@@ -56,8 +87,23 @@ class TextAnalyzer:
             logger.error(f"Error in keyword extraction: {e}")
             raise
 
+    def keyword_sketch(self) -> StreamingKeywordSketch:
+        """
+        고정 메모리 스트리밍 키워드 추적기
+
+        전체 토큰을 모으는 extract_keywords와 달리 텍스트 청크를 구간별로 계속 반영하며
+        메모리는 설정한 스케치 크기와 구간 수로 고정됩니다.
+        """
+        return StreamingKeywordSketch(
+            self.pipeline.process,
+            width=config.text_analysis.sketch_width,
+            depth=config.text_analysis.sketch_depth,
+            capacity=config.text_analysis.sketch_capacity,
+            max_windows=config.text_analysis.sketch_windows
+        )
+
     def analyze_topic_trends(self, texts: List[str], time_periods: List[str]) -> Dict[str, Any]:
-        """시간별 토픽 트렌드 분석"""
+        """시간별 토픽 트렌드 분석 (기간 간 겹치는 문서는 토큰 캐시를 재사용)"""
         if len(texts) != len(time_periods):
             raise ValidationError("Number of texts and time periods must match")
 
@@ -74,4 +120,16 @@ class TextAnalyzer:
 
         except Exception as e:
             logger.error(f"Error in topic trend analysis: {e}")
-            raise
\ No newline at end of file
+            raise
+
+    def _generate_trend_summary(self, trends: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[str]]:
+        """첫 기간과 마지막 기간의 상위 키워드 비교 (새로 등장/지속/사라진 키워드)"""
+        periods = [[item["keyword"] for item in keywords] for keywords in trends.values()]
+        if not periods:
+            return {"emerging": [], "persistent": [], "declining": []}
+        first, last = periods[0], periods[-1]
+        return {
+            "emerging": [word for word in last if word not in first],
+            "persistent": [word for word in last if all(word in period for period in periods)],
+            "declining": [word for word in first if word not in last]
+        }
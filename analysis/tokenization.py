@@ -0,0 +1,158 @@
+"""
+캐시/배치 토큰화 파이프라인
+문서를 토큰화 → 불용어 제거 → 표제어 변환한 결과를 문서 내용 해시로 캐시하고(LRU),
+표제어 변환은 토큰 단위 LRU 캐시로 같은 단어를 한 번만 계산합니다.
+기간별 분석처럼 겹치는 텍스트를 반복 처리해도 이미 본 문서는 다시 토큰화하지 않으며,
+대량의 새 문서는 프로세스 풀에서 청크 단위로 나누어 처리합니다.
+"""
+import hashlib
+import logging
+import threading
+import multiprocessing
+from collections import OrderedDict, Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Tokens = Tuple[str, ...]
+
+# 워커 프로세스별 파이프라인 (초기화 비용을 프로세스당 한 번만 지불)
+_worker_pipeline: Optional["TokenPipeline"] = None
+
+
+def _init_worker(factory: Callable[[], "TokenPipeline"]) -> None:
+    global _worker_pipeline
+    _worker_pipeline = factory()
+
+
+def _tokenize_chunk(texts: List[str]) -> List[Tokens]:
+    return [_worker_pipeline.process(text) for text in texts]
+
+
+def content_key(text: str) -> bytes:
+    """문서 캐시 키 (내용 해시)"""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+class TokenPipeline:
+    """
+    토큰화 + 불용어 제거 + 표제어 변환 파이프라인
+
+    Args:
+        tokenize: 소문자 문서를 토큰 목록으로 나누는 함수
+        lemmatize: 토큰의 표제어를 반환하는 함수 (None이면 변환하지 않음)
+        stop_words: 제외할 토큰 집합
+        lemma_cache_size: 표제어 LRU 캐시 크기
+        document_cache_size: 문서별 토큰 LRU 캐시 크기 (0이면 캐시하지 않음)
+        factory: 워커 프로세스에서 같은 파이프라인을 만드는 피클 가능한 함수 (None이면 프로세스 풀 미사용)
+    """
+    def __init__(self, tokenize: Callable[[str], List[str]], lemmatize: Optional[Callable[[str], str]] = None,
+                 stop_words: Iterable[str] = (), lemma_cache_size: int = 100_000,
+                 document_cache_size: int = 10_000,
+                 factory: Optional[Callable[[], "TokenPipeline"]] = None) -> None:
+        self.tokenize = tokenize
+        self.stop_words = frozenset(stop_words)
+        self.lemma = lru_cache(maxsize=lemma_cache_size)(lemmatize) if lemmatize else None
+        self.document_cache_size = document_cache_size
+        self.factory = factory
+        self._documents: "OrderedDict[bytes, Tokens]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"document_hits": 0, "document_misses": 0}
+
+    def process(self, text: str) -> Tokens:
+        """문서 하나를 캐시 없이 처리"""
+        stop_words = self.stop_words
+        tokens = [token for token in self.tokenize(text.lower()) if token.isalnum() and token not in stop_words]
+        return tuple(map(self.lemma, tokens)) if self.lemma is not None else tuple(tokens)
+
+    def _cached(self, key: bytes) -> Optional[Tokens]:
+        with self._lock:
+            tokens = self._documents.get(key)
+            if tokens is not None:
+                self._documents.move_to_end(key)
+            return tokens
+
+    def _store(self, key: bytes, tokens: Tokens) -> None:
+        if not self.document_cache_size:
+            return
+        with self._lock:
+            self._documents[key] = tokens
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.document_cache_size:
+                self._documents.popitem(last=False)
+
+    def tokens(self, text: str) -> Tokens:
+        """문서 하나의 토큰 (문서 캐시 경유)"""
+        return self.tokenize_batch([text])[0]
+
+    def tokenize_batch(self, texts: List[str], workers: int = 0, min_parallel: int = 5000,
+                       chunk_size: int = 1000) -> List[Tokens]:
+        """
+        문서 목록의 토큰 (입력 순서 유지)
+
+        캐시에 없는 고유 문서가 min_parallel개 이상이고 workers가 2 이상이면
+        chunk_size개씩 프로세스 풀에서 처리합니다.
+        """
+        keys = [content_key(text) for text in texts]
+        results: Dict[bytes, Tokens] = {}
+        missing: Dict[bytes, str] = {}
+        for key, text in zip(keys, texts):
+            if key in results or key in missing:
+                continue
+            cached = self._cached(key)
+            if cached is not None:
+                results[key] = cached
+            else:
+                missing[key] = text
+
+        with self._lock:
+            self._stats["document_hits"] += len(results)
+            self._stats["document_misses"] += len(missing)
+
+        if missing:
+            pending = list(missing.items())
+            if workers > 1 and self.factory is not None and len(pending) >= min_parallel:
+                processed = self._process_parallel([text for _, text in pending], workers, chunk_size)
+            else:
+                processed = [self.process(text) for _, text in pending]
+            for (key, _), tokens in zip(pending, processed):
+                results[key] = tokens
+                self._store(key, tokens)
+
+        return [results[key] for key in keys]
+
+    def _process_parallel(self, texts: List[str], workers: int, chunk_size: int) -> List[Tokens]:
+        chunks = [texts[start:start + chunk_size] for start in range(0, len(texts), max(1, chunk_size))]
+        logger.info(f"Tokenizing {len(texts)} documents in {len(chunks)} chunks on {workers} processes")
+        # 스레드가 있는 프로세스에서 fork하면 잠금 상태가 복제되므로 spawn 사용
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.factory,)
+        ) as executor:
+            return [tokens for chunk in executor.map(_tokenize_chunk, chunks) for tokens in chunk]
+
+    def count(self, texts: List[str], **batch_options) -> Counter:
+        """문서 목록 전체의 토큰 빈도"""
+        counter: Counter = Counter()
+        for tokens in self.tokenize_batch(texts, **batch_options):
+            counter.update(tokens)
+        return counter
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["documents_cached"] = len(self._documents)
+        if self.lemma is not None:
+            info = self.lemma.cache_info()
+            stats.update({"lemma_hits": info.hits, "lemma_misses": info.misses, "lemmas_cached": info.currsize})
+        return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._documents.clear()
+        if self.lemma is not None:
+            self.lemma.cache_clear()
@@ -1,9 +1,10 @@
 # analysis/trend_analysis.py
 import logging
-from typing import List, Dict, Any
-from datetime import datetime
+from collections import Counter
+from typing import List, Dict, Any, Iterable
 import numpy as np
-from sklearn.linear_model import LinearRegression
+from analysis import regex_tokenizer
+from data.models import Paper, Patent, Investment, as_records, to_float
 
 class TrendAnalyzer:
     def __init__(self):
@@ -13,9 +14,10 @@ class TrendAnalyzer:
         """기술 트렌드 분석"""
         try:
             # 각 데이터 소스별 트렌드 분석
-            paper_trends = self._analyze_paper_trends(data.get("papers", []))
-            patent_trends = self._analyze_patent_trends(data.get("patents", []))
-            investment_trends = self._analyze_investment_trends(data.get("investments", []))
+            # 정규화되지 않은 사전 목록이 들어와도 한 번만 변환
+            paper_trends = self._analyze_paper_trends(as_records(data.get("papers"), Paper))
+            patent_trends = self._analyze_patent_trends(as_records(data.get("patents"), Patent))
+            investment_trends = self._analyze_investment_trends(as_records(data.get("investments"), Investment))
 
             # 통합 트렌드 분석
             return {
@@ -78,16 +80,15 @@ class TrendAnalyzer:
             self.logger.error(f"Error in investment trend analysis: {e}")
             return {}
 
-    def _create_timeline(self, items: List[Dict[str, Any]], date_field: str) -> Dict[str, Any]:
-        """시간별 트렌드 타임라인 생성"""
+    def _create_timeline(self, items: List[Any], date_field: str) -> Dict[str, Any]:
+        """시간별 트렌드 타임라인 생성 (레코드의 날짜는 수집 시점에 파싱됨)"""
         try:
             timeline = {}
             for item in items:
-                date = datetime.strptime(item[date_field], "%Y-%m-%d")
-                year = date.year
-                if year not in timeline:
-                    timeline[year] = 0
-                timeline[year] += 1
+                date = getattr(item, date_field)
+                if date is None:
+                    continue
+                timeline[date.year] = timeline.get(date.year, 0) + 1
 
             # 성장률 계산
             years = sorted(timeline.keys())
@@ -133,4 +134,102 @@ class TrendAnalyzer:
                                 investment_growth: float) -> float:
         """전체 성장률 계산"""
         weights = [0.3, 0.3, 0.4]  # 논문, 특허, 투자 가중치
-        return np.average([paper_growth, patent_growth, investment_growth], weights=weights)
\ No newline at end of file
+        return np.average([paper_growth, patent_growth, investment_growth], weights=weights)
+
+    def _analyze_citations(self, papers: List[Paper]) -> Dict[str, Any]:
+        """인용 수 분포와 가장 많이 인용된 논문"""
+        cited = [paper for paper in papers if paper.citations is not None]
+        if not cited:
+            return {"total_citations": 0, "average_citations": 0.0, "median_citations": 0.0, "top_cited": []}
+        citations = np.array([paper.citations for paper in cited])
+        top = sorted(cited, key=lambda paper: paper.citations, reverse=True)[:5]
+        return {
+            "total_citations": int(citations.sum()),
+            "average_citations": float(citations.mean()),
+            "median_citations": float(np.median(citations)),
+            "top_cited": [{"title": paper.title, "citations": paper.citations} for paper in top]
+        }
+
+    def _top_terms(self, texts: Iterable[str], top_n: int = 10) -> List[Dict[str, Any]]:
+        """텍스트에 자주 등장하는 용어 (정규식 토크나이저, 불용어 제외)"""
+        counts: Counter = Counter()
+        for text in texts:
+            counts.update(
+                regex_tokenizer.lemmatize(token) for token in regex_tokenizer.tokenize(text.lower())
+                if len(token) > 2 and token not in regex_tokenizer.STOPWORDS
+            )
+        return [{"term": term, "count": count} for term, count in counts.most_common(top_n)]
+
+    def _identify_research_areas(self, papers: List[Paper]) -> List[Dict[str, Any]]:
+        """논문 제목과 주요 발견에 자주 등장하는 연구 주제어"""
+        return self._top_terms(" ".join([paper.title, *paper.key_findings]) for paper in papers)
+
+    def _categorize_patents(self, patents: List[Patent]) -> List[Dict[str, Any]]:
+        """특허 제목과 핵심 혁신에 자주 등장하는 기술 분야어"""
+        return self._top_terms(" ".join([patent.title, *patent.key_innovations]) for patent in patents)
+
+    def _identify_top_inventors(self, patents: List[Patent]) -> List[Dict[str, Any]]:
+        """특허 출원 건수 기준 상위 발명자"""
+        counts = Counter(inventor for patent in patents for inventor in patent.inventors)
+        return [{"inventor": name, "patents": count} for name, count in counts.most_common(10)]
+
+    def _analyze_funding_distribution(self, investments: List[Investment]) -> Dict[str, Any]:
+        """투자 금액 분포 (금액 단위는 응답 표기 그대로, 숫자를 읽을 수 없는 건은 제외)"""
+        amounts = np.array([
+            amount for amount in (to_float(investment.funding_amount) for investment in investments)
+            if amount is not None
+        ])
+        if amounts.size == 0:
+            return {"rounds_with_amount": 0}
+        return {
+            "rounds_with_amount": int(amounts.size),
+            "total": float(amounts.sum()),
+            "average": float(amounts.mean()),
+            "median": float(np.median(amounts)),
+            "max": float(amounts.max())
+        }
+
+    def _analyze_investor_patterns(self, investments: List[Investment]) -> Dict[str, Any]:
+        """투자자별 참여 건수와 반복 투자자"""
+        counts = Counter(investor for investment in investments for investor in investment.investors)
+        return {
+            "top_investors": [{"investor": name, "deals": count} for name, count in counts.most_common(10)],
+            "repeat_investors": sum(1 for count in counts.values() if count > 1),
+            "average_investors_per_round": (
+                sum(len(investment.investors) for investment in investments) / len(investments)
+                if investments else 0.0
+            )
+        }
+
+    @staticmethod
+    def _activity_counts(paper_trends: Dict[str, Any], patent_trends: Dict[str, Any],
+                         investment_trends: Dict[str, Any]) -> Dict[str, int]:
+        """타임라인에 집계된 논문/특허/투자 건수"""
+        def total(trends: Dict[str, Any], key: str) -> int:
+            return sum(trends.get(key, {}).get("yearly_counts", {}).values())
+        return {
+            "papers": total(paper_trends, "publication_timeline"),
+            "patents": total(patent_trends, "patent_timeline"),
+            "investments": total(investment_trends, "investment_timeline")
+        }
+
+    def _assess_technology_maturity(self, paper_trends: Dict[str, Any],
+                                    patent_trends: Dict[str, Any],
+                                    investment_trends: Dict[str, Any]) -> Dict[str, Any]:
+        """연구 대비 상용화 활동(특허+투자) 비율로 성숙도 판단"""
+        counts = self._activity_counts(paper_trends, patent_trends, investment_trends)
+        ratio = (counts["patents"] + counts["investments"]) / max(1, counts["papers"])
+        stage = "emerging" if ratio < 0.5 else "growing" if ratio < 1.5 else "mature"
+        return {"stage": stage, "commercialization_ratio": ratio, "activity": counts}
+
+    def _assess_market_readiness(self, paper_trends: Dict[str, Any],
+                                 patent_trends: Dict[str, Any],
+                                 investment_trends: Dict[str, Any]) -> Dict[str, Any]:
+        """전체 활동 중 투자 비중과 투자 성장률로 시장 준비도 판단"""
+        counts = self._activity_counts(paper_trends, patent_trends, investment_trends)
+        total = sum(counts.values())
+        investment_share = counts["investments"] / total if total else 0.0
+        investment_growth = investment_trends.get("investment_timeline", {}).get("growth_rate", 0)
+        score = min(1.0, investment_share * 2) * (1.0 if investment_growth >= 0 else 0.5)
+        level = "high" if score >= 0.6 else "medium" if score >= 0.3 else "low"
+        return {"score": round(score, 3), "level": level, "investment_share": investment_share}
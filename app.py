@@ -1,8 +1,11 @@
 # app.py
 import os
+import argparse
 import logging
+import threading
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from dotenv import load_dotenv
 
 from agents.research_agent import ResearchAgent
@@ -10,6 +13,13 @@ from agents.summary_agent import SummaryAgent
 from agents.prediction_agent import PredictionAgent
 from agents.risk_agent import RiskAnalysisAgent
 from agents.report_agent import ReportAgent
+from pipeline import Stage, PipelineGraph, StageScheduler, BatchRunner, CheckpointStore, load_topics
+from data.research_digest import build_research_digest
+from data.models import normalize_research_data
+from utils.llm import get_llm_cache, get_token_ledger, get_rate_limiter, get_circuit_breaker
+from utils.retry import retry_budget, caused_by
+from utils.exceptions import CircuitOpenError
+from config import config, ensure_environment
 
 # .env 파일 로드
 load_dotenv()
@@ -28,49 +38,332 @@ class TrendAnalysisPipeline:
         self.prediction_agent = PredictionAgent()
         self.risk_agent = RiskAnalysisAgent()
         self.report_agent = ReportAgent()
+        self.auto_open_report = config.app.auto_open_report
+        self.graph = self._build_graph()
+        self.scheduler = StageScheduler(self.graph, max_workers=config.pipeline.max_workers)
+        self.checkpoints = (
+            CheckpointStore(config.paths.checkpoints_dir, max_runs=config.pipeline.checkpoint_max_runs)
+            if config.pipeline.checkpoints else None
+        )
+        # 백그라운드 렌더링 중인 Future (출력 경로 -> Future, run이 스테이지 완료 시 이어받음)
+        self._pending_renders: Dict[str, Future] = {}
+        self._render_lock = threading.Lock()
+
+    def _build_graph(self) -> PipelineGraph:
+        """스테이지 의존성 그래프 구성 (입출력 키로 선후 관계 결정)"""
+        return PipelineGraph([
+            # 1. 연구 데이터 수집 및 분석
+            Stage(
+                name="research",
+                func=self._run_research,
+                inputs=("topic",),
+                outputs=("research_data", "quality_metrics", "timestamp")
+            ),
+            # 2. 연구 데이터 요약본 (에이전트 프롬프트용, 한 번만 생성)
+            Stage(
+                name="compact",
+                func=self._run_compact,
+                inputs=("research_data",),
+                outputs=("research_digest",)
+            ),
+            # 3. 핵심 기술 요약
+            Stage(
+                name="summary",
+                func=self.summary_agent,
+                inputs=("topic", "research_data", "research_digest", "timestamp"),
+                outputs=("tech_summary", "summary_timestamp")
+            ),
+            # 4. 트렌드 예측
+            Stage(
+                name="prediction",
+                func=self.prediction_agent,
+                inputs=("research_data", "research_digest", "tech_summary", "timestamp"),
+                outputs=("trend_prediction", "prediction_timestamp")
+            ),
+            # 5. 리스크 분석
+            Stage(
+                name="risk",
+                func=self.risk_agent,
+                inputs=("research_data", "research_digest", "trend_prediction", "timestamp"),
+                outputs=("risk_analysis", "risk_timestamp")
+            ),
+            # 6. 최종 보고서 작성 (마크다운)
+            Stage(
+                name="report",
+                func=self._run_report,
+                inputs=("topic", "timestamp", "research_data", "quality_metrics",
+                        "tech_summary", "trend_prediction", "risk_analysis"),
+                outputs=("final_report", "references", "report_timestamp", "report_md_path"),
+                max_attempts=3
+            ),
+            # 7. PDF / HTML 렌더링 (서로 독립적이므로 동시 실행)
+            Stage(
+                name="render_pdf",
+                func=self._run_render_pdf,
+                inputs=("topic", "timestamp", "final_report"),
+                outputs=("report_pdf_path",)
+            ),
+            Stage(
+                name="render_html",
+                func=self._run_render_html,
+                inputs=("topic", "timestamp", "final_report"),
+                outputs=("report_html_path",)
+            )
+        ])
+
+    def _run_research(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        return self.research_agent(state["topic"])
+
+    def _run_compact(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        digest = build_research_digest(
+            state["research_data"],
+            max_tokens=config.token_budget.digest_tokens,
+            model=config.token_budget.encoding_model
+        )
+        logging.info(f"Research digest: {digest['tokens']} tokens from {digest['counts']}")
+        return {"research_digest": digest}
+
+    def _run_report(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        state = self.report_agent.compose(state)
+        state["report_md_path"] = self.report_agent.save_markdown(state)
+        return state
+
+    def _run_render_pdf(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        if config.render.background:
+            return {"report_pdf_path": self._render_in_background(state, "pdf")}
+        return {"report_pdf_path": self.report_agent.render_pdf(state)}
+
+    def _run_render_html(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        if config.render.background:
+            return {"report_html_path": self._render_in_background(state, "html")}
+        html_path = self.report_agent.render_html(state)
+        if self.auto_open_report and html_path:
+            self.report_agent._open_in_browser(html_path)
+        return {"report_html_path": html_path}
+
+    def _render_in_background(self, state: Dict[str, Any], kind: str) -> str:
+        """렌더링을 풀에 제출하고 완료를 기다리지 않고 출력 경로 반환"""
+        submit = self.report_agent.render_pdf_async if kind == "pdf" else self.report_agent.render_html_async
+        future = submit(state)
+        if kind == "html" and self.auto_open_report:
+            def open_report(done: Future) -> None:
+                if not done.cancelled() and done.exception() is None:
+                    self.report_agent._open_in_browser(done.result())
+            future.add_done_callback(open_report)
+
+        path = self.report_agent._report_path(state, kind)
+        with self._render_lock:
+            self._pending_renders[path] = future
+        return path
+
+    def _take_render_future(self, outputs: Dict[str, Any]) -> Optional[Future]:
+        """스테이지 출력 경로로 제출된 백그라운드 렌더링 Future (없으면 None)"""
+        with self._render_lock:
+            for path in outputs.values():
+                if isinstance(path, str) and path in self._pending_renders:
+                    return self._pending_renders.pop(path)
+        return None
         
-    def run(self, topic: str) -> Dict[str, Any]:
-        """전체 분석 파이프라인 실행"""
+    def run(self, topic: str, run_id: Optional[str] = None, resume: bool = False,
+            from_stage: Optional[str] = None,
+            progress: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
+        """
+        전체 분석 파이프라인 실행
+
+        Args:
+            topic: 분석 주제
+            run_id: 재개할 실행 ID (없으면 resume/from_stage 시 주제의 최근 실행)
+            resume: 체크포인트가 있는 스테이지는 건너뛰고 이어서 실행
+            from_stage: 지정한 스테이지와 그 이후 스테이지만 다시 실행
+            progress: 스테이지 상태 변경 시 (스테이지명, "running"/"completed"/"skipped")로 호출
+        """
         try:
             logging.info(f"Starting analysis pipeline for topic: {topic}")
             
-            # 1. 연구 데이터 수집 및 분석
-            logging.info("Step 1: Collecting research data...")
-            research_state = self.research_agent(topic)
+            completed, run_id = self._restore_checkpoints(topic, run_id, resume, from_stage)
+            if progress:
+                for stage in completed:
+                    progress(stage, "skipped")
             
-            # 2. 핵심 기술 요약
-            logging.info("Step 2: Generating technology summary...")
-            summary_state = self.summary_agent(research_state)
+            def finish_stage(stage: str, outputs: Dict[str, Any]) -> None:
+                if self.checkpoints:
+                    try:
+                        self.checkpoints.save_stage(topic, run_id, stage, outputs)
+                    except Exception as e:
+                        logging.warning(f"Failed to save checkpoint for stage '{stage}': {e}")
+                if progress:
+                    progress(stage, "completed")
             
-            # 3. 트렌드 예측
-            logging.info("Step 3: Predicting future trends...")
-            prediction_state = self.prediction_agent(summary_state)
+            render_futures: Dict[str, Future] = {}
             
-            # 4. 리스크 분석
-            logging.info("Step 4: Analyzing risks and responses...")
-            risk_state = self.risk_agent(prediction_state)
+            def on_stage_complete(stage: str, outputs: Dict[str, Any]) -> None:
+                future = self._take_render_future(outputs)
+                if future is None:
+                    finish_stage(stage, outputs)
+                    return
+                # 백그라운드 렌더링은 파일이 실제로 생성된 뒤에 완료로 기록 (재개 시 실패한 렌더링은 다시 실행)
+                render_futures[stage.replace("render_", "")] = future
+                
+                def on_render_done(done: Future) -> None:
+                    if not done.cancelled() and done.exception() is None:
+                        finish_stage(stage, outputs)
+                    elif progress:
+                        progress(stage, "failed")
+                future.add_done_callback(on_render_done)
             
-            # 5. 최종 보고서 생성
-            logging.info("Step 5: Generating final comprehensive report...")
-            final_report = self.report_agent(risk_state)
+            # 모든 계층의 재시도가 실행 단위 예산을 공유하여 실패가 곱절로 늘지 않도록 함
+            with retry_budget(config.retry.run_budget) as budget:
+                final_report, run_report = self.scheduler.run(
+                    {"topic": topic},
+                    completed=completed,
+                    on_stage_complete=on_stage_complete,
+                    on_stage_start=(lambda stage: progress(stage, "running")) if progress else None
+                )
+            final_report["run_id"] = run_id
+            if render_futures:
+                final_report["render_futures"] = render_futures
+            final_report["pipeline_timing"] = run_report.to_dict()
             
+            logging.info(f"Pipeline timing: {run_report.summary()}")
+            logging.info(f"LLM cache: {get_llm_cache().stats()}")
+            logging.info(f"Prompt tokens: {get_token_ledger().summary()}")
+            logging.info(f"LLM rate limiter: {get_rate_limiter().stats()}")
+            logging.info(f"LLM circuit: {get_circuit_breaker().stats()}")
+            logging.info(f"Retries used: {budget.used}/{budget.limit}")
             logging.info(f"Analysis pipeline completed successfully. Report saved to: {final_report.get('report_pdf_path', 'Unknown')}")
             
             return final_report
             
         except Exception as e:
             logging.error(f"Error in analysis pipeline: {e}")
+            if caused_by(e, CircuitOpenError):
+                stale_report = self._serve_stale(topic, e)
+                if stale_report is not None:
+                    return stale_report
             raise
 
-def main():
+    def _serve_stale(self, topic: str, error: Exception) -> Optional[Dict[str, Any]]:
+        """
+        LLM 회로가 열려 실패한 경우 주제의 가장 최근 완료 보고서를 stale로 표시하여 반환
+
+        Returns:
+            보고서 스테이지까지 완료된 이전 실행의 스테이지 출력을 합친 상태 (없으면 None)
+        """
+        if not config.circuit_breaker.serve_stale or self.checkpoints is None:
+            return None
+        run_id = self.checkpoints.latest_run_with_stage(topic, "report")
+        if run_id is None:
+            logging.warning(f"No previous report to serve for topic '{topic}'")
+            return None
+
+        completed = self.checkpoints.load_run(topic, run_id)
+        state: Dict[str, Any] = {"topic": topic}
+        for stage in self.graph.order:
+            state.update(completed.get(stage, {}))
+        if isinstance(state.get("research_data"), dict):
+            normalize_research_data(state["research_data"])
+        state.update({
+            "run_id": run_id,
+            "stale": True,
+            "stale_reason": str(error)
+        })
+        logging.warning(
+            f"LLM circuit is open ({get_circuit_breaker().stats()['state']}); "
+            f"serving stale report from run {run_id} for topic '{topic}'"
+        )
+        return state
+
+    def _restore_checkpoints(self, topic: str, run_id: Optional[str], resume: bool,
+                             from_stage: Optional[str]) -> Tuple[Dict[str, Dict[str, Any]], str]:
+        """재개할 실행 ID와 재사용할 스테이지 출력 결정"""
+        if not (resume or from_stage):
+            return {}, run_id or CheckpointStore.new_run_id()
+        
+        if self.checkpoints is None:
+            raise ValueError("Checkpoints are disabled (config.pipeline.checkpoints)")
+        
+        run_id = run_id or self.checkpoints.latest_run_id(topic)
+        if run_id is None:
+            logging.warning(f"No checkpoints found for topic '{topic}', starting a new run")
+            return {}, CheckpointStore.new_run_id()
+        
+        completed = self.checkpoints.load_run(topic, run_id)
+        research_outputs = completed.get("research", {})
+        if isinstance(research_outputs.get("research_data"), dict):
+            # JSON으로 복원된 항목을 수집 시점과 같은 레코드 모델로 변환
+            normalize_research_data(research_outputs["research_data"])
+        if from_stage:
+            for stage in {from_stage} | self.graph.descendants(from_stage):
+                completed.pop(stage, None)
+        
+        logging.info(f"Resuming run {run_id} with completed stages: {sorted(completed)}")
+        return completed, run_id
+
+DEFAULT_TOPIC = "인공지능 기반 자율 에이전트 기술"
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="기술 트렌드 분석 보고서 생성")
+    parser.add_argument("topics", nargs="*", help="분석할 주제 (여러 개 지정 시 배치 실행)")
+    parser.add_argument("--topics-file", help="주제 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--max-concurrency", type=int, default=config.pipeline.batch_concurrency,
+                        help="배치 모드에서 동시에 처리할 주제 수")
+    parser.add_argument("--resume", action="store_true",
+                        help="마지막 완료 스테이지부터 이어서 실행")
+    parser.add_argument("--run-id", help="재개할 실행 ID (기본값: 주제의 가장 최근 실행)")
+    parser.add_argument("--from-stage",
+                        choices=["research", "compact", "summary", "prediction", "risk", "report", "render_pdf", "render_html"],
+                        help="지정한 스테이지부터 이후 스테이지만 다시 실행")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="LLM 응답 캐시와 유사 주제 캐시를 사용하지 않음")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="모듈별 임포트 비용 보고서를 출력하고 종료")
+    return parser.parse_args(argv)
+
+def run_batch(pipeline: TrendAnalysisPipeline, topics: List[str], max_concurrency: int,
+              resume: bool = False, from_stage: Optional[str] = None) -> int:
+    """배치 실행 후 실패한 주제 수 반환 (resume/from_stage는 주제별 가장 최근 실행에 적용)"""
+    pipeline.auto_open_report = False  # 배치 모드에서는 브라우저 자동 열기 비활성화
+    runner = BatchRunner(pipeline, max_concurrency=max_concurrency, resume=resume, from_stage=from_stage)
+    results = runner.run(topics)
+    print(f"\n{BatchRunner.format_summary(results)}")
+    return sum(1 for result in results if not result.success)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    
+    if args.profile_startup:
+        from utils.startup_profile import profile_startup
+        print(profile_startup("app"))
+        return
+    
     # 분석할 주제 설정
-    topic = "인공지능 기반 자율 에이전트 기술"
+    topics = list(args.topics)
+    if args.topics_file:
+        topics.extend(load_topics(args.topics_file))
+    if not topics:
+        topics = [DEFAULT_TOPIC]
+    if len(topics) > 1 and args.run_id:
+        # 실행 ID는 주제별로 다르므로 배치에서는 각 주제의 가장 최근 실행을 사용
+        raise SystemExit("--run-id cannot be combined with multiple topics; use --resume to continue each topic's latest run")
     
-    # 파이프라인 실행
+    ensure_environment()
+    
+    # 파이프라인 실행 (에이전트는 모든 주제가 공유)
     pipeline = TrendAnalysisPipeline()
+    if args.no_cache:
+        get_llm_cache().enabled = False
+        pipeline.research_agent.data_collector.research_cache.enabled = False
+    
+    if len(topics) > 1:
+        failures = run_batch(pipeline, topics, args.max_concurrency, resume=args.resume, from_stage=args.from_stage)
+        if failures:
+            raise SystemExit(1)
+        return
+    
+    topic = topics[0]
     
     try:
-        result = pipeline.run(topic)
+        result = pipeline.run(topic, run_id=args.run_id, resume=args.resume, from_stage=args.from_stage)
         logging.info(f"Analysis completed successfully. Generated report: {result.get('report_pdf_path')}")
         
         # 보고서 경로 출력
@@ -0,0 +1,25 @@
+"""
+오프라인 성능 벤치마크
+
+    python -m benchmarks run --sizes 100 1000 10000 --output benchmarks/results/head.json
+    python -m benchmarks compare benchmarks/results/base.json benchmarks/results/head.json
+"""
+from benchmarks.runner import (
+    BenchmarkCase,
+    BenchmarkResult,
+    measure,
+    run_benchmarks,
+    save_results,
+    load_results,
+    compare_results
+)
+
+__all__ = [
+    'BenchmarkCase',
+    'BenchmarkResult',
+    'measure',
+    'run_benchmarks',
+    'save_results',
+    'load_results',
+    'compare_results'
+]
@@ -0,0 +1,76 @@
+"""
+벤치마크 CLI
+
+    python -m benchmarks list
+    python -m benchmarks run [--cases text network] [--sizes 100 1000] [--output PATH]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.1]
+"""
+import sys
+import argparse
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.runner import (
+    DEFAULT_SIZES,
+    run_benchmarks,
+    save_results,
+    load_results,
+    compare_results,
+    format_result,
+    format_comparison
+)
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="오프라인 성능 벤치마크")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="벤치마크 케이스 목록")
+
+    run_parser = subparsers.add_parser("run", help="벤치마크 실행")
+    run_parser.add_argument("--cases", nargs="*", default=[], help="실행할 케이스 이름 (접두사 허용)")
+    run_parser.add_argument("--sizes", nargs="*", type=int, default=DEFAULT_SIZES, help="입력 레코드 수")
+    run_parser.add_argument("--repeats", type=int, default=3, help="크기별 반복 측정 횟수")
+    run_parser.add_argument("--output", type=Path, default=None,
+                            help="결과 JSON 경로 (기본: benchmarks/results/<revision>_<시각>.json)")
+
+    compare_parser = subparsers.add_parser("compare", help="두 결과 비교")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=0.10,
+                                help="회귀로 판단할 증가 비율 (기본 0.10)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+
+    if args.command == "list":
+        from benchmarks.cases import CASES
+        for case in CASES.values():
+            print(f"{case.name:<28} max {case.max_size:>9}  {case.description}")
+        return 0
+
+    if args.command == "run":
+        from benchmarks.cases import select_cases
+        document = run_benchmarks(
+            select_cases(args.cases),
+            sorted(args.sizes),
+            repeats=args.repeats,
+            on_result=lambda result: print(format_result(result), flush=True)
+        )
+        output = args.output or RESULTS_DIR / (
+            f"{document['revision'] or 'local'}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        )
+        print(f"Results saved to {save_results(document, output)}")
+        return 0
+
+    rows = compare_results(load_results(args.baseline), load_results(args.current), args.threshold)
+    print(format_comparison(rows))
+    return 1 if any(row["regression"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""
+핫 패스 벤치마크 케이스
+크기는 전체 레코드 수(연구 데이터는 네 카테고리에 균등 분배)이며,
+대상 모듈은 케이스 준비 시점에 임포트해 필요한 의존성만 로드합니다.
+"""
+import logging
+import tempfile
+from functools import partial
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Dict, Any, List, Callable
+
+from benchmarks.generators import (
+    generate_research_data,
+    generate_texts,
+    generate_llm_response,
+    generate_malformed_response,
+    generate_report_markdown
+)
+from benchmarks.runner import BenchmarkCase, is_empty
+
+
+def _per_category(size: int) -> int:
+    return max(1, size // 4)
+
+
+def _text_keywords(size: int, tokenizer: str = "nltk") -> Callable[[], Any]:
+    from analysis.text_analysis import TextAnalyzer
+    analyzer = TextAnalyzer(tokenizer)
+    texts = generate_texts(size)
+
+    def run() -> Any:
+        # 반복 측정이 토큰 캐시 적중만 재지 않도록 매번 빈 캐시에서 시작
+        analyzer.pipeline.clear()
+        return analyzer.extract_keywords(texts, top_n=20)
+    return run
+
+
+def _network_collaboration(size: int) -> Callable[[], Any]:
+    from analysis.network_analysis import NetworkAnalyzer
+    analyzer = NetworkAnalyzer()
+    data = generate_research_data(_per_category(size))
+    return lambda: analyzer.analyze_collaboration_network(data)
+
+
+def _trend_analysis(size: int) -> Callable[[], Any]:
+    from analysis.trend_analysis import TrendAnalyzer
+    analyzer = TrendAnalyzer()
+    data = generate_research_data(_per_category(size))
+    return lambda: analyzer.analyze_technology_trends(data)
+
+
+def _has_sections(*keys: str) -> Callable[[Any], bool]:
+    """분석 결과의 지정한 항목이 모두 비어 있지 않은지 (하위 단계가 오류를 삼킨 경우 측정 제외)"""
+    return lambda output: isinstance(output, dict) and not any(is_empty(output.get(key)) for key in keys)
+
+
+def _json_extract(size: int) -> Callable[[], Any]:
+    from data.data_collector import DataCollector
+    # LLM 클라이언트 없이 추출 메서드만 호출
+    collector = SimpleNamespace(logger=logging.getLogger("benchmarks.json_extract"))
+    text = generate_llm_response(_per_category(size))
+    return lambda: DataCollector._extract_json_improved(collector, text)
+
+
+def _json_extract_malformed(size: int) -> Callable[[], Any]:
+    from utils.json_extract import extract_json
+    text = generate_malformed_response(size)
+    return lambda: extract_json(text)
+
+
+def _store_roundtrip(size: int) -> Callable[[], Any]:
+    from data.models import normalize_research_data
+    from data.research_store import ResearchStore
+    store = ResearchStore(Path(tempfile.mkdtemp(prefix="bench_store_")), max_runs=1)
+    data = normalize_research_data(generate_research_data(_per_category(size)))
+
+    def run() -> Any:
+        entry = store.save(data, data["query"], "20250101_000000")
+        return store.load(entry["id"])
+    return run
+
+
+def _pdf_render(size: int) -> Callable[[], Any]:
+    from utils.pdf_generator import PDFGenerator
+    generator = PDFGenerator()
+    markdown_content = generate_report_markdown(size)
+    output_dir = Path(tempfile.mkdtemp(prefix="bench_pdf_"))
+    metadata = {"title": "Benchmark Report", "date": "2025-01-01"}
+    return lambda: generator.generate_pdf(markdown_content, str(output_dir / "report.pdf"), metadata)
+
+
+CASES: Dict[str, BenchmarkCase] = {
+    case.name: case for case in [
+        BenchmarkCase("text.extract_keywords", _text_keywords, max_size=100_000,
+                      description="TextAnalyzer.extract_keywords over N documents"),
+        BenchmarkCase("text.extract_keywords_regex", partial(_text_keywords, tokenizer="regex"), max_size=1_000_000,
+                      description="TextAnalyzer.extract_keywords over N documents with the regex tokenizer"),
+        # 매개 중심성은 O(V·E)이므로 1만 레코드 이상은 제외
+        BenchmarkCase("network.collaboration", _network_collaboration, max_size=10_000,
+                      description="NetworkAnalyzer.analyze_collaboration_network over N records",
+                      check=_has_sections("author_network", "inventor_network", "company_network",
+                                          "integrated_analysis")),
+        BenchmarkCase("trend.technology_trends", _trend_analysis, max_size=1_000_000,
+                      description="TrendAnalyzer.analyze_technology_trends over N records",
+                      check=_has_sections("research_trends", "innovation_trends", "market_trends",
+                                          "integrated_analysis")),
+        BenchmarkCase("collector.extract_json", _json_extract, max_size=100_000,
+                      description="DataCollector._extract_json_improved on an N-record LLM response"),
+        BenchmarkCase("json_extract.malformed", _json_extract_malformed, max_size=1_000_000,
+                      description="extract_json worst case: N fragments of unbalanced brackets and stray quotes"),
+        BenchmarkCase("store.roundtrip", _store_roundtrip, max_size=1_000_000,
+                      description="ResearchStore save + load of N records"),
+        # PDF 크기는 보고서 섹션 수
+        BenchmarkCase("render.pdf", _pdf_render, max_size=1_000,
+                      description="PDFGenerator.generate_pdf for an N-section report")
+    ]
+}
+
+
+def select_cases(names: List[str]) -> List[BenchmarkCase]:
+    """이름(접두사 허용)으로 케이스 선택"""
+    if not names:
+        return list(CASES.values())
+    selected = [case for case in CASES.values() if any(case.name.startswith(name) for name in names)]
+    if not selected:
+        raise ValueError(f"Unknown benchmark cases: {names}. Available: {sorted(CASES)}")
+    return selected
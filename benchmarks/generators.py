@@ -0,0 +1,184 @@
+"""
+벤치마크용 합성 데이터 생성기
+DataCollector가 수집하는 것과 같은 스키마의 논문/특허/뉴스/투자 레코드를
+시드 기반으로 재현 가능하게 생성합니다. 네트워크 접근은 필요하지 않습니다.
+"""
+import json
+import random
+from datetime import date, timedelta
+from typing import Dict, Any, List
+
+_TOPIC_WORDS = [
+    "agent", "autonomous", "multimodal", "transformer", "reinforcement", "learning",
+    "retrieval", "reasoning", "planning", "robotics", "language", "model", "vision",
+    "alignment", "inference", "distillation", "quantization", "federated", "privacy",
+    "benchmark", "evaluation", "memory", "tool", "orchestration", "embedding"
+]
+_FILLER_WORDS = [
+    "the", "of", "and", "for", "with", "a", "to", "in", "on", "improves", "shows",
+    "enables", "results", "approach", "system", "framework", "novel", "efficient"
+]
+_KOREAN_WORDS = ["자율", "에이전트", "기술", "시장", "투자", "연구", "특허", "인공지능", "모델", "분석"]
+_COMPANIES = [f"Company{i}" for i in range(200)]
+_INVESTORS = [f"Fund{i}" for i in range(80)]
+_SOURCES = ["TechCrunch", "Reuters", "Bloomberg", "전자신문", "ZDNet Korea"]
+
+
+def _sentence(rng: random.Random, length: int = 12) -> str:
+    words = [
+        rng.choice(_TOPIC_WORDS) if rng.random() < 0.4 else rng.choice(_FILLER_WORDS)
+        for _ in range(length)
+    ]
+    if rng.random() < 0.2:
+        words.append(rng.choice(_KOREAN_WORDS))
+    return " ".join(words).capitalize() + "."
+
+
+def _date(rng: random.Random, start_year: int = 2015, span_days: int = 3650) -> str:
+    return (date(start_year, 1, 1) + timedelta(days=rng.randrange(span_days))).isoformat()
+
+
+def _people(rng: random.Random, prefix: str, pool: int, low: int, high: int) -> List[str]:
+    return [f"{prefix}{rng.randrange(pool)}" for _ in range(rng.randint(low, high))]
+
+
+def generate_papers(n: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """논문 레코드 생성 (저자 풀은 레코드 수에 비례)"""
+    rng = random.Random(seed)
+    pool = max(10, n // 3)
+    return [
+        {
+            "title": _sentence(rng, 8),
+            "authors": _people(rng, "Author", pool, 1, 6),
+            "publication_date": _date(rng),
+            "key_findings": _sentence(rng, 24),
+            "impact_score": round(rng.uniform(0, 10), 2),
+            "citations": rng.randrange(0, 2000),
+            "methodology": _sentence(rng, 10),
+            "future_implications": _sentence(rng, 14)
+        }
+        for _ in range(n)
+    ]
+
+
+def generate_patents(n: int, seed: int = 1) -> List[Dict[str, Any]]:
+    """특허 레코드 생성"""
+    rng = random.Random(seed)
+    pool = max(10, n // 3)
+    return [
+        {
+            "title": _sentence(rng, 8),
+            "inventors": _people(rng, "Inventor", pool, 1, 5),
+            "filing_date": _date(rng),
+            "company": rng.choice(_COMPANIES),
+            "key_innovations": _sentence(rng, 18),
+            "potential_applications": _sentence(rng, 12)
+        }
+        for _ in range(n)
+    ]
+
+
+def generate_news(n: int, seed: int = 2) -> List[Dict[str, Any]]:
+    """뉴스 레코드 생성"""
+    rng = random.Random(seed)
+    return [
+        {
+            "title": _sentence(rng, 9),
+            "source": rng.choice(_SOURCES),
+            "date": _date(rng, 2022, 1000),
+            "key_points": [_sentence(rng, 10) for _ in range(rng.randint(1, 3))],
+            "market_impact": _sentence(rng, 12),
+            "companies_mentioned": rng.sample(_COMPANIES, rng.randint(0, 3))
+        }
+        for _ in range(n)
+    ]
+
+
+def generate_investments(n: int, seed: int = 3) -> List[Dict[str, Any]]:
+    """투자 레코드 생성"""
+    rng = random.Random(seed)
+    return [
+        {
+            "company": rng.choice(_COMPANIES),
+            "funding_amount": f"${rng.randint(1, 500)}M",
+            "date": _date(rng, 2018, 2500),
+            "investors": rng.sample(_INVESTORS, rng.randint(1, 4)),
+            "technology_focus": rng.choice(_TOPIC_WORDS),
+            "market_potential": _sentence(rng, 10)
+        }
+        for _ in range(n)
+    ]
+
+
+def generate_research_data(n: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    collect_research_data 결과와 같은 구조의 연구 데이터 생성
+
+    Args:
+        n: 카테고리별 레코드 수
+    """
+    return {
+        "query": "synthetic benchmark topic",
+        "papers": generate_papers(n, seed),
+        "patents": generate_patents(n, seed + 1),
+        "news": generate_news(n, seed + 2),
+        "investments": generate_investments(n, seed + 3),
+        "tech_categories": list(_TOPIC_WORDS[:8])
+    }
+
+
+def generate_texts(n: int, seed: int = 4) -> List[str]:
+    """키워드 추출용 문서 목록 생성"""
+    rng = random.Random(seed)
+    return [" ".join(_sentence(rng, 16) for _ in range(3)) for _ in range(n)]
+
+
+def generate_llm_response(n: int, seed: int = 5) -> str:
+    """
+    LLM 응답 형태의 텍스트 생성
+    설명 문장과 코드 블록으로 감싼 JSON이 섞인, JSON 추출기 입력용 문자열
+    """
+    rng = random.Random(seed)
+    payload = {
+        "papers": generate_papers(n, seed),
+        "news": generate_news(n, seed + 1),
+        "patents": generate_patents(n, seed + 2),
+        "investments": generate_investments(n, seed + 3)
+    }
+    preamble = " ".join(_sentence(rng) for _ in range(5))
+    return f"{preamble}\n\n```json\n{json.dumps(payload, ensure_ascii=False, indent=2)}\n```\n\n{_sentence(rng)}"
+
+
+def generate_malformed_response(n: int, seed: int = 7) -> str:
+    """
+    JSON 추출기 최악 조건 입력 생성
+    닫히지 않은 괄호, 짝이 맞지 않는 괄호, 설명 문장 속 따옴표가 섞인 약 n 레코드 분량의 텍스트 끝에
+    후행 쉼표가 있는 작은 JSON 객체가 하나 있어, 정규식 방식은 깊은 역추적을 일으킵니다.
+    """
+    rng = random.Random(seed)
+    noise = []
+    for _ in range(n):
+        choice = rng.random()
+        if choice < 0.4:
+            noise.append("{[" * rng.randint(1, 4))
+        elif choice < 0.7:
+            noise.append('{"key": [1, 2, "text\\"]" }] ')
+        else:
+            noise.append(_sentence(rng, 6) + ' "quoted ')
+    return "".join(noise) + '\n{"papers": [{"title": "last",},],}'
+
+
+def generate_report_markdown(n: int, seed: int = 6) -> str:
+    """PDF 렌더링용 마크다운 보고서 생성 (n개 섹션)"""
+    rng = random.Random(seed)
+    sections = ["# 합성 기술 트렌드 보고서", ""]
+    for index in range(n):
+        sections.append(f"## {index + 1}. {_sentence(rng, 5)}")
+        sections.append("")
+        sections.extend(_sentence(rng, 30) for _ in range(3))
+        sections.append("")
+        sections.append("| 항목 | 값 |")
+        sections.append("|---|---|")
+        sections.extend(f"| {rng.choice(_TOPIC_WORDS)} | {rng.randint(1, 100)} |" for _ in range(4))
+        sections.append("")
+    return "\n".join(sections)
@@ -0,0 +1,232 @@
+"""
+벤치마크 실행기
+등록된 케이스를 크기별로 실행해 실행 시간(반복 측정)과 최대 메모리(tracemalloc)를
+기록하고, 커밋 간 비교가 가능하도록 JSON으로 저장합니다.
+측정 전에 한 번 실행한 결과를 확인하여, 오류를 삼키고 빈 결과를 반환하는
+경로의 시간은 기록하지 않습니다.
+"""
+import gc
+import json
+import time
+import platform
+import statistics
+import subprocess
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable, Iterable
+
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    벤치마크 케이스
+
+    Args:
+        name: 케이스 이름
+        setup: 크기를 받아 측정 대상 함수(인자 없음)를 반환. 데이터 생성 시간은 측정에서 제외
+        max_size: 이보다 큰 크기는 건너뜀 (알고리즘 복잡도상 비현실적인 크기 제외)
+        check: 측정 대상의 반환값이 유효한지 확인 (기본값: 비어 있지 않은지)
+    """
+    name: str
+    setup: Callable[[int], Callable[[], Any]]
+    max_size: int = DEFAULT_SIZES[-1]
+    description: str = ""
+    check: Optional[Callable[[Any], bool]] = None
+
+
+@dataclass
+class BenchmarkResult:
+    """케이스/크기별 측정 결과"""
+    case: str
+    size: int
+    status: str = "ok"  # ok / skipped / error
+    repeats: int = 0
+    min_seconds: Optional[float] = None
+    median_seconds: Optional[float] = None
+    mean_seconds: Optional[float] = None
+    peak_memory_bytes: Optional[int] = None
+    error: Optional[str] = None
+    timings: List[float] = field(default_factory=list)
+
+
+def is_empty(value: Any) -> bool:
+    """None, 빈 컨테이너, 또는 모든 값이 비어 있는 사전 (하위 분석이 모두 실패한 결과)"""
+    if value is None:
+        return True
+    if isinstance(value, dict):
+        return all(is_empty(item) for item in value.values())
+    if isinstance(value, (list, tuple, set, str, bytes)):
+        return len(value) == 0
+    return False
+
+
+def measure(func: Callable[[], Any], repeats: int = 3, warmup: int = 1) -> Dict[str, Any]:
+    """
+    실행 시간과 최대 메모리 측정
+    tracemalloc은 실행을 느리게 하므로 시간 측정과 별도로 한 번 더 실행합니다.
+    """
+    for _ in range(warmup):
+        func()
+
+    timings = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "timings": timings,
+        "min_seconds": min(timings),
+        "median_seconds": statistics.median(timings),
+        "mean_seconds": statistics.fmean(timings),
+        "peak_memory_bytes": peak
+    }
+
+
+def run_case(case: BenchmarkCase, size: int, repeats: int = 3) -> BenchmarkResult:
+    """단일 케이스/크기 실행"""
+    result = BenchmarkResult(case=case.name, size=size)
+    if size > case.max_size:
+        result.status = "skipped"
+        return result
+
+    try:
+        func = case.setup(size)
+        # 첫 실행(워밍업 겸용)의 결과가 유효하지 않으면 측정하지 않음
+        output = func()
+        valid = case.check(output) if case.check is not None else not is_empty(output)
+        if not valid:
+            result.status = "error"
+            result.error = f"InvalidOutput: {type(output).__name__} result failed the case check"
+            return result
+        # 큰 입력은 반복 횟수를 줄여 전체 실행 시간 제한
+        case_repeats = repeats if size < 100_000 else 1
+        measured = measure(func, repeats=case_repeats, warmup=0)
+        result.repeats = case_repeats
+        result.timings = measured["timings"]
+        result.min_seconds = measured["min_seconds"]
+        result.median_seconds = measured["median_seconds"]
+        result.mean_seconds = measured["mean_seconds"]
+        result.peak_memory_bytes = measured["peak_memory_bytes"]
+    except Exception as e:
+        result.status = "error"
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_benchmarks(cases: Iterable[BenchmarkCase], sizes: Iterable[int], repeats: int = 3,
+                   on_result: Optional[Callable[[BenchmarkResult], None]] = None) -> Dict[str, Any]:
+    """모든 케이스를 크기별로 실행하고 결과 문서 반환"""
+    results = []
+    for case in cases:
+        for size in sizes:
+            result = run_case(case, size, repeats)
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results]
+    }
+
+
+def save_results(document: Dict[str, Any], path: Path) -> Path:
+    """결과 JSON 저장"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    두 결과 문서 비교
+
+    Args:
+        threshold: 중앙값 실행 시간 또는 최대 메모리가 이 비율 이상 늘면 회귀로 표시
+
+    Returns:
+        케이스/크기별 변화율 목록
+    """
+    base_index = {
+        (r["case"], r["size"]): r for r in baseline["results"] if r["status"] == "ok"
+    }
+    rows = []
+    for result in current["results"]:
+        base = base_index.get((result["case"], result["size"]))
+        if result["status"] != "ok" or base is None:
+            continue
+        time_change = result["median_seconds"] / base["median_seconds"] - 1 if base["median_seconds"] else 0.0
+        memory_change = (
+            result["peak_memory_bytes"] / base["peak_memory_bytes"] - 1
+            if base["peak_memory_bytes"] else 0.0
+        )
+        rows.append({
+            "case": result["case"],
+            "size": result["size"],
+            "baseline_seconds": base["median_seconds"],
+            "current_seconds": result["median_seconds"],
+            "time_change": time_change,
+            "baseline_memory": base["peak_memory_bytes"],
+            "current_memory": result["peak_memory_bytes"],
+            "memory_change": memory_change,
+            "regression": time_change >= threshold or memory_change >= threshold
+        })
+    return rows
+
+
+def format_result(result: BenchmarkResult) -> str:
+    if result.status == "skipped":
+        return f"{result.case:<28} {result.size:>9}  skipped"
+    if result.status == "error":
+        return f"{result.case:<28} {result.size:>9}  error: {result.error}"
+    return (
+        f"{result.case:<28} {result.size:>9}  "
+        f"{result.median_seconds * 1000:10.2f} ms  "
+        f"{result.peak_memory_bytes / 1024 / 1024:9.2f} MiB peak"
+    )
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'case':<28} {'size':>9}  {'time':>9}  {'memory':>9}"]
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['case']:<28} {row['size']:>9}  "
+            f"{row['time_change'] * 100:+8.1f}%  {row['memory_change'] * 100:+8.1f}%{flag}"
+        )
+    return "\n".join(lines)
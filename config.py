@@ -1,5 +1,5 @@
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List
 from pathlib import Path
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
@@ -26,6 +26,7 @@ class PathConfig(BaseModel):
     reports_dir: Path = Field(default=ROOT_DIR / "outputs" / "reports")
     assets_dir: Path = Field(default=ROOT_DIR / "assets")
     fonts_dir: Path = Field(default=ROOT_DIR / "assets" / "fonts")
+    checkpoints_dir: Path = Field(default=ROOT_DIR / "data" / "checkpoints")
 
     def __init__(self, **data):
         super().__init__(**data)
@@ -36,6 +37,7 @@ class PathConfig(BaseModel):
         self.reports_dir = Path(str(self.reports_dir)).resolve()
         self.assets_dir = Path(str(self.assets_dir)).resolve()
         self.fonts_dir = Path(str(self.fonts_dir)).resolve()
+        self.checkpoints_dir = Path(str(self.checkpoints_dir)).resolve()
 
 class LogConfig(BaseModel):
     """로깅 설정"""
@@ -51,12 +53,155 @@ class AppConfig(BaseModel):
     enhance_references: bool = Field(default=True)  # 참고문헌 강화 여부
     include_charts: bool = Field(default=False)  # 차트 포함 여부 (향후 확장)
 
+class PipelineConfig(BaseModel):
+    """파이프라인 스케줄러 설정"""
+    max_workers: int = Field(default=4)  # 동시에 실행할 스테이지 수
+    batch_concurrency: int = Field(default=2)  # 배치 모드에서 동시에 처리할 주제 수
+    checkpoints: bool = Field(default=True)  # 스테이지 출력 체크포인트 저장 여부
+    checkpoint_max_runs: int = Field(default=20)  # 주제별 보관할 체크포인트 실행 수 (0이면 무제한)
+
+class RetryConfig(BaseModel):
+    """LLM/스테이지 재시도 설정"""
+    base_delay: float = Field(default=1.0)  # 첫 재시도 대기 시간 상한 (시도마다 2배, 지터 적용)
+    max_delay: float = Field(default=30.0)  # 대기 시간 상한 (Retry-After가 더 길면 재시도하지 않음)
+    run_budget: int = Field(default=10)  # 파이프라인 실행 1회에서 모든 계층이 공유하는 재시도 횟수
+
+class RateLimitConfig(BaseModel):
+    """LLM 호출 속도 제한 설정 (프로세스 전역)"""
+    enabled: bool = Field(default=True)
+    requests_per_minute: int = Field(default=500)  # 0이면 제한 없음
+    tokens_per_minute: int = Field(default=30000)  # 프롬프트 + max_tokens 기준, 0이면 제한 없음
+    initial_concurrency: int = Field(default=4)  # 시작 동시 호출 한도
+    min_concurrency: int = Field(default=1)
+    max_concurrency: int = Field(default=16)
+    latency_target_seconds: float = Field(default=60.0)  # 이보다 느린 응답이면 동시 호출 한도를 줄임
+
+class CircuitBreakerConfig(BaseModel):
+    """LLM 서킷 브레이커 설정"""
+    enabled: bool = Field(default=True)
+    failure_threshold: float = Field(default=0.5)  # 최근 호출 중 공급자 오류 비율이 이 값 이상이면 회로 열기
+    min_calls: int = Field(default=5)  # 오류 비율 판단에 필요한 최소 호출 수
+    window_seconds: float = Field(default=60.0)
+    open_seconds: float = Field(default=30.0)  # 시험 호출까지의 대기 시간 (연속 실패 시 2배)
+    max_open_seconds: float = Field(default=300.0)
+    serve_stale: bool = Field(default=True)  # 회로가 열려 실패하면 주제의 가장 최근 보고서를 stale로 반환
+
+class LLMClientConfig(BaseModel):
+    """LLM HTTP 클라이언트 설정 (모든 에이전트가 하나의 연결 풀을 공유)"""
+    http2: bool = Field(default=True)  # h2 패키지가 없으면 HTTP/1.1 사용
+    max_connections: int = Field(default=20)
+    max_keepalive_connections: int = Field(default=10)
+    keepalive_expiry_seconds: float = Field(default=60.0)  # 유휴 연결 유지 시간
+    timeout_seconds: float = Field(default=120.0)  # 요청 전체 제한 시간
+    connect_timeout_seconds: float = Field(default=10.0)
+
+class LLMCacheConfig(BaseModel):
+    """LLM 응답 캐시 설정"""
+    enabled: bool = Field(default=True)  # False 또는 LLM_CACHE_BYPASS=1 이면 캐시 우회
+    path: Path = Field(default=ROOT_DIR / "data" / "cache" / "llm_cache.sqlite3")
+    max_size_mb: float = Field(default=200.0)  # 초과 시 LRU 제거
+    ttl_seconds: int = Field(default=7 * 24 * 3600)  # 응답 유효 기간
+
+class ResearchCacheConfig(BaseModel):
+    """유사 주제 연구 데이터 캐시 설정"""
+    enabled: bool = Field(default=True)
+    cache_dir: Path = Field(default=ROOT_DIR / "data" / "cache" / "research")
+    similarity_threshold: float = Field(default=0.5)  # 핵심어가 겹치는 주제 중 TF-IDF 유사도가 이 값 이상이면 재사용
+    min_term_overlap: float = Field(default=1.0)  # 핵심어 자카드 유사도 하한 (1.0이면 일반어를 뺀 핵심어가 같아야 함)
+    max_age_hours: float = Field(default=72.0)  # 이보다 오래된 수집 결과는 새로 수집
+    max_entries: int = Field(default=500)
+
+class ResearchStoreConfig(BaseModel):
+    """수집 연구 데이터 저장소 설정"""
+    store_dir: Path = Field(default=ROOT_DIR / "data" / "store")
+    max_runs: int = Field(default=200)  # 보관할 최대 실행 수 (0이면 무제한)
+    compression_level: int = Field(default=3)  # zstandard 압축 수준
+
+class CorpusConfig(BaseModel):
+    """누적 연구 코퍼스 설정"""
+    enabled: bool = Field(default=True)  # 수집한 항목을 코퍼스에 upsert
+    path: Path = Field(default=ROOT_DIR / "data" / "cache" / "corpus.sqlite3")
+
+class CollectorConfig(BaseModel):
+    """데이터 수집 설정"""
+    streaming: bool = Field(default=False)  # 전체 수집 응답을 스트리밍으로 받아 레코드 단위로 파싱
+    fallback_workers: int = Field(default=4)  # 카테고리별 개별 수집을 동시에 실행할 스레드 수
+    category_timeout_seconds: Dict[str, float] = Field(default_factory=lambda: {
+        "papers": 120.0,
+        "news": 90.0,
+        "patents": 90.0,
+        "investments": 90.0
+    })  # 개별 수집 시작 시점부터의 카테고리별 제한 시간
+    incremental: bool = Field(default=False)  # 이전 수집 결과가 있으면 그 이후 항목만 요청하여 병합
+    incremental_max_age_days: float = Field(default=30.0)  # 이전 수집이 이보다 오래되면 전체를 다시 수집
+    incremental_max_items: int = Field(default=50)  # 병합 후 카테고리별 최대 항목 수 (최신순, 0이면 무제한)
+
+class TranslationConfig(BaseModel):
+    """쿼리 번역 설정"""
+    enabled: bool = Field(default=True)  # False이면 용어집/번역 메모 없이 매번 LLM으로 번역
+    glossary_paths: List[Path] = Field(default_factory=lambda: [
+        ROOT_DIR / "assets" / "glossary" / "ko_en.tsv"
+    ])  # "한국어<TAB>영어" TSV 용어집 (뒤의 파일이 우선)
+    memo_path: Path = Field(default=ROOT_DIR / "data" / "cache" / "translations.json")
+
+class ServiceConfig(BaseModel):
+    """HTTP 서비스 설정"""
+    host: str = Field(default="127.0.0.1")
+    port: int = Field(default=8000)
+    workers: int = Field(default=2)  # 동시에 실행할 파이프라인 수
+    max_queue: int = Field(default=100)  # 대기 가능한 최대 작업 수
+
+class RenderConfig(BaseModel):
+    """보고서 렌더링 설정"""
+    use_process_pool: bool = Field(default=True)  # PDF/HTML 생성을 별도 프로세스에서 수행
+    processes: int = Field(default=2)
+    background: bool = Field(default=False)  # 렌더링 완료를 기다리지 않고 반환 (PDF/HTML은 render_futures로 전달)
+
+class TextAnalysisConfig(BaseModel):
+    """텍스트 분석(키워드 추출) 설정"""
+    tokenizer: str = Field(default="nltk")  # nltk(Punkt/WordNet) 또는 regex(한국어/영어 혼합, NLTK 데이터 불필요)
+    lemma_cache_size: int = Field(default=100_000)  # 표제어 LRU 캐시 크기 (토큰 수)
+    document_cache_size: int = Field(default=10_000)  # 문서 내용 해시별 토큰 캐시 크기 (0이면 캐시하지 않음)
+    workers: int = Field(default=0)  # 대량 문서 토큰화에 사용할 프로세스 수 (0/1이면 현재 프로세스에서 처리)
+    parallel_min_documents: int = Field(default=5000)  # 프로세스 풀을 사용할 최소 신규 문서 수
+    chunk_size: int = Field(default=1000)  # 프로세스에 한 번에 보내는 문서 수
+    sketch_width: int = Field(default=2048)  # 스트리밍 키워드 스케치의 Count-Min 행별 카운터 수
+    sketch_depth: int = Field(default=4)  # Count-Min 해시 행 수
+    sketch_capacity: int = Field(default=1000)  # 구간별 Space-Saving 후보 키워드 수
+    sketch_windows: int = Field(default=12)  # 유지할 최근 시간 구간 수
+
+class TokenBudgetConfig(BaseModel):
+    """프롬프트 토큰 예산 설정"""
+    enabled: bool = Field(default=True)  # False이면 에이전트가 research_data 전체를 사용
+    encoding_model: str = Field(default="gpt-4o")  # tiktoken 인코딩 선택 기준 모델
+    digest_tokens: int = Field(default=8000)  # 연구 데이터 요약본 전체 상한
+    agent_budgets: Dict[str, int] = Field(default_factory=lambda: {
+        "summary": 4000,
+        "prediction": 3000,
+        "risk": 3000
+    })  # 에이전트별 research_data 슬라이스 상한
+
 class Config(BaseModel):
     """전체 설정"""
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
     paths: PathConfig = Field(default_factory=PathConfig)
     logging: LogConfig = Field(default_factory=LogConfig)
     app: AppConfig = Field(default_factory=AppConfig)
+    pipeline: PipelineConfig = Field(default_factory=PipelineConfig)
+    retry: RetryConfig = Field(default_factory=RetryConfig)
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    llm_client: LLMClientConfig = Field(default_factory=LLMClientConfig)
+    circuit_breaker: CircuitBreakerConfig = Field(default_factory=CircuitBreakerConfig)
+    llm_cache: LLMCacheConfig = Field(default_factory=LLMCacheConfig)
+    research_cache: ResearchCacheConfig = Field(default_factory=ResearchCacheConfig)
+    research_store: ResearchStoreConfig = Field(default_factory=ResearchStoreConfig)
+    corpus: CorpusConfig = Field(default_factory=CorpusConfig)
+    collector: CollectorConfig = Field(default_factory=CollectorConfig)
+    translation: TranslationConfig = Field(default_factory=TranslationConfig)
+    service: ServiceConfig = Field(default_factory=ServiceConfig)
+    render: RenderConfig = Field(default_factory=RenderConfig)
+    token_budget: TokenBudgetConfig = Field(default_factory=TokenBudgetConfig)
+    text_analysis: TextAnalysisConfig = Field(default_factory=TextAnalysisConfig)
     
     class Config:
         arbitrary_types_allowed = True
@@ -82,8 +227,9 @@ class Config(BaseModel):
 # 전역 설정 객체 생성
 config = Config()
 
-# 환경 검증
-try:
-    config.validate_environment()
-except Exception as e:
-    raise RuntimeError(f"Configuration validation failed: {e}")
+def ensure_environment() -> None:
+    """환경 검증 및 디렉토리 생성 (임포트 시점이 아닌 실행 진입점에서 호출)"""
+    try:
+        config.validate_environment()
+    except Exception as e:
+        raise RuntimeError(f"Configuration validation failed: {e}")
@@ -0,0 +1,230 @@
+"""
+누적 연구 코퍼스
+실행마다 수집한 논문/특허/뉴스/투자 항목을 정규화된 식별 키로 SQLite에 upsert하여
+주제와 실행을 넘어 중복 없이 누적하고, 제목과 핵심 내용을 FTS5로 색인하여
+주제 관련 항목을 JSON 파일을 다시 읽지 않고 밀리초 단위로 조회합니다.
+SQLite에 FTS5가 없으면 레코드 원문 LIKE 검색으로 대체합니다.
+"""
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Tuple
+from data.models import RECORD_TYPES, ResearchRecord, identity_key, to_text, json_default
+
+logger = logging.getLogger(__name__)
+
+# 카테고리별 전문 검색 본문에 넣을 필드
+FTS_BODY_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "papers": ("key_findings", "methodology", "future_implications"),
+    "patents": ("key_innovations", "potential_applications", "company"),
+    "news": ("key_points", "market_impact", "companies_mentioned"),
+    "investments": ("technology_focus", "market_potential", "investors")
+}
+
+_TERM_PATTERN = re.compile(r'\w+')
+_EMPTY = (None, "", [])
+
+
+def _title(category: str, record: Dict[str, Any]) -> str:
+    return to_text(record.get("company" if category == "investments" else "title"))
+
+
+def _body(category: str, record: Dict[str, Any]) -> str:
+    return " ".join(to_text(record.get(name)) for name in FTS_BODY_FIELDS[category])
+
+
+def fts_query(text: str) -> Optional[str]:
+    """자유 텍스트를 FTS5 질의로 변환 (각 단어의 접두어 OR 검색, 특수 문법은 무력화)"""
+    terms = list(dict.fromkeys(term.lower() for term in _TERM_PATTERN.findall(text)))
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"*' for term in terms)
+
+
+class ResearchCorpus:
+    """
+    SQLite 기반 누적 연구 코퍼스
+
+    Args:
+        path: SQLite 파일 경로
+    """
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.fts_enabled = True
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS items ("
+                " id INTEGER PRIMARY KEY,"
+                " category TEXT NOT NULL,"
+                " identity TEXT NOT NULL,"
+                " record TEXT NOT NULL,"
+                " first_seen REAL NOT NULL,"
+                " last_seen REAL NOT NULL,"
+                " seen_count INTEGER NOT NULL DEFAULT 1,"
+                " UNIQUE (category, identity))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS item_queries ("
+                " item_id INTEGER NOT NULL,"
+                " query TEXT NOT NULL,"
+                " PRIMARY KEY (item_id, query))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_item_queries_query ON item_queries (query)")
+            try:
+                conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS items_fts"
+                    " USING fts5(title, body, tokenize='unicode61')"
+                )
+            except sqlite3.OperationalError as e:
+                logger.warning(f"SQLite FTS5 is unavailable, falling back to LIKE search: {e}")
+                self.fts_enabled = False
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def upsert(self, research_data: Dict[str, Any], query: Optional[str] = None) -> Dict[str, int]:
+        """
+        연구 데이터의 카테고리 항목을 코퍼스에 추가
+
+        이미 있는 항목은 새로 수집한 값 중 비어 있지 않은 필드로 갱신합니다.
+
+        Returns:
+            {"inserted": 새 항목 수, "updated": 갱신된 기존 항목 수}
+        """
+        counts = {"inserted": 0, "updated": 0}
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            for category in RECORD_TYPES:
+                for item in research_data.get(category) or []:
+                    if isinstance(item, (dict, ResearchRecord)):
+                        inserted = self._upsert_item(conn, category, item, query, now)
+                        counts["inserted" if inserted else "updated"] += 1
+            conn.commit()
+        return counts
+
+    def _upsert_item(self, conn: sqlite3.Connection, category: str, item: Any,
+                     query: Optional[str], now: float) -> bool:
+        record = item.to_dict() if isinstance(item, ResearchRecord) else dict(item)
+        identity = identity_key(category, record)
+        row = conn.execute(
+            "SELECT id, record FROM items WHERE category = ? AND identity = ?", (category, identity)
+        ).fetchone()
+
+        if row is None:
+            item_id = conn.execute(
+                "INSERT INTO items (category, identity, record, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)",
+                (category, identity, json.dumps(record, ensure_ascii=False, default=json_default), now, now)
+            ).lastrowid
+        else:
+            item_id = row[0]
+            merged = json.loads(row[1])
+            merged.update({key: value for key, value in record.items() if value not in _EMPTY})
+            record = merged
+            conn.execute(
+                "UPDATE items SET record = ?, last_seen = ?, seen_count = seen_count + 1 WHERE id = ?",
+                (json.dumps(record, ensure_ascii=False, default=json_default), now, item_id)
+            )
+            if self.fts_enabled:
+                conn.execute("DELETE FROM items_fts WHERE rowid = ?", (item_id,))
+
+        if self.fts_enabled:
+            conn.execute(
+                "INSERT INTO items_fts (rowid, title, body) VALUES (?, ?, ?)",
+                (item_id, _title(category, record), _body(category, record))
+            )
+        if query:
+            conn.execute("INSERT OR IGNORE INTO item_queries (item_id, query) VALUES (?, ?)", (item_id, query))
+        return row is None
+
+    def search(self, text: str, categories: Optional[Iterable[str]] = None,
+               limit: int = 20) -> List[Tuple[str, ResearchRecord]]:
+        """
+        제목/핵심 내용 전문 검색
+
+        Returns:
+            관련도 순 (카테고리, 레코드) 목록
+        """
+        categories = list(categories or RECORD_TYPES)
+        placeholders = ",".join("?" * len(categories))
+        with self._lock:
+            conn = self._connection()
+            if self.fts_enabled:
+                match = fts_query(text)
+                if match is None:
+                    return []
+                rows = conn.execute(
+                    "SELECT items.category, items.record FROM items_fts"
+                    " JOIN items ON items.id = items_fts.rowid"
+                    f" WHERE items_fts MATCH ? AND items.category IN ({placeholders})"
+                    " ORDER BY bm25(items_fts) LIMIT ?",
+                    (match, *categories, limit)
+                ).fetchall()
+            else:
+                rows = conn.execute(
+                    "SELECT category, record FROM items"
+                    f" WHERE record LIKE ? AND category IN ({placeholders})"
+                    " ORDER BY last_seen DESC LIMIT ?",
+                    (f"%{text}%", *categories, limit)
+                ).fetchall()
+        return [(category, RECORD_TYPES[category].from_dict(json.loads(record))) for category, record in rows]
+
+    def for_topic(self, query: str, aliases: Iterable[str] = (), limit: int = 50) -> Dict[str, List[ResearchRecord]]:
+        """
+        주제 관련 항목을 카테고리별로 반환
+
+        이전에 같은 질의로 수집한 항목을 먼저, 이어서 질의/별칭(영문 질의 등)의 전문 검색 결과를
+        카테고리별 limit개까지 채웁니다.
+        """
+        result: Dict[str, List[ResearchRecord]] = {category: [] for category in RECORD_TYPES}
+        seen = set()
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT items.category, items.identity, items.record FROM item_queries"
+                " JOIN items ON items.id = item_queries.item_id"
+                " WHERE item_queries.query = ? ORDER BY items.last_seen DESC",
+                (query,)
+            ).fetchall()
+        for category, identity, record in rows:
+            if len(result[category]) < limit:
+                seen.add((category, identity))
+                result[category].append(RECORD_TYPES[category].from_dict(json.loads(record)))
+
+        text = " ".join([query, *aliases])
+        for category in RECORD_TYPES:
+            if len(result[category]) >= limit:
+                continue
+            for _, record in self.search(text, [category], limit=limit):
+                key = (category, identity_key(category, record))
+                if key not in seen and len(result[category]) < limit:
+                    seen.add(key)
+                    result[category].append(record)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """카테고리별 항목 수"""
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT category, COUNT(*) FROM items GROUP BY category"
+            ).fetchall()
+        stats: Dict[str, Any] = {category: 0 for category in RECORD_TYPES}
+        stats.update(dict(rows))
+        stats["fts"] = self.fts_enabled
+        return stats
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -1,24 +1,39 @@
 import os
+import time
 import json
 import logging
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
-from langchain_openai import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate
+import contextvars
+from datetime import datetime, date
+from typing import Dict, List, Any, Optional, Tuple, Callable
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from langchain_core.prompts import ChatPromptTemplate
 from pathlib import Path
 from utils.logger import logger
 from utils.decorators import log_execution_time, retry, validate_input
 from utils.exceptions import DataCollectionError, StorageError
+from utils.retry import is_provider_error
+from utils.llm import invoke_llm, stream_llm, get_chat_model
+from utils.json_extract import extract_json
+from utils.json_stream import RecordStreamParser, StreamSchemaError
+from utils.glossary import Glossary, TranslationMemo, is_ascii
+from data.research_cache import SemanticResearchCache
+from data.research_store import ResearchStore
+from data.corpus import ResearchCorpus
+from data.models import normalize_research_data
+from data.incremental import latest_dates, format_cutoffs, merge_delta
 from config import config
-import re  # 정규식 모듈 추가
+
+# 스트리밍 수집 시 카테고리별 레코드 필수 필드
+RECORD_SCHEMA = {
+    "papers": ("title",),
+    "news": ("title",),
+    "patents": ("title",),
+    "investments": ("company",)
+}
 
 class DataCollector:
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model_name=config.openai.model_name,
-            temperature=config.openai.temperature,
-            max_tokens=config.openai.max_tokens
-        )
+        self.llm = get_chat_model()
         self.logger = logging.getLogger(__name__)
         
         # 데이터 저장 디렉토리 생성
@@ -33,6 +48,38 @@ class DataCollector:
         
         # 프롬프트 로드
         self.prompts = self._load_prompts()
+        
+        # 실행별 수집 결과 저장소 (압축 열 형식 + 색인)
+        self.research_store = ResearchStore(
+            config.research_store.store_dir,
+            max_runs=config.research_store.max_runs,
+            compression_level=config.research_store.compression_level
+        )
+        
+        # 누적 연구 코퍼스 (SQLite + FTS5)
+        self.corpus = ResearchCorpus(config.corpus.path) if config.corpus.enabled else None
+        
+        # 쿼리 번역용 용어집과 번역 메모
+        self.glossary = Glossary.from_files(config.translation.glossary_paths)
+        self.translation_memo = TranslationMemo(config.translation.memo_path)
+        
+        # 유사 주제 수집 결과 캐시 (주제 비교에 용어집 사용)
+        self.research_cache = SemanticResearchCache(
+            cache_dir=config.research_cache.cache_dir,
+            threshold=config.research_cache.similarity_threshold,
+            max_age_hours=config.research_cache.max_age_hours,
+            max_entries=config.research_cache.max_entries,
+            enabled=config.research_cache.enabled,
+            min_term_overlap=config.research_cache.min_term_overlap,
+            glossary=self.glossary
+        )
+        
+        # 스트리밍 수집 중 레코드가 완성될 때마다 호출되는 (카테고리, 레코드) 콜백
+        self.record_listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+
+    def _invoke(self, prompt: Any, validate: Optional[Callable[[str], Any]] = None) -> Any:
+        """LLM 호출 (응답 캐시 경유, validate를 통과한 응답만 캐시에 저장)"""
+        return invoke_llm(self.llm, prompt, label="DataCollector", validate=validate)
 
     def _create_directories(self):
         """데이터 저장을 위한 디렉토리 생성"""
@@ -46,6 +93,7 @@ class DataCollector:
         """프롬프트 파일들을 로드"""
         prompt_files = [
             'research_prompt.txt',
+            'delta_prompt.txt',
             'summary_prompt.txt',
             'prediction_prompt.txt',
             'risk_prompt.txt',
@@ -71,11 +119,24 @@ class DataCollector:
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
+            # 유사한 주제를 최근에 수집했다면 재사용
+            cached_data = self.research_cache.lookup(query)
+            if cached_data:
+                cached_data.update({"query": query, "timestamp": timestamp})
+                return normalize_research_data(cached_data)
+            
             # 영어로 된 주제가 더 정확한 데이터를 얻을 수 있음
             english_query = self._translate_query_if_needed(query)
             
+            # 증분 모드에서는 이전 수집 결과의 카테고리별 최신 날짜 이후 항목만 요청
+            previous = self._load_previous_collection(query) if config.collector.incremental else None
+            cutoffs = latest_dates(previous) if previous else None
+            
             # 모든 데이터를 한 번에 수집 (실패 확률 감소)
-            complete_data = self._collect_complete_data(english_query)
+            if config.collector.streaming:
+                complete_data = self._collect_complete_data_streaming(english_query, cutoffs)
+            else:
+                complete_data = self._collect_complete_data(english_query, cutoffs)
             
             if complete_data:
                 self.logger.info("Successfully collected complete data in a single API call")
@@ -84,15 +145,36 @@ class DataCollector:
                 patents = complete_data.get("patents", [])
                 investments = complete_data.get("investments", [])
                 tech_categories = complete_data.get("tech_categories", [])
+                collection_status = {
+                    category: "ok" if complete_data.get(category) else "empty"
+                    for category in ("papers", "news", "patents", "investments")
+                }
             else:
-                # 실패한 경우 개별 수집 시도 (백업 방법)
+                # 실패한 경우 카테고리별 개별 수집을 동시에 시도 (백업 방법)
                 self.logger.warning("Complete data collection failed, trying individual collection")
-                papers = self._collect_papers(english_query)
-                news = self._collect_news(english_query)
-                patents = self._collect_patents(english_query)
-                investments = self._collect_investments(english_query)
+                collected, collection_status = self._collect_categories_parallel(english_query)
+                papers = collected["papers"]
+                news = collected["news"]
+                patents = collected["patents"]
+                investments = collected["investments"]
                 tech_categories = []
             
+            # 이번에 새로 받은 항목 (코퍼스에는 변경분만 반영)
+            delta_data = {"papers": papers, "news": news, "patents": patents, "investments": investments}
+            incremental = None
+            if previous is not None:
+                merged, delta_counts = merge_delta(previous, delta_data, config.collector.incremental_max_items)
+                papers = merged["papers"]
+                news = merged["news"]
+                patents = merged["patents"]
+                investments = merged["investments"]
+                tech_categories = tech_categories or previous.get("tech_categories", [])
+                incremental = {
+                    "since": {category: cutoff.isoformat() if cutoff else None for category, cutoff in cutoffs.items()},
+                    "delta": delta_counts
+                }
+                self.logger.info(f"Merged incremental delta into previous collection: {delta_counts}")
+            
             # 데이터 수집 결과 수집
             research_data = {
                 "query": query,
@@ -102,70 +184,223 @@ class DataCollector:
                 "news": news,
                 "patents": patents,
                 "investments": investments,
-                "tech_categories": tech_categories
+                "tech_categories": tech_categories,
+                "collection_status": collection_status
             }
+            if incremental is not None:
+                research_data["incremental"] = incremental
+            
+            # 수집 시점에 한 번 검증/정규화하여 이후 단계는 레코드 속성으로 접근
+            normalize_research_data(research_data)
             
             # 수집된 데이터 저장
             self._save_research_data(research_data, query, timestamp)
             
+            # 주제/실행을 넘어 중복 없이 누적되는 코퍼스에 반영
+            if self.corpus is not None:
+                try:
+                    counts = self.corpus.upsert(delta_data if previous is not None else research_data, query)
+                    self.logger.info(f"Corpus updated: {counts}")
+                except Exception as e:
+                    self.logger.warning(f"Failed to update research corpus: {e}")
+            
             # 데이터 품질 메트릭 계산
             quality_metrics = self._calculate_quality_metrics(research_data)
             research_data["quality_metrics"] = quality_metrics
             
+            # 일부가 시간 초과로 빠졌거나 항목을 하나도 얻지 못한 결과(장애, 파싱 실패)는 재사용하지 않음
+            if self._is_cacheable(research_data):
+                try:
+                    self.research_cache.add(query, research_data)
+                except Exception as e:
+                    self.logger.warning(f"Failed to update research cache: {e}")
+            
             return research_data
             
         except Exception as e:
             logger.error(f"Error in research data collection: {e}")
-            raise DataCollectionError(f"Failed to collect research data: {e}")
+            raise DataCollectionError(f"Failed to collect research data: {e}") from e
     
+    @staticmethod
+    def _is_cacheable(research_data: Dict[str, Any]) -> bool:
+        """유사 주제 캐시에 저장할 수 있는 수집 결과인지 (시간 초과 없음, 항목이 있는 카테고리가 하나 이상)"""
+        status = research_data.get("collection_status", {})
+        if "timeout" in status.values():
+            return False
+        return any(status.get(category) == "ok" and research_data.get(category) for category in status)
+
     def _translate_query_if_needed(self, query: str) -> str:
-        """한글 쿼리를 영어로 변환 (필요한 경우)"""
-        # 간단한 규칙 기반 번역 (실제 프로덕션에서는 번역 API 사용 권장)
-        translations = {
-            "인공지능 기반 자율 에이전트 기술": "AI-based Autonomous Agent Technology",
-            "자율 에이전트": "Autonomous Agents",
-            "인공지능": "Artificial Intelligence",
-            "기계학습": "Machine Learning",
-            "딥러닝": "Deep Learning",
-            "강화학습": "Reinforcement Learning"
-        }
-        
+        """
+        한글 쿼리를 영어로 변환 (필요한 경우)
+
+        번역 메모 → 용어집 치환 → LLM 순으로 시도하며, 용어집이나 LLM으로 번역한 결과는
+        메모에 저장하여 같은 쿼리는 다음 실행부터 LLM을 호출하지 않습니다.
+        """
         # 한글 포함 여부 확인
-        contains_korean = any(ord(char) > 127 for char in query)
-        
-        if contains_korean:
-            # 정확한 번역이 있는지 확인
-            if query in translations:
-                return translations[query]
-            
-            # 부분 일치 확인
-            for kr, en in translations.items():
-                if kr in query:
-                    return en
-            
-            # 직접 번역 요청 (기본적인 구현)
+        if is_ascii(query):
+            return query
+
+        if config.translation.enabled:
+            cached = self.translation_memo.get(query)
+            if cached:
+                return cached
+
+            # 모든 한글 부분이 용어집으로 치환되면 LLM 없이 번역
+            translated = self.glossary.translate(query)
+            if translated:
+                self.translation_memo.put(query, translated)
+                return translated
+
+        # 직접 번역 요청
+        try:
+            prompt = ChatPromptTemplate.from_template(
+                "Translate the following Korean text to English, keeping technical terms accurate:\n\n{text}"
+            )
+            response = self._invoke(prompt.format(text=query), validate=lambda text: is_ascii(text.strip()))
+            translated = response.content.strip()
+
+            # 번역 결과가 있고 모두 ASCII 문자인지 확인
+            if translated and is_ascii(translated):
+                if config.translation.enabled:
+                    self.translation_memo.put(query, translated)
+                return translated
+        except Exception as e:
+            self.logger.warning(f"Translation failed: {e}")
+
+        # LLM 번역이 실패하면 쿼리에 등장한 용어의 영어 번역이라도 사용
+        if config.translation.enabled:
+            terms = self.glossary.matched_terms(query)
+            if terms:
+                return " ".join(terms)
+
+        # 번역이 실패한 경우 원본 반환
+        return query
+
+    def _load_previous_collection(self, query: str) -> Optional[Dict[str, Any]]:
+        """증분 수집의 기준이 될 같은 질의의 최근 수집 결과 (없거나 너무 오래되었으면 None)"""
+        try:
+            runs = self.research_store.list_runs(query)
+            if not runs:
+                return None
+            collected_at = datetime.strptime(runs[0]["timestamp"], "%Y%m%d_%H%M%S")
+            age_days = (datetime.now() - collected_at).total_seconds() / 86400
+            if age_days > config.collector.incremental_max_age_days:
+                self.logger.info(f"Previous collection is {age_days:.1f} days old, collecting in full")
+                return None
+            return self.research_store.load(runs[0]["id"])
+        except Exception as e:
+            self.logger.warning(f"Failed to load previous collection, collecting in full: {e}")
+            return None
+
+    def _research_prompt(self, query: str, cutoffs: Optional[Dict[str, Optional[date]]] = None) -> str:
+        """전체 수집 프롬프트 (cutoffs가 있으면 기준 날짜 이후 항목만 요청하는 증분 프롬프트)"""
+        if cutoffs is None:
+            return ChatPromptTemplate.from_template(self.prompts['research_prompt.txt']).format(query=query)
+        prompt = ChatPromptTemplate.from_template(self.prompts['delta_prompt.txt'])
+        return prompt.format(query=query, cutoffs=format_cutoffs(cutoffs))
+
+    def _collect_categories_parallel(self, query: str) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str]]:
+        """
+        카테고리별 개별 수집을 스레드 풀에서 동시에 실행
+
+        각 카테고리는 공통 시작 시점부터 자신의 제한 시간까지 기다리며, 시간 안에
+        끝나지 않은 카테고리는 빈 목록으로 두고 나머지 결과로 구성합니다.
+
+        Returns:
+            (카테고리별 수집 결과, 카테고리별 상태 "ok"/"empty"/"timeout"/"error")
+
+        Raises:
+            공급자 오류(회로 열림 등): 그 오류로 모든 카테고리가 항목 없이 끝난 경우
+        """
+        collectors = {
+            "papers": self._collect_papers,
+            "news": self._collect_news,
+            "patents": self._collect_patents,
+            "investments": self._collect_investments
+        }
+        timeouts = config.collector.category_timeout_seconds
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        status: Dict[str, str] = {}
+        provider_error: Optional[Exception] = None
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, config.collector.fallback_workers),
+            thread_name_prefix="collect"
+        )
+        try:
+            started = time.monotonic()
+            # 각 스레드가 호출자의 재시도 예산을 공유하도록 컨텍스트를 복사하여 실행
+            futures = {
+                category: executor.submit(contextvars.copy_context().run, collect, query)
+                for category, collect in collectors.items()
+            }
+            # 제한 시간이 짧은 카테고리부터 확인해 느린 카테고리가 판정을 늦추지 않도록 함
+            for category in sorted(futures, key=lambda name: timeouts.get(name, 90.0)):
+                remaining = started + timeouts.get(category, 90.0) - time.monotonic()
+                try:
+                    results[category] = futures[category].result(timeout=max(0.0, remaining))
+                    status[category] = "ok" if results[category] else "empty"
+                except FutureTimeoutError:
+                    self.logger.warning(f"Collecting {category} timed out after {timeouts.get(category, 90.0)}s")
+                    futures[category].cancel()
+                    results[category], status[category] = [], "timeout"
+                except Exception as e:
+                    self.logger.error(f"Collecting {category} failed: {e}")
+                    results[category], status[category] = [], "error"
+                    if provider_error is None and is_provider_error(e):
+                        provider_error = e
+        finally:
+            # 시간 초과된 호출이 끝나기를 기다리지 않음
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        self.logger.info(f"Individual collection finished in {time.monotonic() - started:.1f}s: {status}")
+        # 공급자 장애로 어떤 카테고리도 항목을 얻지 못했으면 빈 결과 대신 오류를 전달
+        if provider_error is not None and not any(results.values()):
+            raise provider_error
+        return results, status
+
+    def _collect_complete_data_streaming(self, query: str,
+                                         cutoffs: Optional[Dict[str, Optional[date]]] = None) -> Dict[str, Any]:
+        """
+        모든 데이터를 스트리밍으로 수집
+        레코드가 닫히는 즉시 record_listeners에 전달하고, 스키마를 벗어나면 생성 도중 중단합니다.
+        """
+        parser = RecordStreamParser(RECORD_SCHEMA)
+        # 스키마를 끝까지 만족한 응답만 캐시에 저장 (close는 상태를 바꾸지 않으므로 검증에 사용)
+        stream = stream_llm(self.llm, self._research_prompt(query, cutoffs), label="DataCollector",
+                            validate=lambda text: parser.close())
+        try:
+            for chunk in stream:
+                for category, record in parser.feed(chunk):
+                    self._notify_record(category, record)
+            data = parser.close()
+            self.logger.info(f"Streamed records: { {name: len(data[name]) for name in RECORD_SCHEMA} }")
+            return data
+        except StreamSchemaError as e:
+            self.logger.warning(f"Aborting research stream: {e}")
+            return {}
+        except Exception as e:
+            if is_provider_error(e):
+                raise
+            self.logger.error(f"Error streaming complete data: {e}")
+            return {}
+        finally:
+            # 중단 시 스트림(HTTP 응답)을 닫아 남은 생성을 받지 않음
+            stream.close()
+
+    def _notify_record(self, category: str, record: Dict[str, Any]) -> None:
+        for listener in self.record_listeners:
             try:
-                prompt = ChatPromptTemplate.from_template(
-                    "Translate the following Korean text to English, keeping technical terms accurate:\n\n{text}"
-                )
-                response = self.llm.invoke(prompt.format(text=query))
-                translated = response.content.strip()
-                
-                # 번역 결과가 있고 모두 ASCII 문자인지 확인
-                if translated and all(ord(char) < 128 for char in translated):
-                    return translated
+                listener(category, record)
             except Exception as e:
-                self.logger.warning(f"Translation failed: {e}")
-        
-        # 번역이 불필요하거나 실패한 경우 원본 반환
-        return query
+                self.logger.warning(f"Record listener failed for {category}: {e}")
 
     @retry(max_attempts=3)
-    def _collect_complete_data(self, query: str) -> Dict[str, Any]:
-        """모든 데이터를 한 번에 수집 (효율성 및 일관성 향상)"""
+    def _collect_complete_data(self, query: str,
+                               cutoffs: Optional[Dict[str, Optional[date]]] = None) -> Dict[str, Any]:
+        """모든 데이터를 한 번에 수집 (효율성 및 일관성 향상, cutoffs가 있으면 그 이후 항목만)"""
         try:
-            prompt = ChatPromptTemplate.from_template(self.prompts['research_prompt.txt'])
-            response = self.llm.invoke(prompt.format(query=query))
+            response = self._invoke(self._research_prompt(query, cutoffs), validate=self._is_json_response)
             
             # 응답 텍스트에서 JSON 부분 추출 (개선된 메서드 사용)
             json_text = self._extract_json_improved(response.content)
@@ -188,6 +423,9 @@ class DataCollector:
                 self.logger.warning("No valid JSON found in complete response")
                 return {}
         except Exception as e:
+            # 회로 열림/레이트 리밋/공급자 오류는 빈 결과로 삼키지 않음 (빈 데이터가 저장/캐시되는 것을 방지)
+            if is_provider_error(e):
+                raise
             self.logger.error(f"Error collecting complete data: {e}")
             return {}
 
@@ -201,7 +439,7 @@ class DataCollector:
             Example: [{{ "title": "Paper Title", "authors": ["Author1"], ... }}]
             Do NOT include any explanations or markdown, ONLY the JSON array."""
             
-            response = self.llm.invoke(papers_prompt)
+            response = self._invoke(papers_prompt, validate=lambda text: self._is_json_response(text, "papers"))
             
             # 응답 텍스트에서 JSON 부분 추출 (개선된 메서드 사용)
             json_text = self._extract_json_improved(response.content)
@@ -225,6 +463,8 @@ class DataCollector:
                 self.logger.warning("No valid JSON found in papers response")
                 return []
         except Exception as e:
+            if is_provider_error(e):
+                raise
             self.logger.error(f"Error collecting papers: {e}")
             return []
     
@@ -237,7 +477,7 @@ class DataCollector:
             Example: [{{ "title": "News Title", "source": "Source", ... }}]
             Do NOT include any explanations or markdown, ONLY the JSON array."""
             
-            response = self.llm.invoke(news_prompt)
+            response = self._invoke(news_prompt, validate=lambda text: self._is_json_response(text, "news"))
             
             # 응답 텍스트에서 JSON 부분 추출 (개선된 메서드 사용)
             json_text = self._extract_json_improved(response.content)
@@ -261,6 +501,8 @@ class DataCollector:
                 self.logger.warning("No valid JSON found in news response")
                 return []
         except Exception as e:
+            if is_provider_error(e):
+                raise
             self.logger.error(f"Error collecting news: {e}")
             return []
     
@@ -273,7 +515,7 @@ class DataCollector:
             Example: [{{ "title": "Patent Title", "inventors": ["Inventor1"], ... }}]
             Do NOT include any explanations or markdown, ONLY the JSON array."""
             
-            response = self.llm.invoke(patents_prompt)
+            response = self._invoke(patents_prompt, validate=lambda text: self._is_json_response(text, "patents"))
             
             # 응답 텍스트에서 JSON 부분 추출 (개선된 메서드 사용)
             json_text = self._extract_json_improved(response.content)
@@ -297,6 +539,8 @@ class DataCollector:
                 self.logger.warning("No valid JSON found in patents response")
                 return []
         except Exception as e:
+            if is_provider_error(e):
+                raise
             self.logger.error(f"Error collecting patents: {e}")
             return []
     
@@ -309,7 +553,7 @@ class DataCollector:
             Example: [{{ "company": "Company Name", "funding_amount": "Amount", ... }}]
             Do NOT include any explanations or markdown, ONLY the JSON array."""
             
-            response = self.llm.invoke(investments_prompt)
+            response = self._invoke(investments_prompt, validate=lambda text: self._is_json_response(text, "investments"))
             
             # 응답 텍스트에서 JSON 부분 추출 (개선된 메서드 사용)
             json_text = self._extract_json_improved(response.content)
@@ -333,74 +577,30 @@ class DataCollector:
                 self.logger.warning("No valid JSON found in investments response")
                 return []
         except Exception as e:
+            if is_provider_error(e):
+                raise
             self.logger.error(f"Error collecting investments: {e}")
             return []
     
+    def _is_json_response(self, text: str, category: Optional[str] = None) -> bool:
+        """
+        응답을 캐시에 저장할 수 있는지 (수집기가 파싱할 수 있는 JSON 구조인지)
+
+        category가 없으면 네 카테고리를 모두 가진 전체 수집 객체,
+        있으면 배열 또는 해당 카테고리 배열을 가진 객체여야 합니다.
+        """
+        json_text = self._extract_json_improved(text)
+        if not json_text:
+            return False
+        data = json.loads(json_text)
+        if category is None:
+            return isinstance(data, dict) and all(field in data for field in ("papers", "news", "patents", "investments"))
+        return isinstance(data, list) or (isinstance(data, dict) and isinstance(data.get(category), list))
+
     def _extract_json_improved(self, text: str) -> Optional[str]:
-        """응답 텍스트에서 JSON 부분 추출 (향상된 버전)"""
+        """응답 텍스트에서 JSON 부분 추출 (단일 패스 스캐너, 후행 쉼표 보정)"""
         try:
-            # 1. 코드 블록 내부의 JSON 찾기 (가장 신뢰할 수 있는 방법)
-            code_block_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-            code_blocks = re.findall(code_block_pattern, text)
-            
-            # 코드 블록 내에서 유효한 JSON 찾기
-            for block in code_blocks:
-                try:
-                    # 유효성 검사를 위한 간단한 로드 시도
-                    json.loads(block.strip())
-                    return block.strip()
-                except:
-                    continue
-            
-            # 2. 중괄호로 완전히a 감싸진 JSON 객체 찾기
-            json_pattern = r'(\{[\s\S]*\})'
-            json_matches = re.findall(json_pattern, text)
-            
-            for match in json_matches:
-                try:
-                    # 유효성 검사를 위한 간단한 로드 시도
-                    json.loads(match)
-                    return match
-                except:
-                    continue
-            
-            # 3. 대괄호로 완전히 감싸진 JSON 배열 찾기
-            array_pattern = r'(\[[\s\S]*\])'
-            array_matches = re.findall(array_pattern, text)
-            
-            for match in array_matches:
-                try:
-                    # 유효성 검사를 위한 간단한 로드 시도
-                    json.loads(match)
-                    return match
-                except:
-                    continue
-            
-            # 4. 마지막 시도: 가장 바깥쪽 중괄호만 추출
-            outer_json_match = re.search(r'\{(?:[^{}]|(?:\{(?:[^{}]|(?:\{[^{}]*\}))*\}))*\}', text)
-            if outer_json_match:
-                try:
-                    json_str = outer_json_match.group(0)
-                    # 유효성 검사
-                    json.loads(json_str)
-                    return json_str
-                except:
-                    pass
-            
-            # 5. 마지막 시도: 가장 바깥쪽 대괄호만 추출
-            outer_array_match = re.search(r'\[(?:[^\[\]]|(?:\[(?:[^\[\]]|(?:\[[^\[\]]*\]))*\]))*\]', text)
-            if outer_array_match:
-                try:
-                    array_str = outer_array_match.group(0)
-                    # 유효성 검사
-                    json.loads(array_str)
-                    return array_str
-                except:
-                    pass
-                    
-            # JSON을 찾지 못함
-            return None
-            
+            return extract_json(text)
         except Exception as e:
             self.logger.error(f"Error extracting JSON: {e}")
             return None
@@ -422,30 +622,23 @@ class DataCollector:
         min_count = 3
         data_freshness = "high" if (papers_count >= min_count and news_count >= min_count) else "medium" if (papers_count + news_count >= min_count) else "low"
         
-        # 모든 회사 및 기관 수집
+        # 모든 회사 및 기관 수집 (레코드는 수집 시점에 정규화되어 목록/문자열 형식이 보장됨)
         companies = set()
         
         # 뉴스에서 언급된 회사
         for news in data.get("news", []):
-            companies_mentioned = news.get("companies_mentioned", [])
-            if isinstance(companies_mentioned, list):
-                companies.update(companies_mentioned)
+            companies.update(news.companies_mentioned)
         
         # 특허에서 언급된 회사
         for patent in data.get("patents", []):
-            company = patent.get("company", "")
-            if company:
-                companies.add(company)
+            if patent.company:
+                companies.add(patent.company)
         
         # 투자 데이터에서 언급된 회사
         for investment in data.get("investments", []):
-            company = investment.get("company", "")
-            if company:
-                companies.add(company)
-            
-            investors = investment.get("investors", [])
-            if isinstance(investors, list):
-                companies.update(investors)
+            if investment.company:
+                companies.add(investment.company)
+            companies.update(investment.investors)
         
         # 소스 다양성 계산
         source_diversity = {}
@@ -453,17 +646,15 @@ class DataCollector:
         # 논문 출처
         papers_sources = {}
         for paper in data.get("papers", []):
-            authors = paper.get("authors", [])
-            if isinstance(authors, list) and authors:
-                source = authors[0]  # 첫 번째 저자 기준
+            if paper.authors:
+                source = paper.authors[0]  # 첫 번째 저자 기준
                 papers_sources[source] = papers_sources.get(source, 0) + 1
         
         # 뉴스 출처
         news_sources = {}
         for news in data.get("news", []):
-            source = news.get("source", "unknown")
-            if source:
-                news_sources[source] = news_sources.get(source, 0) + 1
+            source = news.source or "unknown"
+            news_sources[source] = news_sources.get(source, 0) + 1
         
         # 출처 다양성 종합
         if papers_sources or news_sources:
@@ -497,13 +688,7 @@ class DataCollector:
     def _save_research_data(self, data: Dict[str, Any], query: str, timestamp: str) -> None:
         """수집된 데이터 저장"""
         try:
-            filename = f"{query.replace(' ', '_')}_{timestamp}.json"
-            save_path = config.paths.data_dir / filename
-            
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            
-            logger.info(f"Saved research data to {save_path}")
+            self.research_store.save(data, query, timestamp)
         except Exception as e:
             logger.error(f"Error saving research data: {e}")
             raise StorageError(f"Failed to save research data: {e}")
@@ -0,0 +1,83 @@
+"""
+증분 수집
+반복 실행되는 주제는 이전 수집 결과의 카테고리별 최신 날짜 이후 항목만 LLM에 요청하고,
+받은 변경분(delta)을 식별 키 기준으로 기존 결과에 병합하여 프롬프트와 응답 크기가
+주제 전체가 아니라 새로 바뀐 부분에 비례하도록 합니다.
+"""
+from datetime import date
+from typing import Dict, Any, List, Optional, Tuple
+from data.models import RECORD_TYPES, as_records, identity_key
+
+# 카테고리별 기준 날짜 필드
+DATE_FIELDS: Dict[str, str] = {
+    "papers": "publication_date",
+    "news": "date",
+    "patents": "filing_date",
+    "investments": "date"
+}
+
+_EMPTY = (None, "", [])
+
+
+def latest_dates(research_data: Dict[str, Any]) -> Dict[str, Optional[date]]:
+    """카테고리별 가장 최근 날짜 (날짜가 있는 항목이 없으면 None)"""
+    result: Dict[str, Optional[date]] = {}
+    for category, record_type in RECORD_TYPES.items():
+        field = DATE_FIELDS[category]
+        dates = [
+            getattr(record, field) for record in as_records(research_data.get(category), record_type)
+            if getattr(record, field) is not None
+        ]
+        result[category] = max(dates) if dates else None
+    return result
+
+
+def format_cutoffs(cutoffs: Dict[str, Optional[date]]) -> str:
+    """프롬프트에 넣을 카테고리별 기준 날짜 목록"""
+    lines = []
+    for category in RECORD_TYPES:
+        cutoff = cutoffs.get(category)
+        since = f"{DATE_FIELDS[category]} > {cutoff.isoformat()}" if cutoff else "no previous items (collect normally)"
+        lines.append(f"- {category}: {since}")
+    return "\n".join(lines)
+
+
+def _sort_key(category: str, record: Any) -> date:
+    return getattr(record, DATE_FIELDS[category]) or date.min
+
+
+def merge_delta(base: Dict[str, Any], delta: Dict[str, Any],
+                max_items: int = 0) -> Tuple[Dict[str, List[Any]], Dict[str, Dict[str, int]]]:
+    """
+    변경분을 이전 수집 결과에 병합
+
+    같은 식별 키의 항목은 변경분의 비어 있지 않은 필드로 갱신하고, 새 항목은 추가합니다.
+    결과는 카테고리별 날짜 내림차순이며 max_items(0이면 무제한)개까지 남깁니다.
+
+    Returns:
+        (카테고리별 병합된 레코드 목록, 카테고리별 {"added", "updated"} 건수)
+    """
+    merged: Dict[str, List[Any]] = {}
+    counts: Dict[str, Dict[str, int]] = {}
+    for category, record_type in RECORD_TYPES.items():
+        items: Dict[str, Any] = {
+            identity_key(category, record): record
+            for record in as_records(base.get(category), record_type)
+        }
+        added = updated = 0
+        for record in as_records(delta.get(category), record_type):
+            key = identity_key(category, record)
+            existing = items.get(key)
+            if existing is None:
+                added += 1
+                items[key] = record
+            else:
+                updated += 1
+                values = existing.to_dict()
+                values.update({name: value for name, value in record.to_dict().items() if value not in _EMPTY})
+                items[key] = record_type.from_dict(values)
+
+        records = sorted(items.values(), key=lambda record: _sort_key(category, record), reverse=True)
+        merged[category] = records[:max_items] if max_items else records
+        counts[category] = {"added": added, "updated": updated}
+    return merged, counts
@@ -0,0 +1,292 @@
+"""
+수집 연구 데이터 레코드 모델
+LLM이 반환한 논문/뉴스/특허/투자 항목을 수집 시점에 한 번 검증/정규화하여
+슬롯 데이터클래스로 보관합니다 (날짜 파싱, 목록 변환, 숫자 변환).
+분석 코드는 속성으로 바로 접근하고, 기존 사전 기반 코드와 직렬화(JSON, 프롬프트)를 위해
+get/[]/to_dict와 사전 형태의 repr을 함께 제공합니다.
+"""
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Any, List, Optional, Iterable, Type, TypeVar, Callable
+
+R = TypeVar("R", bound="ResearchRecord")
+
+_NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+_IDENTITY_STRIP_PATTERN = re.compile(r'[^\w]+')
+_LIST_SPLIT_PATTERN = re.compile(r'\s*[;,]\s*')
+
+
+def to_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(to_text(item) for item in value)
+    return str(value).strip()
+
+
+def to_list(value: Any) -> List[str]:
+    """문자열/목록 값을 문자열 목록으로 변환"""
+    if value is None or value == "":
+        return []
+    if isinstance(value, (list, tuple)):
+        return [to_text(item) for item in value if item not in (None, "")]
+    return [str(value).strip()]
+
+
+def to_name_list(value: Any) -> List[str]:
+    """사람/기관 목록: "A, B; C" 형태의 문자열도 분리"""
+    if isinstance(value, str):
+        return [name for name in _LIST_SPLIT_PATTERN.split(value.strip()) if name]
+    return to_list(value)
+
+
+def to_date(value: Any) -> Optional[date]:
+    """
+    YYYY-MM-DD / YYYY-MM / YYYY 형식, ISO 날짜·시각 문자열과 date/datetime 객체를 날짜로 변환
+
+    문자열 전체가 형식과 일치해야 하며, "2024-13-45"처럼 잘못된 날짜는 앞부분만
+    잘라 해석하지 않고 None을 반환합니다 (증분 수집 기준 날짜가 틀어지지 않도록).
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = to_text(value)
+    for pattern in ("%Y-%m-%d", "%Y-%m", "%Y"):
+        try:
+            return datetime.strptime(text, pattern).date()
+        except ValueError:
+            continue
+    if len(text) > 10 and text[10] in "T ":
+        try:
+            return datetime.fromisoformat(text.replace("Z", "+00:00")).date()
+        except ValueError:
+            pass
+    return None
+
+
+def to_float(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    match = _NUMBER_PATTERN.search(to_text(value).replace(",", ""))
+    return float(match.group()) if match else None
+
+
+def to_int(value: Any) -> Optional[int]:
+    number = to_float(value)
+    return int(number) if number is not None else None
+
+
+class ResearchRecord:
+    """레코드 공통 기능 (사전 호환 접근, 직렬화)"""
+    __slots__ = ()
+
+    # 필드별 정규화 함수와 비어 있으면 안 되는 필드 (하위 클래스에서 정의)
+    _coercers: Dict[str, Callable[[Any], Any]] = {}
+    _required: tuple = ()
+
+    @classmethod
+    def from_dict(cls: Type[R], data: Dict[str, Any]) -> R:
+        """사전을 검증/정규화하여 레코드 생성 (알 수 없는 필드는 extra에 보존)"""
+        if isinstance(data, cls):
+            return data
+        if not isinstance(data, dict):
+            raise TypeError(f"{cls.__name__} expects a dict, got {type(data).__name__}")
+        values = {name: coerce(data.get(name)) for name, coerce in cls._coercers.items()}
+        missing = [name for name in cls._required if not values[name]]
+        if missing:
+            raise ValueError(f"{cls.__name__} is missing required fields: {missing}")
+        extra = {key: value for key, value in data.items() if key not in cls._coercers}
+        return cls(**values, extra=extra or None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 가능한 사전 (날짜는 YYYY-MM-DD 문자열)"""
+        result = {name: self[name] for name in self._coercers}
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._coercers:
+            value = getattr(self, key)
+            return value.isoformat() if isinstance(value, date) else value
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._coercers or bool(self.extra and key in self.extra)
+
+    def keys(self) -> List[str]:
+        return list(self.to_dict())
+
+    def __repr__(self) -> str:
+        # 프롬프트에 그대로 삽입되어도 기존 사전과 같은 모양이 되도록 함
+        return repr(self.to_dict())
+
+
+@dataclass(slots=True, repr=False)
+class Paper(ResearchRecord):
+    title: str = ""
+    authors: List[str] = field(default_factory=list)
+    publication_date: Optional[date] = None
+    journal: str = ""
+    key_findings: List[str] = field(default_factory=list)
+    impact_score: Optional[float] = None
+    citations: Optional[int] = None
+    methodology: str = ""
+    future_implications: List[str] = field(default_factory=list)
+    extra: Optional[Dict[str, Any]] = None
+
+    _coercers = {
+        "title": to_text,
+        "authors": to_name_list,
+        "publication_date": to_date,
+        "journal": to_text,
+        "key_findings": to_list,
+        "impact_score": to_float,
+        "citations": to_int,
+        "methodology": to_text,
+        "future_implications": to_list
+    }
+    _required = ("title",)
+
+
+@dataclass(slots=True, repr=False)
+class NewsItem(ResearchRecord):
+    title: str = ""
+    source: str = ""
+    date: Optional[date] = None
+    url: str = ""
+    key_points: List[str] = field(default_factory=list)
+    market_impact: str = ""
+    companies_mentioned: List[str] = field(default_factory=list)
+    extra: Optional[Dict[str, Any]] = None
+
+    _coercers = {
+        "title": to_text,
+        "source": to_text,
+        "date": to_date,
+        "url": to_text,
+        "key_points": to_list,
+        "market_impact": to_text,
+        "companies_mentioned": to_name_list
+    }
+    _required = ("title",)
+
+
+@dataclass(slots=True, repr=False)
+class Patent(ResearchRecord):
+    title: str = ""
+    inventors: List[str] = field(default_factory=list)
+    filing_date: Optional[date] = None
+    patent_number: str = ""
+    company: str = ""
+    key_innovations: List[str] = field(default_factory=list)
+    potential_applications: List[str] = field(default_factory=list)
+    extra: Optional[Dict[str, Any]] = None
+
+    _coercers = {
+        "title": to_text,
+        "inventors": to_name_list,
+        "filing_date": to_date,
+        "patent_number": to_text,
+        "company": to_text,
+        "key_innovations": to_list,
+        "potential_applications": to_list
+    }
+    _required = ("title",)
+
+
+@dataclass(slots=True, repr=False)
+class Investment(ResearchRecord):
+    company: str = ""
+    funding_amount: str = ""
+    date: Optional[date] = None
+    investors: List[str] = field(default_factory=list)
+    technology_focus: str = ""
+    market_potential: str = ""
+    extra: Optional[Dict[str, Any]] = None
+
+    _coercers = {
+        "company": to_text,
+        "funding_amount": to_text,
+        "date": to_date,
+        "investors": to_name_list,
+        "technology_focus": to_text,
+        "market_potential": to_text
+    }
+    _required = ("company",)
+
+
+RECORD_TYPES: Dict[str, Type[ResearchRecord]] = {
+    "papers": Paper,
+    "news": NewsItem,
+    "patents": Patent,
+    "investments": Investment
+}
+
+
+def as_records(items: Optional[Iterable[Any]], record_type: Type[R]) -> List[R]:
+    """사전/레코드가 섞인 목록을 레코드 목록으로 변환 (사전이 아니거나 필수 필드가 없는 항목은 제외)"""
+    records = []
+    for item in items or []:
+        if isinstance(item, record_type):
+            records.append(item)
+        elif isinstance(item, dict):
+            try:
+                records.append(record_type.from_dict(item))
+            except ValueError:
+                continue
+    return records
+
+
+def normalize_research_data(research_data: Dict[str, Any]) -> Dict[str, Any]:
+    """연구 데이터의 카테고리 목록을 레코드로 정규화 (제자리 변경 후 반환)"""
+    for category, record_type in RECORD_TYPES.items():
+        if category in research_data:
+            research_data[category] = as_records(research_data[category], record_type)
+    return research_data
+
+
+def _identity_text(value: Any) -> str:
+    return _IDENTITY_STRIP_PATTERN.sub(' ', to_text(value).lower()).strip()
+
+
+def identity_key(category: str, record: Any) -> str:
+    """
+    실행과 관계없이 같은 항목을 가리키는 정규화된 식별 키
+
+    논문은 DOI, 특허는 특허 번호, 뉴스는 URL이 있으면 그것을, 없으면 대소문자/구두점을
+    무시한 제목(뉴스는 제목+출처, 투자는 회사+연월+금액)을 사용합니다.
+    """
+    get = record.get
+    if category == "papers" and get("doi"):
+        return "doi:" + to_text(get("doi")).lower()
+    if category == "patents" and get("patent_number"):
+        return "pn:" + _IDENTITY_STRIP_PATTERN.sub('', to_text(get("patent_number")).lower())
+    if category == "news":
+        if get("url"):
+            url = re.sub(r'^https?://(www\.)?', '', to_text(get("url")).lower())
+            return "url:" + url.rstrip('/')
+        return f"title:{_identity_text(get('title'))}|{_identity_text(get('source'))}"
+    if category == "investments":
+        return f"inv:{_identity_text(get('company'))}|{to_text(get('date'))[:7]}|{_identity_text(get('funding_amount'))}"
+    return "title:" + _identity_text(get("title"))
+
+
+def json_default(value: Any) -> Any:
+    """json.dump의 default: 레코드와 날짜를 JSON 값으로 변환"""
+    if isinstance(value, ResearchRecord):
+        return value.to_dict()
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
@@ -0,0 +1,317 @@
+"""
+유사 주제 연구 데이터 캐시
+주제를 용어집으로 영어 표현에 맞춘 뒤 일반어(기술, 기반, 동향, AI 등)를 뺀 핵심어 집합을 구하고,
+핵심어가 겹치는 이전 주제 중 문자 n-gram TF-IDF 유사도가 설정한 값 이상인 것의 수집 결과를 재사용합니다.
+IDF는 캐시된 몇 개의 질의가 아니라 용어집 전체(고정 참조 코퍼스)로 한 번만 계산하여,
+캐시 내용에 따라 같은 두 주제의 유사도가 달라지지 않도록 합니다.
+항목별 핵심어와 TF-IDF 벡터는 저장(또는 색인 로드) 시 한 번만 계산해 두고, 조회 시에는 질의만 계산합니다.
+faiss가 설치되어 있으면 항목 추가 시 갱신되는 내적 인덱스로 검색하고, 없으면 순수 파이썬으로 계산합니다.
+"""
+import os
+import re
+import json
+import math
+import time
+import uuid
+import hashlib
+import logging
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from data.models import json_default
+from utils.glossary import Glossary
+
+logger = logging.getLogger(__name__)
+
+_TERM_PATTERN = re.compile(r'[a-z0-9]+|[가-힣]+')
+
+# 주제를 구분하지 않는 일반어 (도메인 전체가 AI/기술 트렌드이므로 제외)
+GENERIC_TERMS = frozenset({
+    "ai", "artificial", "intelligence", "based", "technology", "tech", "trend", "future", "outlook",
+    "forecast", "analysis", "latest", "recent", "state", "the", "of", "and", "for", "in", "on", "with",
+    "a", "an", "to", "using", "via",
+    "인공지능", "기반", "기술", "동향", "트렌드", "전망", "분석", "미래", "최신", "최근", "현황", "관련", "및"
+})
+
+
+def _load_faiss():
+    """faiss/numpy 지연 로드 (설치되지 않았으면 None)"""
+    try:
+        import numpy as np
+        import faiss
+        return faiss, np
+    except ImportError:
+        return None, None
+
+
+class TfidfVectorizer:
+    """해시 기반 문자 n-gram TF-IDF 벡터화 (한국어/영어 공통)"""
+    def __init__(self, ngram_range: Tuple[int, int] = (2, 3), dim: int = 2048) -> None:
+        self.ngram_range = ngram_range
+        self.dim = dim
+        self.idf: Dict[int, float] = {}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return re.sub(r'\s+', ' ', text.lower()).strip()
+
+    def _features(self, text: str) -> Counter:
+        text = f" {self.normalize(text)} "
+        counts: Counter = Counter()
+        low, high = self.ngram_range
+        for n in range(low, high + 1):
+            for i in range(len(text) - n + 1):
+                gram = text[i:i + n]
+                if gram.strip():
+                    bucket = int.from_bytes(hashlib.md5(gram.encode('utf-8')).digest()[:4], 'little') % self.dim
+                    counts[bucket] += 1
+        return counts
+
+    def fit(self, texts: List[str]) -> None:
+        """문서 빈도로 IDF 계산 (smooth idf)"""
+        df: Counter = Counter()
+        for text in texts:
+            df.update(set(self._features(text)))
+        total = len(texts)
+        self.idf = {bucket: math.log((1 + total) / (1 + freq)) + 1.0 for bucket, freq in df.items()}
+        self._default_idf = math.log(1 + total) + 1.0
+
+    def transform(self, text: str) -> Dict[int, float]:
+        """L2 정규화된 희소 TF-IDF 벡터"""
+        default_idf = getattr(self, "_default_idf", 1.0)
+        vector = {
+            bucket: (1.0 + math.log(count)) * self.idf.get(bucket, default_idf)
+            for bucket, count in self._features(text).items()
+        }
+        norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+        return {bucket: value / norm for bucket, value in vector.items()}
+
+    def to_dense(self, vector: Dict[int, float]) -> List[float]:
+        dense = [0.0] * self.dim
+        for bucket, value in vector.items():
+            dense[bucket] = value
+        return dense
+
+
+def _singular(word: str) -> str:
+    if len(word) > 3 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+# 핵심어 집합, 용어집으로 맞춘 주제 문자열, 희소 TF-IDF 벡터
+Features = Tuple[frozenset, str, Dict[int, float]]
+
+
+class SemanticResearchCache:
+    """
+    주제 유사도 기반 연구 데이터 캐시
+
+    Args:
+        threshold: 재사용할 최소 TF-IDF 코사인 유사도 (용어집으로 맞춘 주제 문자열 기준)
+        min_term_overlap: 재사용할 최소 핵심어 자카드 유사도 (1.0이면 핵심어 집합이 같아야 함)
+        glossary: 한국어 주제를 영어 표현으로 맞추고 IDF 참조 코퍼스로 쓸 용어집
+    """
+    def __init__(self, cache_dir: Path, threshold: float = 0.5, max_age_hours: float = 72.0,
+                 max_entries: int = 500, enabled: bool = True, min_term_overlap: float = 1.0,
+                 glossary: Optional[Glossary] = None) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.threshold = threshold
+        self.min_term_overlap = min_term_overlap
+        self.max_age_seconds = max_age_hours * 3600
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.glossary = glossary or Glossary({})
+
+        self.vectorizer = TfidfVectorizer()
+        reference = [text for pair in self.glossary.terms.items() for text in pair]
+        self.vectorizer.fit(reference or [""])
+        self._lock = threading.Lock()
+        self._entries: Optional[List[Dict[str, Any]]] = None
+        self._features: Dict[str, Features] = {}
+        self._faiss_index = None
+        self._faiss_ids: List[str] = []
+
+    @property
+    def _index_path(self) -> Path:
+        return self.cache_dir / "index.json"
+
+    def _load_entries(self) -> List[Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self._index_path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = []
+            except Exception as e:
+                logger.warning(f"Research cache index unreadable, starting empty: {e}")
+                self._entries = []
+            self._index_entries(self._entries)
+        return self._entries
+
+    def _index_entries(self, entries: List[Dict[str, Any]]) -> None:
+        """항목의 핵심어/벡터를 계산해 보관하고 faiss 인덱스에 추가"""
+        for entry in entries:
+            if entry["id"] not in self._features:
+                self._features[entry["id"]] = self.features(entry["query"])
+
+        faiss, np = _load_faiss()
+        indexed = set(self._faiss_ids)
+        new_entries = [entry for entry in entries if entry["id"] not in indexed]
+        if faiss is None or not new_entries:
+            return
+        if self._faiss_index is None:
+            self._faiss_index = faiss.IndexFlatIP(self.vectorizer.dim)
+        vectors = [self.vectorizer.to_dense(self._features[entry["id"]][2]) for entry in new_entries]
+        self._faiss_index.add(np.array(vectors, dtype="float32"))
+        self._faiss_ids.extend(entry["id"] for entry in new_entries)
+
+    def _drop_features(self, kept_ids: set) -> None:
+        """제거된 항목의 계산 결과를 버리고 faiss 인덱스를 남은 항목으로 재구성"""
+        self._features = {entry_id: value for entry_id, value in self._features.items() if entry_id in kept_ids}
+        if self._faiss_index is not None:
+            self._faiss_index = None
+            self._faiss_ids = []
+            self._index_entries(self._entries)
+
+    def _write_index(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._index_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self._index_path)
+
+    def _prune(self) -> None:
+        """신선도 기한이 지난 항목과 최대 개수 초과분 제거"""
+        now = time.time()
+        entries = self._load_entries()
+        fresh = [entry for entry in entries if now - entry["created_at"] <= self.max_age_seconds]
+        fresh = sorted(fresh, key=lambda entry: entry["created_at"])[-self.max_entries:]
+
+        kept_ids = {entry["id"] for entry in fresh}
+        for entry in entries:
+            if entry["id"] not in kept_ids:
+                (self.cache_dir / f"{entry['id']}.json").unlink(missing_ok=True)
+
+        if len(fresh) != len(entries):
+            self._entries = fresh
+            self._write_index()
+            self._drop_features(kept_ids)
+
+    def canonical(self, query: str) -> str:
+        """용어집 용어를 영어 표현으로 바꾼 소문자 주제 문자열"""
+        return TfidfVectorizer.normalize(self.glossary.substitute(query))
+
+    @staticmethod
+    def _terms(canonical: str) -> frozenset:
+        terms = (_singular(term) for term in _TERM_PATTERN.findall(canonical))
+        return frozenset(term for term in terms if term not in GENERIC_TERMS)
+
+    def key_terms(self, query: str) -> frozenset:
+        """주제를 구분하는 핵심어 집합 (일반어 제외, 영어는 단수형)"""
+        return self._terms(self.canonical(query))
+
+    def features(self, query: str) -> Features:
+        """비교에 쓰는 (핵심어 집합, 정규화한 주제 문자열, TF-IDF 벡터)"""
+        canonical = self.canonical(query)
+        return self._terms(canonical), canonical, self.vectorizer.transform(canonical)
+
+    @staticmethod
+    def _overlap(first: Features, second: Features) -> float:
+        first_terms, second_terms = first[0], second[0]
+        if first_terms or second_terms:
+            return len(first_terms & second_terms) / len(first_terms | second_terms)
+        # 일반어만으로 된 주제는 정규화한 문자열이 같을 때만 같은 주제로 봄
+        return float(first[1] == second[1])
+
+    @staticmethod
+    def _cosine(first: Dict[int, float], second: Dict[int, float]) -> float:
+        return sum(value * second.get(bucket, 0.0) for bucket, value in first.items())
+
+    def similarity(self, first: str, second: str) -> Tuple[float, float]:
+        """(핵심어 자카드 유사도, TF-IDF 코사인 유사도)"""
+        first_features, second_features = self.features(first), self.features(second)
+        return self._overlap(first_features, second_features), self._cosine(first_features[2], second_features[2])
+
+    def _nearest(self, query: Features, entries: List[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], float]:
+        """핵심어가 충분히 겹치는 항목 중 가장 유사한 항목과 코사인 유사도 (항목 쪽은 보관된 계산 결과 사용)"""
+        candidates = {
+            entry["id"]: entry for entry in entries
+            if self._overlap(query, self._features[entry["id"]]) >= self.min_term_overlap
+        }
+        if not candidates:
+            return None, 0.0
+
+        if self._faiss_index is not None:
+            _, np = _load_faiss()
+            query_vector = np.array([self.vectorizer.to_dense(query[2])], dtype="float32")
+            scores, positions = self._faiss_index.search(query_vector, self._faiss_index.ntotal)
+            for score, position in zip(scores[0], positions[0]):
+                if position >= 0 and self._faiss_ids[position] in candidates:
+                    return candidates[self._faiss_ids[position]], float(score)
+            return None, 0.0
+
+        best, best_score = None, 0.0
+        for entry_id, entry in candidates.items():
+            score = self._cosine(query[2], self._features[entry_id][2])
+            if score > best_score:
+                best, best_score = entry, score
+        return best, best_score
+
+    def lookup(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        유사한 주제의 최근 수집 결과 조회
+
+        Returns:
+            재사용할 연구 데이터 사본 (없으면 None). cache_hit 필드에 매칭 정보 포함
+        """
+        if not self.enabled:
+            return None
+
+        query_features = self.features(query)
+        with self._lock:
+            self._prune()
+            entries = self._load_entries()
+            if not entries:
+                return None
+
+            entry, similarity = self._nearest(query_features, entries)
+            if entry is None or similarity < self.threshold:
+                logger.info(f"Research cache miss for '{query}' (best similarity {similarity:.2f})")
+                return None
+
+            try:
+                with open(self.cache_dir / f"{entry['id']}.json", 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.warning(f"Research cache entry unreadable: {e}")
+                return None
+
+        logger.info(f"Research cache hit: '{query}' ~ '{entry['query']}' (similarity {similarity:.2f})")
+        data["cache_hit"] = {
+            "matched_query": entry["query"],
+            "similarity": round(similarity, 3),
+            "collected_at": entry["created_at"]
+        }
+        return data
+
+    def add(self, query: str, research_data: Dict[str, Any]) -> None:
+        """수집 결과 저장"""
+        if not self.enabled:
+            return
+
+        query_features = self.features(query)
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            entry_id = uuid.uuid4().hex
+            with open(self.cache_dir / f"{entry_id}.json", 'w', encoding='utf-8') as f:
+                json.dump(research_data, f, ensure_ascii=False, default=json_default)
+
+            entry = {"id": entry_id, "query": query, "created_at": time.time()}
+            entries = self._load_entries()
+            entries.append(entry)
+            self._features[entry_id] = query_features
+            self._index_entries([entry])
+            self._write_index()
+            self._prune()
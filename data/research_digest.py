@@ -0,0 +1,108 @@
+"""
+연구 데이터 요약본 (research digest)
+수집된 research_data 전체를 에이전트마다 프롬프트에 넣는 대신, 파이프라인에서 한 번
+중요도 순으로 정렬하고 필드를 추린 크기 제한 요약본을 만든 뒤, 각 에이전트에는
+필요한 카테고리만 에이전트별 토큰 예산 이내로 잘라서 전달합니다.
+"""
+from typing import Dict, Any, List, Tuple, Optional
+from data.models import ResearchRecord
+from utils.token_budget import count_tokens, truncate_to_tokens, fit_lists_to_budget, to_prompt_json
+
+# 카테고리별로 프롬프트에 남길 필드
+CATEGORY_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "papers": ("title", "authors", "publication_date", "key_findings", "impact_score", "citations"),
+    "patents": ("title", "company", "filing_date", "key_innovations", "potential_applications"),
+    "news": ("title", "source", "date", "key_points", "market_impact"),
+    "investments": ("company", "funding_amount", "date", "investors", "technology_focus", "market_potential")
+}
+
+# 목록이 아닌 그대로 전달할 요약 필드
+SCALAR_FIELDS = ("query", "english_query", "tech_categories", "research_trends", "tech_roadmap")
+
+# 에이전트별로 필요한 카테고리
+AGENT_SLICES: Dict[str, Tuple[str, ...]] = {
+    "summary": ("query", "tech_categories", "research_trends", "papers", "patents", "news"),
+    "prediction": ("query", "tech_categories", "tech_roadmap", "research_trends", "papers", "investments", "news"),
+    "risk": ("query", "research_trends", "news", "investments", "patents")
+}
+
+# 긴 자유 텍스트 필드의 토큰 상한
+_FIELD_TOKENS = 80
+_MAX_AUTHORS = 5
+
+
+def _rank(category: str, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """카테고리별 중요도 순 정렬 (논문은 영향도/인용 수, 나머지는 최신순)"""
+    def number(value: Any) -> float:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 0.0
+
+    if category == "papers":
+        return sorted(items, key=lambda item: (number(item.get("impact_score")), number(item.get("citations"))), reverse=True)
+    date_field = {"patents": "filing_date", "news": "date", "investments": "date"}[category]
+    return sorted(items, key=lambda item: str(item.get(date_field) or ""), reverse=True)
+
+
+def _compact_record(record: Dict[str, Any], fields: Tuple[str, ...], model: str) -> Dict[str, Any]:
+    compact = {}
+    for field in fields:
+        value = record.get(field)
+        if value in (None, "", []):
+            continue
+        if isinstance(value, str):
+            value = truncate_to_tokens(value, _FIELD_TOKENS, model)
+        elif isinstance(value, list) and field in ("authors", "investors"):
+            value = value[:_MAX_AUTHORS]
+        elif isinstance(value, list):
+            value = [truncate_to_tokens(str(item), _FIELD_TOKENS, model) for item in value[:3]]
+        compact[field] = value
+    return compact
+
+
+def build_research_digest(research_data: Dict[str, Any], max_tokens: int = 8000,
+                          model: str = "gpt-4o") -> Dict[str, Any]:
+    """
+    크기 제한 연구 데이터 요약본 생성
+
+    Args:
+        research_data: DataCollector가 수집한 연구 데이터
+        max_tokens: 요약본 직렬화 결과의 토큰 상한
+
+    Returns:
+        카테고리별 레코드를 중요도 순으로 추린 사전. counts에 원본 레코드 수,
+        tokens에 요약본 토큰 수를 기록
+    """
+    digest: Dict[str, Any] = {
+        field: research_data[field] for field in SCALAR_FIELDS if research_data.get(field)
+    }
+    for category, fields in CATEGORY_FIELDS.items():
+        items = [item for item in research_data.get(category) or [] if isinstance(item, (dict, ResearchRecord))]
+        digest[category] = [_compact_record(item, fields, model) for item in _rank(category, items)]
+
+    counts = {category: len(research_data.get(category) or []) for category in CATEGORY_FIELDS}
+    digest = fit_lists_to_budget(digest, max_tokens, model)
+    digest["counts"] = counts
+    digest["tokens"] = count_tokens(to_prompt_json(digest), model)
+    return digest
+
+
+def slice_digest(digest: Dict[str, Any], agent: str, budget: Optional[int] = None,
+                 model: str = "gpt-4o") -> Dict[str, Any]:
+    """
+    에이전트에 필요한 카테고리만 예산 이내로 추출
+
+    Args:
+        digest: build_research_digest 결과
+        agent: AGENT_SLICES의 에이전트 이름
+        budget: 토큰 상한 (없으면 자르지 않음)
+    """
+    keys = AGENT_SLICES.get(agent, tuple(digest))
+    sliced = {key: digest[key] for key in keys if key in digest}
+    if budget:
+        sliced = fit_lists_to_budget(sliced, budget, model)
+    if "counts" in digest:
+        # 원본 규모는 잘린 뒤에도 알 수 있도록 유지
+        sliced["counts"] = {key: digest["counts"][key] for key in keys if key in digest["counts"]}
+    return sliced
@@ -0,0 +1,236 @@
+"""
+수집 연구 데이터 저장소
+실행마다 연구 데이터를 카테고리별 열(column) 형식으로 직렬화하고 압축하여 한 파일로 저장하며,
+질의/시각/카테고리별 건수만 담은 작은 색인(index.json)을 유지하여 과거 실행 목록 조회와
+단건 로드가 디렉토리의 모든 파일을 파싱하지 않도록 합니다.
+
+직렬화는 ormsgpack(없으면 orjson, 그마저 없으면 json), 압축은 zstandard(없으면 gzip)를 사용하며,
+파일 확장자에 형식을 기록하므로 의존성이 달라진 환경에서도 이전 파일을 읽을 수 있습니다.
+"""
+import os
+import re
+import gzip
+import json
+import uuid
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from data.models import RECORD_TYPES, ResearchRecord, normalize_research_data, json_default
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.json"
+
+
+def _load_msgpack():
+    try:
+        import ormsgpack
+        return ormsgpack
+    except ImportError:
+        return None
+
+
+def _load_orjson():
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
+
+
+def _load_zstd():
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def serialize(value: Any) -> Tuple[bytes, str]:
+    """직렬화 결과와 형식(msgpack 또는 json) 반환"""
+    msgpack = _load_msgpack()
+    if msgpack is not None:
+        return msgpack.packb(value, default=json_default), "msgpack"
+    orjson = _load_orjson()
+    if orjson is not None:
+        return orjson.dumps(value, default=json_default), "json"
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=json_default).encode("utf-8"), "json"
+
+
+def deserialize(data: bytes, fmt: str) -> Any:
+    if fmt == "msgpack":
+        msgpack = _load_msgpack()
+        if msgpack is None:
+            raise RuntimeError("ormsgpack is required to read msgpack research data")
+        return msgpack.unpackb(data)
+    orjson = _load_orjson()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def compress(data: bytes, level: int = 3) -> Tuple[bytes, str]:
+    """압축 결과와 형식(zst 또는 gz) 반환"""
+    zstd = _load_zstd()
+    if zstd is not None:
+        return zstd.ZstdCompressor(level=level).compress(data), "zst"
+    return gzip.compress(data, compresslevel=min(9, max(1, level))), "gz"
+
+
+def decompress(data: bytes, fmt: str) -> bytes:
+    if fmt == "zst":
+        zstd = _load_zstd()
+        if zstd is None:
+            raise RuntimeError("zstandard is required to read zst research data")
+        return zstd.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def to_columns(items: List[Any]) -> Dict[str, Any]:
+    """
+    레코드 목록을 열 형식으로 변환 {"count": 레코드 수, "columns": {필드: [값, ...]}}
+
+    필드 이름을 레코드마다 반복하지 않으며, 레코드에 없는 필드는 None으로 채웁니다.
+    """
+    rows = [
+        item.to_dict() if isinstance(item, ResearchRecord) else item
+        for item in items if isinstance(item, (dict, ResearchRecord))
+    ]
+    fields: Dict[str, None] = {}
+    for row in rows:
+        fields.update(dict.fromkeys(row))
+    return {
+        "count": len(rows),
+        "columns": {name: [row.get(name) for row in rows] for name in fields}
+    }
+
+
+def from_columns(table: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """열 형식을 레코드 사전 목록으로 복원 (None 값은 생략)"""
+    columns = table.get("columns", {})
+    return [
+        {name: values[index] for name, values in columns.items() if values[index] is not None}
+        for index in range(table.get("count", 0))
+    ]
+
+
+class ResearchStore:
+    """
+    압축 열 형식 연구 데이터 저장소
+
+    Args:
+        root_dir: 저장 디렉토리
+        max_runs: 보관할 최대 실행 수 (초과 시 오래된 실행부터 삭제, 0이면 무제한)
+        compression_level: zstandard 압축 수준
+    """
+    def __init__(self, root_dir: Path, max_runs: int = 200, compression_level: int = 3) -> None:
+        self.root_dir = Path(root_dir)
+        self.max_runs = max_runs
+        self.compression_level = compression_level
+        self._lock = threading.Lock()
+        self._entries: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def _index_path(self) -> Path:
+        return self.root_dir / INDEX_FILE
+
+    def _load_index(self) -> List[Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self._index_path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = []
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable research store index: {e}")
+                self._entries = []
+        return self._entries
+
+    def _write_index(self) -> None:
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._index_path.with_suffix(".json.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self._index_path)
+
+    @staticmethod
+    def _run_id(query: str, timestamp: str) -> str:
+        slug = re.sub(r'[^\w]+', '_', query.strip()).strip('_')[:40] or "query"
+        return f"{timestamp}_{slug}_{uuid.uuid4().hex[:6]}"
+
+    def save(self, research_data: Dict[str, Any], query: str, timestamp: str) -> Dict[str, Any]:
+        """
+        연구 데이터 저장
+
+        Returns:
+            색인 항목 (id, query, timestamp, counts, file, bytes)
+        """
+        payload = {
+            "meta": {key: value for key, value in research_data.items() if key not in RECORD_TYPES},
+            "tables": {category: to_columns(research_data.get(category) or []) for category in RECORD_TYPES}
+        }
+        raw, fmt = serialize(payload)
+        data, codec = compress(raw, self.compression_level)
+
+        run_id = self._run_id(query, timestamp)
+        filename = f"{run_id}.{fmt}.{codec}"
+        entry = {
+            "id": run_id,
+            "query": query,
+            "timestamp": timestamp,
+            "counts": {category: table["count"] for category, table in payload["tables"].items()},
+            "file": filename,
+            "bytes": len(data)
+        }
+        with self._lock:
+            self.root_dir.mkdir(parents=True, exist_ok=True)
+            path = self.root_dir / filename
+            tmp_path = path.with_name(filename + ".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+            entries = self._load_index()
+            entries.append(entry)
+            self._prune(entries)
+            self._write_index()
+        logger.info(f"Saved research data to {path} ({len(raw)} -> {len(data)} bytes)")
+        return entry
+
+    def _prune(self, entries: List[Dict[str, Any]]) -> None:
+        """max_runs를 넘는 오래된 실행 삭제 (잠금 보유 상태에서 호출)"""
+        if not self.max_runs or len(entries) <= self.max_runs:
+            return
+        entries.sort(key=lambda item: item["timestamp"])
+        for entry in entries[:len(entries) - self.max_runs]:
+            try:
+                (self.root_dir / entry["file"]).unlink()
+            except FileNotFoundError:
+                pass
+        del entries[:len(entries) - self.max_runs]
+
+    def list_runs(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
+        """색인 항목 목록 (최신순, query를 주면 해당 질의만)"""
+        with self._lock:
+            entries = [dict(entry) for entry in self._load_index()]
+        if query is not None:
+            entries = [entry for entry in entries if entry["query"] == query]
+        return sorted(entries, key=lambda item: item["timestamp"], reverse=True)
+
+    def latest(self, query: str) -> Optional[Dict[str, Any]]:
+        """질의의 가장 최근 실행 데이터"""
+        runs = self.list_runs(query)
+        return self.load(runs[0]["id"]) if runs else None
+
+    def load(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """실행 ID의 연구 데이터 (카테고리 항목은 레코드 모델로 복원)"""
+        with self._lock:
+            entry = next((item for item in self._load_index() if item["id"] == run_id), None)
+        if entry is None:
+            return None
+        _, fmt, codec = entry["file"].rsplit(".", 2)
+        with open(self.root_dir / entry["file"], 'rb') as f:
+            payload = deserialize(decompress(f.read(), codec), fmt)
+        research_data = dict(payload.get("meta", {}))
+        for category, table in payload.get("tables", {}).items():
+            research_data[category] = from_columns(table)
+        return normalize_research_data(research_data)
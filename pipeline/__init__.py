@@ -0,0 +1,19 @@
+"""
+Pipeline scheduling package
+"""
+
+from .dag import Stage, StageTiming, RunReport, PipelineGraph, StageScheduler
+from .checkpoint import CheckpointStore
+from .batch import TopicResult, BatchRunner, load_topics
+
+__all__ = [
+    'Stage',
+    'StageTiming',
+    'RunReport',
+    'PipelineGraph',
+    'StageScheduler',
+    'CheckpointStore',
+    'TopicResult',
+    'BatchRunner',
+    'load_topics'
+]
@@ -0,0 +1,117 @@
+"""
+다중 주제 배치 실행
+하나의 파이프라인(에이전트, 프롬프트, LLM 클라이언트 공유)으로
+여러 주제를 제한된 동시성으로 처리합니다.
+"""
+import time
+import logging
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class TopicResult:
+    """주제별 실행 결과"""
+    topic: str
+    success: bool
+    latency: float
+    report_md_path: Optional[str] = None
+    report_pdf_path: Optional[str] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "topic": self.topic,
+            "success": self.success,
+            "latency": round(self.latency, 3),
+            "report_md_path": self.report_md_path,
+            "report_pdf_path": self.report_pdf_path,
+            "error": self.error
+        }
+
+
+def load_topics(path: str) -> List[str]:
+    """주제 파일 로드 (한 줄에 하나, 빈 줄과 '#' 주석 무시)"""
+    with open(Path(path), 'r', encoding='utf-8') as f:
+        lines = [line.strip() for line in f]
+    return [line for line in lines if line and not line.startswith('#')]
+
+
+class BatchRunner:
+    """
+    주제 목록을 동시에 실행하는 배치 러너
+
+    Args:
+        pipeline: run(topic, resume=..., from_stage=...)을 제공하는 파이프라인
+        max_concurrency: 동시에 처리할 주제 수
+        resume / from_stage: 주제마다 가장 최근 실행을 이어서(또는 지정 스테이지부터) 실행
+    """
+    def __init__(self, pipeline: Any, max_concurrency: int = 2, resume: bool = False,
+                 from_stage: Optional[str] = None) -> None:
+        self.pipeline = pipeline
+        self.max_concurrency = max(1, max_concurrency)
+        self.resume = resume
+        self.from_stage = from_stage
+
+    def run(self, topics: Iterable[str]) -> List[TopicResult]:
+        """
+        주제 목록 실행
+
+        Args:
+            topics: 분석할 주제 목록 (중복은 한 번만 실행)
+
+        Returns:
+            입력 순서대로 정렬된 주제별 결과
+        """
+        unique_topics = list(dict.fromkeys(topic.strip() for topic in topics if topic.strip()))
+        logger.info(f"Starting batch of {len(unique_topics)} topics (max concurrency: {self.max_concurrency})")
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="topic") as executor:
+            results = list(executor.map(self._run_topic, unique_topics))
+
+        logger.info(f"Batch finished:\n{self.format_summary(results)}")
+        return results
+
+    def _run_topic(self, topic: str) -> TopicResult:
+        """단일 주제 실행 (예외는 결과로 기록)"""
+        start = time.perf_counter()
+        try:
+            state = self.pipeline.run(topic, resume=self.resume, from_stage=self.from_stage)
+            return TopicResult(
+                topic=topic,
+                success=True,
+                latency=time.perf_counter() - start,
+                report_md_path=state.get("report_md_path"),
+                report_pdf_path=state.get("report_pdf_path")
+            )
+        except Exception as e:
+            logger.error(f"Batch topic failed: {topic}: {e}")
+            return TopicResult(
+                topic=topic,
+                success=False,
+                latency=time.perf_counter() - start,
+                error=f"{type(e).__name__}: {e}"
+            )
+
+    @staticmethod
+    def format_summary(results: List[TopicResult]) -> str:
+        """주제별 성공/실패 및 지연 시간 요약"""
+        lines = []
+        for result in results:
+            status = "OK  " if result.success else "FAIL"
+            detail = (result.report_pdf_path or result.report_md_path) if result.success else result.error
+            lines.append(f"[{status}] {result.latency:8.2f}s  {result.topic}  {detail or ''}")
+
+        succeeded = sum(1 for result in results if result.success)
+        latencies = sorted(result.latency for result in results)
+        if latencies:
+            lines.append(
+                f"{succeeded}/{len(results)} succeeded, "
+                f"latency min={latencies[0]:.2f}s max={latencies[-1]:.2f}s "
+                f"median={latencies[len(latencies) // 2]:.2f}s"
+            )
+        return "\n".join(lines)
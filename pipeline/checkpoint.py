@@ -0,0 +1,120 @@
+"""
+스테이지 체크포인트 저장소
+주제와 실행 ID별로 각 스테이지의 출력을 JSON으로 저장하여
+실패하거나 중단된 실행을 마지막 완료 스테이지부터 재개할 수 있게 합니다.
+"""
+import os
+import re
+import json
+import shutil
+import uuid
+import hashlib
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _json_default(value: Any) -> Any:
+    # 레코드 모델 등 to_dict를 제공하는 객체는 사전으로 저장
+    return value.to_dict() if hasattr(value, "to_dict") else str(value)
+
+
+class CheckpointStore:
+    """
+    주제/실행 ID 단위 스테이지 출력 저장소
+
+    Args:
+        root_dir: 저장 디렉토리
+        max_runs: 주제별 보관할 최대 실행 수 (새 실행을 시작할 때 오래된 실행부터 삭제, 0이면 무제한).
+            stale 보고서로 제공할 수 있도록 보고서가 있는 가장 최근 실행은 항상 남깁니다.
+    """
+    def __init__(self, root_dir: Path, max_runs: int = 20) -> None:
+        self.root_dir = Path(root_dir)
+        self.max_runs = max_runs
+
+    @staticmethod
+    def new_run_id() -> str:
+        """시간순 정렬이 가능한 실행 ID 생성"""
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+    @staticmethod
+    def topic_key(topic: str) -> str:
+        """주제를 파일시스템에 안전한 디렉토리명으로 변환"""
+        slug = re.sub(r'[^\w]+', '_', topic.strip()).strip('_')[:50] or "topic"
+        digest = hashlib.sha1(topic.strip().encode('utf-8')).hexdigest()[:8]
+        return f"{slug}_{digest}"
+
+    def _run_dir(self, topic: str, run_id: str) -> Path:
+        return self.root_dir / self.topic_key(topic) / run_id
+
+    def save_stage(self, topic: str, run_id: str, stage: str, outputs: Dict[str, Any]) -> Path:
+        """스테이지 출력 저장 (임시 파일 기록 후 교체하여 부분 기록 방지)"""
+        run_dir = self._run_dir(topic, run_id)
+        if not run_dir.exists():
+            run_dir.mkdir(parents=True, exist_ok=True)
+            self._prune(topic)
+
+        path = run_dir / f"{stage}.json"
+        tmp_path = path.with_suffix(".json.tmp")
+        payload = {
+            "topic": topic,
+            "run_id": run_id,
+            "stage": stage,
+            "saved_at": datetime.now().isoformat(),
+            "outputs": outputs
+        }
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, default=_json_default)
+        os.replace(tmp_path, path)
+
+        logger.info(f"Checkpoint saved: {path}")
+        return path
+
+    def _prune(self, topic: str) -> None:
+        """max_runs를 넘는 오래된 실행 삭제 (보고서가 있는 가장 최근 실행은 유지)"""
+        runs = self.list_runs(topic)
+        if not self.max_runs or len(runs) <= self.max_runs:
+            return
+        keep = self.latest_run_with_stage(topic, "report")
+        for run_id in runs[:len(runs) - self.max_runs]:
+            if run_id != keep:
+                shutil.rmtree(self._run_dir(topic, run_id), ignore_errors=True)
+                logger.info(f"Pruned checkpoint run {run_id} for topic '{topic}'")
+
+    def load_run(self, topic: str, run_id: str) -> Dict[str, Dict[str, Any]]:
+        """실행의 완료된 스테이지 출력 로드 (스테이지명 -> 출력)"""
+        run_dir = self._run_dir(topic, run_id)
+        if not run_dir.exists():
+            return {}
+
+        stages = {}
+        for path in sorted(run_dir.glob("*.json")):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    payload = json.load(f)
+                stages[payload["stage"]] = payload["outputs"]
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return stages
+
+    def list_runs(self, topic: str) -> List[str]:
+        """주제의 실행 ID 목록 (오래된 순)"""
+        topic_dir = self.root_dir / self.topic_key(topic)
+        if not topic_dir.exists():
+            return []
+        return sorted(path.name for path in topic_dir.iterdir() if path.is_dir())
+
+    def latest_run_id(self, topic: str) -> Optional[str]:
+        """주제의 가장 최근 실행 ID"""
+        runs = self.list_runs(topic)
+        return runs[-1] if runs else None
+
+    def latest_run_with_stage(self, topic: str, stage: str) -> Optional[str]:
+        """지정한 스테이지 체크포인트가 있는 가장 최근 실행 ID"""
+        for run_id in reversed(self.list_runs(topic)):
+            if (self._run_dir(topic, run_id) / f"{stage}.json").exists():
+                return run_id
+        return None
@@ -0,0 +1,282 @@
+"""
+파이프라인 DAG 스케줄러
+이름이 붙은 스테이지와 입출력 키 선언으로 의존성 그래프를 만들고,
+서로 독립적인 스테이지를 스레드 풀에서 동시에 실행합니다.
+"""
+import time
+import logging
+import contextvars
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Any, List, Callable, Tuple, Set, Optional
+from utils.decorators import retry
+
+logger = logging.getLogger(__name__)
+
+StageFunc = Callable[[Dict[str, Any]], Dict[str, Any]]
+StageCallback = Callable[[str, Dict[str, Any]], None]
+
+
+@dataclass
+class Stage:
+    """파이프라인 스테이지 정의"""
+    name: str
+    func: StageFunc
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    max_attempts: int = 1
+
+
+@dataclass
+class StageTiming:
+    """스테이지 실행 시간 기록"""
+    name: str
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+@dataclass
+class RunReport:
+    """파이프라인 실행 시간 보고서"""
+    wall_time: float
+    stages: Dict[str, StageTiming] = field(default_factory=dict)
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_time: float = 0.0
+
+    @property
+    def total_stage_time(self) -> float:
+        return sum(timing.duration for timing in self.stages.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "wall_time": round(self.wall_time, 3),
+            "total_stage_time": round(self.total_stage_time, 3),
+            "critical_path": self.critical_path,
+            "critical_path_time": round(self.critical_path_time, 3),
+            "stages": {
+                name: {
+                    "start": round(timing.start, 3),
+                    "end": round(timing.end, 3),
+                    "duration": round(timing.duration, 3)
+                }
+                for name, timing in self.stages.items()
+            }
+        }
+
+    def summary(self) -> str:
+        """로그 출력용 요약 문자열"""
+        stage_parts = ", ".join(
+            f"{name}={timing.duration:.2f}s" for name, timing in self.stages.items()
+        )
+        return (
+            f"wall={self.wall_time:.2f}s, stages_total={self.total_stage_time:.2f}s, "
+            f"critical_path={' -> '.join(self.critical_path)} ({self.critical_path_time:.2f}s) "
+            f"[{stage_parts}]"
+        )
+
+
+class PipelineGraph:
+    """스테이지 의존성 그래프"""
+    def __init__(self, stages: List[Stage]) -> None:
+        self.stages: Dict[str, Stage] = {}
+        self.producers: Dict[str, str] = {}
+
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage name: {stage.name}")
+            self.stages[stage.name] = stage
+            for key in stage.outputs:
+                if key in self.producers:
+                    raise ValueError(
+                        f"Output '{key}' is produced by both '{self.producers[key]}' and '{stage.name}'"
+                    )
+                self.producers[key] = stage.name
+
+        # 입력 키를 생산하는 스테이지가 곧 선행 스테이지
+        self.dependencies: Dict[str, Set[str]] = {
+            name: {
+                self.producers[key] for key in stage.inputs
+                if key in self.producers and self.producers[key] != name
+            }
+            for name, stage in self.stages.items()
+        }
+        self.order = self._topological_order()
+
+    @property
+    def external_inputs(self) -> Set[str]:
+        """어떤 스테이지도 생산하지 않아 초기 상태로 주어져야 하는 키"""
+        return {
+            key
+            for stage in self.stages.values()
+            for key in stage.inputs
+            if key not in self.producers
+        }
+
+    def _topological_order(self) -> List[str]:
+        """선언 순서를 유지하는 위상 정렬 (순환 검사 포함)"""
+        remaining = {name: set(deps) for name, deps in self.dependencies.items()}
+        order = []
+        while remaining:
+            ready = [name for name in self.stages if name in remaining and not remaining[name]]
+            if not ready:
+                raise ValueError(f"Cycle detected among stages: {sorted(remaining)}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    def descendants(self, name: str) -> Set[str]:
+        """주어진 스테이지의 출력에 (간접적으로) 의존하는 모든 스테이지"""
+        if name not in self.stages:
+            raise ValueError(f"Unknown stage: {name}")
+        result: Set[str] = set()
+        for candidate in self.order:
+            if self.dependencies[candidate] & (result | {name}):
+                result.add(candidate)
+        return result
+
+    def critical_path(self, timings: Dict[str, StageTiming]) -> Tuple[List[str], float]:
+        """실행 시간 기준 가장 긴 의존 경로 계산"""
+        best: Dict[str, Tuple[float, Optional[str]]] = {}
+        for name in self.order:
+            if name not in timings:
+                continue
+            prev = max(
+                (dep for dep in self.dependencies[name] if dep in best),
+                key=lambda dep: best[dep][0],
+                default=None
+            )
+            base = best[prev][0] if prev else 0.0
+            best[name] = (base + timings[name].duration, prev)
+
+        if not best:
+            return [], 0.0
+
+        tail = max(best, key=lambda name: best[name][0])
+        path = []
+        node: Optional[str] = tail
+        while node:
+            path.append(node)
+            node = best[node][1]
+        return list(reversed(path)), best[tail][0]
+
+
+class StageScheduler:
+    """의존성을 만족한 스테이지를 동시에 실행하는 스케줄러"""
+    def __init__(self, graph: PipelineGraph, max_workers: int = 4) -> None:
+        self.graph = graph
+        self.max_workers = max(1, max_workers)
+
+    def run(self, initial_state: Dict[str, Any],
+            completed: Optional[Dict[str, Dict[str, Any]]] = None,
+            on_stage_complete: Optional[StageCallback] = None,
+            on_stage_start: Optional[Callable[[str], None]] = None) -> Tuple[Dict[str, Any], RunReport]:
+        """
+        그래프 전체 실행
+
+        Args:
+            initial_state: 외부 입력 키를 포함한 초기 상태
+            completed: 이미 완료된 스테이지의 출력 (재실행하지 않음)
+            on_stage_complete: 스테이지 완료 시 (스테이지명, 출력)으로 호출되는 콜백
+            on_stage_start: 스테이지 제출 시 스테이지명으로 호출되는 콜백
+
+        Returns:
+            (최종 상태, 실행 시간 보고서)
+        """
+        missing = self.graph.external_inputs - set(initial_state)
+        if missing:
+            raise ValueError(f"Missing pipeline inputs: {sorted(missing)}")
+
+        state = dict(initial_state)
+        timings: Dict[str, StageTiming] = {}
+        pending = list(self.graph.order)
+        done: Set[str] = set()
+
+        # 완료된 스테이지의 출력 복원 (선행 스테이지도 복원된 경우에만)
+        completed = completed or {}
+        for name in self.graph.order:
+            stage = self.graph.stages[name]
+            outputs = completed.get(name)
+            if outputs is None or not self.graph.dependencies[name] <= done:
+                continue
+            if any(key not in outputs for key in stage.outputs):
+                continue
+            state.update({key: outputs[key] for key in stage.outputs})
+            pending.remove(name)
+            done.add(name)
+            logger.info(f"Skipping stage '{name}' (restored from checkpoint)")
+        running = {}
+        run_start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage") as executor:
+            while pending or running:
+                ready = [name for name in pending if self.graph.dependencies[name] <= done]
+                for name in ready:
+                    pending.remove(name)
+                    stage = self.graph.stages[name]
+                    stage_input = {key: state[key] for key in stage.inputs}
+                    logger.info(f"Starting stage: {name}")
+                    if on_stage_start:
+                        on_stage_start(name)
+                    # 재시도 예산 등 호출자의 컨텍스트 변수를 스테이지 스레드에서도 사용
+                    context = contextvars.copy_context()
+                    running[executor.submit(context.run, self._run_stage, stage, stage_input)] = name
+
+                if not running:
+                    raise RuntimeError(f"No runnable stages left: {pending}")
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        outputs, timing = future.result()
+                    except Exception as e:
+                        logger.error(f"Stage '{name}' failed: {e}")
+                        for other in running:
+                            other.cancel()
+                        raise
+
+                    state.update(outputs)
+                    timings[name] = timing
+                    done.add(name)
+                    logger.info(f"Stage '{name}' completed in {timing.duration:.2f} seconds")
+                    if on_stage_complete:
+                        on_stage_complete(name, outputs)
+
+        wall_time = time.perf_counter() - run_start
+        for timing in timings.values():
+            timing.start -= run_start
+            timing.end -= run_start
+
+        path, path_time = self.graph.critical_path(timings)
+        report = RunReport(
+            wall_time=wall_time,
+            stages={name: timings[name] for name in self.graph.order if name in timings},
+            critical_path=path,
+            critical_path_time=path_time
+        )
+        return state, report
+
+    @staticmethod
+    def _run_stage(stage: Stage, stage_input: Dict[str, Any]) -> Tuple[Dict[str, Any], StageTiming]:
+        """단일 스테이지 실행 및 선언된 출력 추출"""
+        func = stage.func
+        if stage.max_attempts > 1:
+            func = retry(max_attempts=stage.max_attempts)(func)
+
+        start = time.perf_counter()
+        result = func(stage_input)
+        end = time.perf_counter()
+
+        missing = [key for key in stage.outputs if key not in result]
+        if missing:
+            raise ValueError(f"Stage '{stage.name}' did not produce outputs: {missing}")
+
+        outputs = {key: result[key] for key in stage.outputs}
+        return outputs, StageTiming(stage.name, start, end)
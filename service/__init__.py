@@ -0,0 +1,11 @@
+"""
+Report generation HTTP service
+"""
+
+from .jobs import Job, JobManager, QueueFullError
+
+__all__ = [
+    'Job',
+    'JobManager',
+    'QueueFullError'
+]
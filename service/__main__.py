@@ -0,0 +1,5 @@
+import uvicorn
+from config import config
+
+if __name__ == "__main__":
+    uvicorn.run("service.api:app", host=config.service.host, port=config.service.port)
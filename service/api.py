@@ -0,0 +1,106 @@
+"""
+보고서 생성 HTTP 서비스
+작업 등록, 상태/스테이지 진행 조회, 산출물 다운로드 엔드포인트를 제공합니다.
+"""
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Optional, List, Dict, Any
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import FileResponse
+from pydantic import BaseModel, Field
+from service.jobs import JobManager, QueueFullError, ARTIFACT_KEYS
+from config import config, ensure_environment
+
+MEDIA_TYPES = {
+    "md": "text/markdown; charset=utf-8",
+    "pdf": "application/pdf",
+    "html": "text/html; charset=utf-8"
+}
+
+
+class JobRequest(BaseModel):
+    """작업 등록 요청"""
+    topic: str = Field(min_length=1)
+    resume: bool = Field(default=False)
+    from_stage: Optional[str] = Field(default=None)
+
+
+def _create_pipeline():
+    """워커가 공유할 파이프라인 생성 (서비스에서는 브라우저 자동 열기 비활성화)"""
+    from app import TrendAnalysisPipeline
+    pipeline = TrendAnalysisPipeline()
+    pipeline.auto_open_report = False
+    return pipeline
+
+
+def create_app(manager: Optional[JobManager] = None) -> FastAPI:
+    """FastAPI 애플리케이션 생성"""
+    manager = manager or JobManager(
+        pipeline_factory=_create_pipeline,
+        workers=config.service.workers,
+        max_queue=config.service.max_queue
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        ensure_environment()
+        manager.start()
+        yield
+        manager.stop(timeout=5)
+        from utils.llm import close_llm_clients
+        close_llm_clients()
+
+    app = FastAPI(title="Tech Trend Report Service", lifespan=lifespan)
+    app.state.jobs = manager
+
+    def _get_job(job_id: str):
+        job = manager.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job
+
+    @app.get("/health")
+    def health() -> Dict[str, Any]:
+        from utils.llm import get_rate_limiter, get_circuit_breaker
+        circuit = get_circuit_breaker().stats()
+        return {
+            "status": "degraded" if circuit["state"] != "closed" else "ok",
+            "workers": manager.workers,
+            "queue_size": manager.queue_size,
+            "llm_rate_limit": get_rate_limiter().stats(),
+            "llm_circuit": circuit
+        }
+
+    @app.post("/jobs", status_code=202)
+    def create_job(request: JobRequest) -> Dict[str, Any]:
+        stages = manager.pipeline.graph.stages if manager.pipeline else None
+        if request.from_stage and stages is not None and request.from_stage not in stages:
+            raise HTTPException(status_code=422, detail=f"Unknown stage: {request.from_stage}")
+        try:
+            job = manager.submit(request.topic, resume=request.resume, from_stage=request.from_stage)
+        except QueueFullError as e:
+            raise HTTPException(status_code=503, detail=str(e))
+        return job.to_dict()
+
+    @app.get("/jobs")
+    def list_jobs() -> List[Dict[str, Any]]:
+        return [job.to_dict() for job in manager.list()]
+
+    @app.get("/jobs/{job_id}")
+    def get_job(job_id: str) -> Dict[str, Any]:
+        return _get_job(job_id).to_dict()
+
+    @app.get("/jobs/{job_id}/artifacts/{kind}")
+    def download_artifact(job_id: str, kind: str) -> FileResponse:
+        if kind not in ARTIFACT_KEYS:
+            raise HTTPException(status_code=404, detail=f"Unknown artifact: {kind}")
+        job = _get_job(job_id)
+        path = job.artifacts.get(kind)
+        if not path or not Path(path).exists():
+            raise HTTPException(status_code=404, detail="Artifact not available")
+        return FileResponse(path, media_type=MEDIA_TYPES[kind], filename=Path(path).name)
+
+    return app
+
+
+app = create_app()
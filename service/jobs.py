@@ -0,0 +1,177 @@
+"""
+보고서 작업 큐와 워커 풀
+하나의 파이프라인 인스턴스(에이전트, LLM 클라이언트 공유)를 여러 워커 스레드가
+사용하여 대기열의 보고서 작업을 처리합니다.
+"""
+import time
+import uuid
+import queue
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_KEYS = {
+    "md": "report_md_path",
+    "pdf": "report_pdf_path",
+    "html": "report_html_path"
+}
+
+
+class QueueFullError(Exception):
+    """작업 대기열이 가득 찬 경우"""
+    pass
+
+
+@dataclass
+class Job:
+    """보고서 생성 작업"""
+    topic: str
+    resume: bool = False
+    from_stage: Optional[str] = None
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = "queued"  # queued / running / succeeded / failed
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    stages: Dict[str, str] = field(default_factory=dict)
+    artifacts: Dict[str, str] = field(default_factory=dict)
+    run_id: Optional[str] = None
+    stale: bool = False  # LLM 장애로 이전 실행의 보고서를 반환한 경우
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "topic": self.topic,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration": (self.finished_at - self.started_at) if self.finished_at and self.started_at else None,
+            "stages": dict(self.stages),
+            "artifacts": sorted(self.artifacts),
+            "run_id": self.run_id,
+            "stale": self.stale,
+            "error": self.error
+        }
+
+
+class JobManager:
+    """작업 대기열과 파이프라인 워커 풀"""
+    def __init__(self, pipeline_factory: Callable[[], Any], workers: int = 2,
+                 max_queue: int = 100, max_jobs: int = 1000) -> None:
+        self.pipeline_factory = pipeline_factory
+        self.workers = max(1, workers)
+        self.max_jobs = max_jobs
+        self.pipeline: Any = None
+
+        self._queue: "queue.Queue[Optional[Job]]" = queue.Queue(maxsize=max_queue)
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """파이프라인을 한 번 생성하고 워커 스레드 시작"""
+        if self._threads:
+            return
+        self.pipeline = self.pipeline_factory()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"report-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Started {self.workers} pipeline workers")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """워커 종료 (진행 중인 작업은 완료 후 종료)"""
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, topic: str, resume: bool = False, from_stage: Optional[str] = None) -> Job:
+        """작업 등록"""
+        job = Job(topic=topic, resume=resume, from_stage=from_stage)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._trim_jobs()
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                self._jobs.pop(job.id, None)
+            raise QueueFullError("Job queue is full")
+        logger.info(f"Queued job {job.id} for topic: {topic}")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    @property
+    def queue_size(self) -> int:
+        return self._queue.qsize()
+
+    def _trim_jobs(self) -> None:
+        """보관 개수를 넘으면 오래된 완료 작업부터 제거"""
+        overflow = len(self._jobs) - self.max_jobs
+        if overflow <= 0:
+            return
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished),
+            key=lambda job: job.created_at
+        )
+        for job in finished[:overflow]:
+            del self._jobs[job.id]
+
+    def _worker(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            try:
+                self._process(job)
+            finally:
+                self._queue.task_done()
+
+    def _process(self, job: Job) -> None:
+        """단일 작업 실행"""
+        job.status = "running"
+        job.started_at = time.time()
+
+        def progress(stage: str, status: str) -> None:
+            job.stages[stage] = status
+
+        try:
+            state = self.pipeline.run(
+                job.topic,
+                resume=job.resume,
+                from_stage=job.from_stage,
+                progress=progress
+            )
+            job.run_id = state.get("run_id")
+            job.stale = bool(state.get("stale"))
+            job.artifacts = {
+                kind: state[key] for kind, key in ARTIFACT_KEYS.items() if state.get(key)
+            }
+            job.status = "succeeded"
+        except Exception as e:
+            logger.error(f"Job {job.id} failed: {e}")
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = "failed"
+            for stage, status in job.stages.items():
+                if status == "running":
+                    job.stages[stage] = "failed"
+        finally:
+            job.finished_at = time.time()
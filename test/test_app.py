@@ -0,0 +1,99 @@
+import logging
+import threading
+from concurrent.futures import Future
+from types import SimpleNamespace
+from app import TrendAnalysisPipeline
+from config import config
+from data.data_collector import DataCollector
+from pipeline import StageScheduler, CheckpointStore
+from utils.exceptions import CircuitOpenError
+
+
+def _open_circuit_collector():
+    collector = DataCollector.__new__(DataCollector)
+    collector.logger = logging.getLogger("test.app")
+    collector.prompts = {"research_prompt.txt": "Collect research data about {query}"}
+    collector.research_cache = SimpleNamespace(lookup=lambda query: None)
+
+    def invoke(prompt, validate=None):
+        raise CircuitOpenError("LLM circuit is open")
+
+    collector._invoke = invoke
+    return collector
+
+
+def _pipeline(tmp_path):
+    pipeline = TrendAnalysisPipeline.__new__(TrendAnalysisPipeline)
+    collector = _open_circuit_collector()
+    pipeline.research_agent = lambda topic: collector.collect_research_data(topic)
+    pipeline.summary_agent = lambda state: {"tech_summary": "summary", "summary_timestamp": "t"}
+    pipeline.prediction_agent = lambda state: {"trend_prediction": "prediction", "prediction_timestamp": "t"}
+    pipeline.risk_agent = lambda state: {"risk_analysis": "risk", "risk_timestamp": "t"}
+    pipeline.auto_open_report = False
+    pipeline._pending_renders, pipeline._render_lock = {}, threading.Lock()
+    pipeline.graph = pipeline._build_graph()
+    pipeline.scheduler = StageScheduler(pipeline.graph, max_workers=2)
+    pipeline.checkpoints = CheckpointStore(tmp_path)
+    return pipeline
+
+
+def test_open_circuit_serves_stale_report(tmp_path):
+    """회로가 열려 수집이 실패하면 빈 보고서 대신 이전 실행의 보고서를 stale로 반환"""
+    topic = "autonomous agents"
+    pipeline = _pipeline(tmp_path)
+    pipeline.checkpoints.save_stage(topic, "20240101_000000", "research", {
+        "research_data": {"query": topic, "papers": [{"title": "Agent planning"}]},
+        "quality_metrics": {}, "timestamp": "20240101_000000"
+    })
+    pipeline.checkpoints.save_stage(topic, "20240101_000000", "report", {
+        "final_report": "# Previous report", "report_md_path": "reports/previous.md"
+    })
+
+    result = pipeline.run(topic)
+
+    assert result["stale"] is True and "circuit is open" in result["stale_reason"]
+    assert result["run_id"] == "20240101_000000"
+    assert result["final_report"] == "# Previous report"
+    assert result["research_data"]["papers"]
+
+
+class FakeReportAgent:
+    def __init__(self):
+        self.futures = {"pdf": Future(), "html": Future()}
+
+    def compose(self, state):
+        return dict(state, final_report="# Report", references=[], report_timestamp=state["timestamp"])
+
+    def save_markdown(self, state):
+        return "report.md"
+
+    def _report_path(self, state, kind):
+        return f"report.{kind}"
+
+    def render_pdf_async(self, state):
+        return self.futures["pdf"]
+
+    def render_html_async(self, state):
+        return self.futures["html"]
+
+
+def test_background_render_returns_before_files_exist(tmp_path, monkeypatch):
+    """백그라운드 렌더링은 완료를 기다리지 않고, 렌더링이 성공한 뒤에만 체크포인트를 기록"""
+    monkeypatch.setattr(config.render, "background", True)
+    pipeline = _pipeline(tmp_path)
+    pipeline.research_agent = lambda topic: {"research_data": {}, "quality_metrics": {}, "timestamp": "t"}
+    pipeline._run_compact = lambda state: {"research_digest": {}}
+    pipeline.report_agent = FakeReportAgent()
+    pipeline.graph = pipeline._build_graph()
+    pipeline.scheduler.graph = pipeline.graph
+
+    result = pipeline.run("autonomous agents", run_id="run")
+
+    assert result["report_pdf_path"] == "report.pdf" and set(result["render_futures"]) == {"pdf", "html"}
+    assert "render_pdf" not in pipeline.checkpoints.load_run("autonomous agents", "run")
+
+    pipeline.report_agent.futures["pdf"].set_result("report.pdf")
+    pipeline.report_agent.futures["html"].set_exception(OSError("disk full"))
+    stages = pipeline.checkpoints.load_run("autonomous agents", "run")
+    assert "render_pdf" in stages and "render_html" not in stages
+
@@ -0,0 +1,57 @@
+import time
+import threading
+import pytest
+from pipeline import BatchRunner, load_topics
+from app import main
+
+
+class FakePipeline:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def run(self, topic, resume=False, from_stage=None):
+        with self._lock:
+            self.calls.append((topic, resume, from_stage))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(0.05)
+            if topic in self.failing:
+                raise RuntimeError("LLM quota exceeded")
+            return {"report_md_path": f"{topic}.md", "report_pdf_path": f"{topic}.pdf"}
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+def test_bounded_concurrency_and_failed_topic():
+    """동시 실행 수를 제한하고, 한 주제의 실패는 나머지 주제에 영향을 주지 않음"""
+    pipeline = FakePipeline(failing={"b"})
+    results = BatchRunner(pipeline, max_concurrency=2).run(["a", "b", "c", "d", "a", " "])
+
+    assert [result.topic for result in results] == ["a", "b", "c", "d"]
+    assert [result.success for result in results] == [True, False, True, True]
+    assert results[1].error == "RuntimeError: LLM quota exceeded" and results[2].report_pdf_path == "c.pdf"
+    assert pipeline.peak == 2
+    assert "3/4 succeeded" in BatchRunner.format_summary(results)
+
+
+def test_resume_options_are_passed_to_each_topic():
+    """--resume/--from-stage는 배치의 모든 주제에 적용"""
+    pipeline = FakePipeline()
+    BatchRunner(pipeline, max_concurrency=1, resume=True, from_stage="report").run(["a", "b"])
+    assert pipeline.calls == [("a", True, "report"), ("b", True, "report")]
+
+
+def test_run_id_is_rejected_with_multiple_topics(tmp_path):
+    """실행 ID는 주제별이므로 여러 주제와 함께 지정하면 실행하지 않고 종료"""
+    topics = tmp_path / "topics.txt"
+    topics.write_text("# 주제 목록\n자율 에이전트\n\n멀티모달 AI\n", encoding="utf-8")
+    assert load_topics(str(topics)) == ["자율 에이전트", "멀티모달 AI"]
+
+    with pytest.raises(SystemExit, match="--run-id"):
+        main(["--topics-file", str(topics), "--resume", "--run-id", "20250101_120000_ab12cd"])
@@ -0,0 +1,47 @@
+from benchmarks.generators import generate_research_data, generate_llm_response
+from benchmarks.runner import BenchmarkCase, run_benchmarks, compare_results
+
+
+def test_generators_are_deterministic():
+    """같은 시드는 같은 데이터를 생성"""
+    assert generate_research_data(20) == generate_research_data(20)
+    assert len(generate_research_data(20)["papers"]) == 20
+    assert "```json" in generate_llm_response(5)
+
+
+def test_run_and_compare_flags_regression():
+    """결과 문서 생성, 최대 크기 초과 건너뛰기, 회귀 비교"""
+    case = BenchmarkCase("sum", lambda size: (lambda: sum(range(size))), max_size=1_000)
+    document = run_benchmarks([case], [100, 10_000], repeats=2)
+
+    ok, skipped = document["results"]
+    assert ok["status"] == "ok" and ok["repeats"] == 2 and ok["peak_memory_bytes"] is not None
+    assert skipped["status"] == "skipped"
+
+    slower = {"results": [dict(ok, median_seconds=ok["median_seconds"] * 2)]}
+    rows = compare_results(document, slower, threshold=0.1)
+    assert len(rows) == 1 and rows[0]["regression"]
+    assert not compare_results(document, document)[0]["regression"]
+
+
+def test_empty_output_is_not_measured():
+    """하위 분석이 모두 실패해 빈 결과를 반환하는 케이스는 시간을 기록하지 않음"""
+    calls = []
+
+    def setup(size):
+        return lambda: calls.append(size) or {"research_trends": {}, "market_trends": {}}
+
+    empty = BenchmarkCase("empty", setup)
+    checked = BenchmarkCase("checked", lambda size: (lambda: [size]), check=lambda output: output == [0])
+    failed, rejected = run_benchmarks([empty, checked], [10])["results"]
+    assert failed["status"] == "error" and failed["median_seconds"] is None and len(calls) == 1
+    assert rejected["status"] == "error" and "InvalidOutput" in rejected["error"]
+
+
+def test_analysis_cases_produce_integrated_output():
+    """분석 케이스는 통합 분석 단계까지 결과를 채워야 측정됨"""
+    from benchmarks.cases import select_cases
+
+    cases = select_cases(["network.collaboration", "trend.technology_trends"])
+    results = run_benchmarks(cases, [100], repeats=1)["results"]
+    assert [result["status"] for result in results] == ["ok", "ok"]
@@ -0,0 +1,46 @@
+from pipeline import CheckpointStore
+
+def test_checkpoint_roundtrip(tmp_path):
+    """스테이지 체크포인트 저장 및 로드 테스트"""
+    store = CheckpointStore(tmp_path)
+    topic = "인공지능 기반 자율 에이전트 기술"
+    run_id = store.new_run_id()
+
+    store.save_stage(topic, run_id, "research", {"research_data": {"papers": []}, "timestamp": "20250101_000000"})
+    store.save_stage(topic, run_id, "summary", {"tech_summary": "요약"})
+
+    assert store.latest_run_id(topic) == run_id
+    restored = store.load_run(topic, run_id)
+    assert restored["summary"] == {"tech_summary": "요약"}
+    assert restored["research"]["timestamp"] == "20250101_000000"
+
+def test_unknown_topic_has_no_runs(tmp_path):
+    """체크포인트가 없는 주제 테스트"""
+    store = CheckpointStore(tmp_path)
+    assert store.latest_run_id("없는 주제") is None
+    assert store.load_run("없는 주제", "missing") == {}
+
+def test_latest_run_with_stage(tmp_path):
+    """스테이지가 완료된 가장 최근 실행 조회 테스트"""
+    store = CheckpointStore(tmp_path)
+    topic = "자율 에이전트"
+    store.save_stage(topic, "20250101_000000_aaaaaa", "report", {"final_report": "이전 보고서"})
+    store.save_stage(topic, "20250102_000000_bbbbbb", "research", {"research_data": {}})
+
+    assert store.latest_run_id(topic) == "20250102_000000_bbbbbb"
+    assert store.latest_run_with_stage(topic, "report") == "20250101_000000_aaaaaa"
+    assert store.latest_run_with_stage(topic, "render_pdf") is None
+
+def test_old_runs_are_pruned(tmp_path):
+    """주제별 실행 수가 max_runs를 넘으면 오래된 실행부터 삭제 (보고서가 있는 최근 실행은 유지)"""
+    store = CheckpointStore(tmp_path, max_runs=2)
+    topic = "자율 에이전트"
+    store.save_stage(topic, "20250101_000000_aaaaaa", "report", {"final_report": "이전 보고서"})
+    for day in range(2, 6):
+        store.save_stage(topic, f"2025010{day}_000000_bbbbbb", "research", {"research_data": {}})
+    store.save_stage(topic, "20250105_000000_bbbbbb", "summary", {"tech_summary": "요약"})
+
+    assert store.list_runs(topic) == ["20250101_000000_aaaaaa", "20250104_000000_bbbbbb", "20250105_000000_bbbbbb"]
+    assert store.load_run(topic, "20250101_000000_aaaaaa")["report"] == {"final_report": "이전 보고서"}
+    assert set(store.load_run(topic, "20250105_000000_bbbbbb")) == {"research", "summary"}
+    assert store.list_runs("다른 주제") == []
@@ -0,0 +1,90 @@
+import time
+import pytest
+from types import SimpleNamespace
+from utils.circuit_breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from utils.exceptions import CircuitOpenError, ValidationError
+from utils.retry import call_with_retry
+
+
+class FakeServerError(Exception):
+    def __init__(self, status=503):
+        super().__init__(f"HTTP {status}")
+        self.response = SimpleNamespace(status_code=status, headers={})
+
+
+def _call(breaker, error=None):
+    with breaker.guard():
+        if error is not None:
+            raise error
+
+
+def _trip(breaker, count):
+    for _ in range(count):
+        with pytest.raises(FakeServerError):
+            _call(breaker, FakeServerError())
+
+
+def test_opens_on_error_rate_and_fails_fast():
+    """오류 비율이 임계값을 넘으면 회로가 열리고 이후 호출은 즉시 거부"""
+    breaker = CircuitBreaker(failure_threshold=0.5, min_calls=4, open_seconds=60)
+    _call(breaker)
+    _call(breaker)
+    _trip(breaker, 1)
+    assert breaker.state == CLOSED
+    _trip(breaker, 1)
+    assert breaker.state == OPEN and breaker.is_open
+
+    with pytest.raises(CircuitOpenError):
+        _call(breaker)
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_client_errors_do_not_count():
+    """잘못된 요청 등 공급자 상태와 무관한 오류는 집계하지 않음"""
+    breaker = CircuitBreaker(min_calls=2)
+    for error in (ValidationError("bad"), FakeServerError(400), FakeServerError(401)):
+        with pytest.raises(type(error)):
+            _call(breaker, error)
+    assert breaker.state == CLOSED and breaker.stats()["window_calls"] == 0
+
+
+def test_probe_closes_or_reopens_circuit():
+    """대기 시간 후 시험 호출이 성공하면 닫히고, 실패하면 대기 시간을 늘려 다시 열림"""
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0.05, max_open_seconds=1.0)
+    _trip(breaker, 1)
+    time.sleep(0.06)
+    _trip(breaker, 1)  # 시험 호출 실패
+    assert breaker.state == OPEN and breaker.retry_in() > 0.05
+
+    time.sleep(0.11)
+    _call(breaker)
+    assert breaker.state == CLOSED
+
+
+def test_only_one_probe_at_a_time():
+    """half-open 상태에서는 시험 호출 하나만 허용"""
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0.01)
+    _trip(breaker, 1)
+    time.sleep(0.02)
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_open_circuit_is_not_retried():
+    """회로가 열려 실패한 호출은 다른 예외로 감싸져 있어도 재시도하지 않음"""
+    breaker = CircuitBreaker(min_calls=1, open_seconds=60)
+    _trip(breaker, 1)
+    calls = []
+
+    def stage():
+        calls.append(1)
+        try:
+            _call(breaker)
+        except CircuitOpenError as e:
+            raise RuntimeError("stage failed") from e
+
+    with pytest.raises(RuntimeError):
+        call_with_retry(stage, max_attempts=3, sleep=lambda _: None)
+    assert len(calls) == 1
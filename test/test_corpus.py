@@ -0,0 +1,46 @@
+from data.corpus import ResearchCorpus, fts_query
+from data.models import Paper, Patent
+
+
+def _run(title_suffix=""):
+    return {
+        "papers": [
+            {"title": "Autonomous Agents for Planning" + title_suffix, "key_findings": ["tool use improves planning"]},
+            {"title": "Diffusion Models in Vision", "key_findings": ["image synthesis"], "citations": 5}
+        ],
+        "patents": [{"title": "Agent orchestration system", "patent_number": "US 11,234,567 B2"}],
+        "news": [],
+        "investments": []
+    }
+
+
+def test_upsert_deduplicates_across_runs(tmp_path):
+    """식별 키가 같은 항목은 실행이 달라도 하나로 합쳐지고 새 값으로 갱신"""
+    corpus = ResearchCorpus(tmp_path / "corpus.sqlite3")
+    assert corpus.upsert(_run(), "자율 에이전트") == {"inserted": 3, "updated": 0}
+
+    second = _run()
+    second["papers"][1] = {"title": "diffusion models in vision!", "citations": 40}
+    second["patents"][0] = {"title": "Renamed patent", "patent_number": "us11234567b2"}
+    assert corpus.upsert(second, "멀티모달 AI") == {"inserted": 0, "updated": 3}
+
+    stats = corpus.stats()
+    assert stats["papers"] == 2 and stats["patents"] == 1
+    _, paper = corpus.search("diffusion", ["papers"])[0]
+    assert isinstance(paper, Paper) and paper.citations == 40 and paper.key_findings == ["image synthesis"]
+
+
+def test_search_and_topic_lookup(tmp_path):
+    """전문 검색은 접두어로 매칭하고, 주제 조회는 같은 질의로 수집한 항목을 먼저 반환"""
+    corpus = ResearchCorpus(tmp_path / "corpus.sqlite3")
+    corpus.upsert(_run(), "자율 에이전트")
+
+    results = corpus.search("agent orchestr")
+    assert {category for category, _ in results} == {"papers", "patents"}
+    assert isinstance(dict(results)["patents"], Patent)
+
+    topic = corpus.for_topic("자율 에이전트", limit=5)
+    assert len(topic["papers"]) == 2 and len(topic["patents"]) == 1
+    related = corpus.for_topic("새 주제", aliases=["planning"], limit=5)
+    assert [paper.title for paper in related["papers"]] == ["Autonomous Agents for Planning"]
+    assert fts_query('NEAR("x") AND y*') == '"near"* OR "x"* OR "and"* OR "y"*'
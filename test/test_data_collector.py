@@ -0,0 +1,95 @@
+import time
+import logging
+import threading
+import pytest
+from types import SimpleNamespace
+from data.data_collector import DataCollector
+from utils.exceptions import CircuitOpenError
+from utils.retry import caused_by
+from config import config
+
+
+def _research_data(status, **items):
+    data = {category: [] for category in status}
+    data.update(items)
+    data["collection_status"] = status
+    return data
+
+
+def test_only_successful_collections_are_cached():
+    """항목을 얻은 카테고리가 없거나 시간 초과가 있으면 유사 주제 캐시에 저장하지 않음"""
+    failed = {"papers": "error", "news": "error", "patents": "empty", "investments": "error"}
+    assert not DataCollector._is_cacheable(_research_data(failed))
+
+    all_empty = dict.fromkeys(failed, "empty")
+    assert not DataCollector._is_cacheable(_research_data(all_empty))
+
+    partial = dict(failed, papers="ok")
+    assert DataCollector._is_cacheable(_research_data(partial, papers=[{"title": "A"}]))
+    assert not DataCollector._is_cacheable(_research_data(dict(partial, news="timeout"), papers=[{"title": "A"}]))
+
+
+def _failing_collector(error):
+    collector = DataCollector.__new__(DataCollector)
+    collector.logger = logging.getLogger("test.data_collector")
+    collector.prompts = {"research_prompt.txt": "Collect research data about {query}"}
+    collector.research_cache = SimpleNamespace(lookup=lambda query: None)
+
+    def invoke(prompt, validate=None):
+        if isinstance(error, Exception):
+            raise error
+        return SimpleNamespace(content=error)
+
+    collector._invoke = invoke
+    return collector
+
+
+def test_open_circuit_is_not_swallowed():
+    """회로 열림은 빈 수집 결과가 아니라 예외로 전달 (개별 수집 폴백도 같음)"""
+    collector = _failing_collector(CircuitOpenError("LLM circuit is open"))
+    with pytest.raises(CircuitOpenError):
+        collector._collect_complete_data("autonomous agents")
+    with pytest.raises(CircuitOpenError):
+        collector._collect_categories_parallel("autonomous agents")
+    with pytest.raises(Exception) as excinfo:
+        collector.collect_research_data("autonomous agents")
+    assert caused_by(excinfo.value, CircuitOpenError)
+
+
+def test_unparseable_response_still_falls_back():
+    """응답 파싱 실패는 공급자 오류가 아니므로 기존처럼 빈 결과로 처리"""
+    collector = _failing_collector("not json")
+    assert collector._collect_complete_data("autonomous agents") == {}
+    results, status = collector._collect_categories_parallel("autonomous agents")
+    assert set(status.values()) == {"empty"} and not any(results.values())
+
+
+def test_slow_or_failing_category_does_not_block_others(monkeypatch):
+    """한 카테고리가 시간 초과되거나 실패해도 나머지 카테고리 결과는 반환"""
+    monkeypatch.setattr(config.collector, "category_timeout_seconds",
+                        {"papers": 5.0, "news": 0.1, "patents": 5.0, "investments": 5.0})
+    release = threading.Event()
+    collector = _failing_collector("not json")
+
+    def slow_news(query):
+        release.wait(5.0)
+        return [{"title": "late"}]
+
+    def broken_patents(query):
+        raise ValueError("unexpected patents payload")
+
+    collector._collect_papers = lambda query: [{"title": "Agent planning"}]
+    collector._collect_news = slow_news
+    collector._collect_patents = broken_patents
+    collector._collect_investments = lambda query: []
+    try:
+        started = time.monotonic()
+        results, status = collector._collect_categories_parallel("autonomous agents")
+        elapsed = time.monotonic() - started
+    finally:
+        release.set()
+
+    assert status == {"papers": "ok", "news": "timeout", "patents": "error", "investments": "empty"}
+    assert results["papers"] == [{"title": "Agent planning"}] and results["news"] == []
+    assert elapsed < 2.0
+
@@ -0,0 +1,36 @@
+from pathlib import Path
+from utils.glossary import AhoCorasick, Glossary, TranslationMemo, load_glossary_file
+
+GLOSSARY_PATH = Path(__file__).parent.parent / "assets" / "glossary" / "ko_en.tsv"
+
+
+def test_matcher_prefers_leftmost_longest():
+    """겹치는 용어 중 가장 왼쪽/가장 긴 용어를 선택"""
+    matcher = AhoCorasick(["에이전트", "자율 에이전트", "전트", "자율"])
+    assert matcher.find_longest("자율 에이전트 전트") == [(0, 7), (8, 10)]
+    assert sorted(AhoCorasick(["he", "she", "hers"]).find_all("ushers")) == [(1, 4), (2, 4), (2, 6)]
+
+
+def test_glossary_translates_ignoring_spacing():
+    """띄어쓰기가 달라도 용어집만으로 번역되면 번역문을, 남는 한국어가 있으면 None을 반환"""
+    glossary = Glossary({"자율 에이전트": "Autonomous Agents", "강화학습": "Reinforcement Learning", "기반": "based"})
+    assert glossary.translate("강화학습 기반 자율에이전트") == "Reinforcement Learning based Autonomous Agents"
+    assert glossary.translate("자율 에이전트의 미래") is None
+    assert glossary.matched_terms("자율 에이전트의 미래와 자율에이전트") == ["Autonomous Agents"]
+
+
+def test_bundled_glossary_covers_default_topic():
+    """기본 용어집으로 기본 주제가 LLM 없이 번역됨"""
+    glossary = Glossary(load_glossary_file(GLOSSARY_PATH))
+    assert len(glossary) > 100
+    assert glossary.translate("인공지능 기반 자율 에이전트 기술") == "AI-based Autonomous Agent Technology"
+    assert glossary.translate("대규모 언어 모델 및 강화학습") == "Large Language Model and Reinforcement Learning"
+
+
+def test_translation_memo_persists(tmp_path):
+    """번역 메모는 정규화한 키로 파일에 저장되어 새 인스턴스에서도 조회됨"""
+    path = tmp_path / "memo" / "translations.json"
+    TranslationMemo(path).put("자율  에이전트 ", "Autonomous Agents")
+    memo = TranslationMemo(path)
+    assert memo.get("자율 에이전트") == "Autonomous Agents"
+    assert memo.get("딥러닝") is None
@@ -0,0 +1,53 @@
+from datetime import date
+from data.incremental import latest_dates, format_cutoffs, merge_delta
+
+
+def _previous():
+    return {
+        "papers": [
+            {"title": "Agent Planning", "publication_date": "2024-03-01", "citations": 5},
+            {"title": "Tool Use", "publication_date": "2024-05-10"}
+        ],
+        "news": [{"title": "Launch", "source": "Wire", "date": "2024-06"}],
+        "patents": [{"title": "Undated patent"}],
+        "investments": []
+    }
+
+
+def test_latest_dates_per_category():
+    """카테고리별 최신 날짜를 구하고 날짜가 없으면 None"""
+    cutoffs = latest_dates(_previous())
+    assert cutoffs == {
+        "papers": date(2024, 5, 10),
+        "news": date(2024, 6, 1),
+        "patents": None,
+        "investments": None
+    }
+    text = format_cutoffs(cutoffs)
+    assert "- papers: publication_date > 2024-05-10" in text
+    assert "- patents: no previous items" in text
+
+
+def test_merge_delta_dedupes_and_updates():
+    """같은 식별 키의 항목은 갱신하고 새 항목만 추가하며 최신순으로 정렬"""
+    delta = {
+        "papers": [
+            {"title": "Agent Planning", "citations": 9},
+            {"title": "World Models", "publication_date": "2024-07-01"}
+        ],
+        "news": []
+    }
+    merged, counts = merge_delta(_previous(), delta)
+
+    assert counts["papers"] == {"added": 1, "updated": 1}
+    assert counts["news"] == {"added": 0, "updated": 0}
+    assert [paper.title for paper in merged["papers"]] == ["World Models", "Tool Use", "Agent Planning"]
+    updated = merged["papers"][2]
+    assert updated.citations == 9 and updated.publication_date == date(2024, 3, 1)
+    assert len(merged["news"]) == 1 and len(merged["patents"]) == 1
+
+
+def test_merge_delta_keeps_newest_items():
+    """max_items를 넘으면 가장 최근 항목만 남김"""
+    merged, _ = merge_delta(_previous(), {"papers": [{"title": "New", "publication_date": "2025-01-01"}]}, max_items=2)
+    assert [paper.title for paper in merged["papers"]] == ["New", "Tool Use"]
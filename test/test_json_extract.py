@@ -0,0 +1,28 @@
+import json
+from utils.json_extract import extract_json, scan_json_spans, remove_trailing_commas
+
+
+def test_prefers_fenced_block_and_repairs_trailing_commas():
+    """코드 블록 안의 JSON을 우선하고 후행 쉼표를 보정"""
+    text = 'Here is {"draft": 1}\n```json\n{"papers": [{"title": "A"},],}\n```\nDone.'
+    assert json.loads(extract_json(text)) == {"papers": [{"title": "A"}]}
+
+
+def test_ignores_brackets_inside_strings_and_trailing_prose():
+    """문자열 안의 괄호와 뒤따르는 설명 문장을 무시"""
+    text = 'Sure! {"title": "x}]", "items": [1, 2]} Let me know { if more'
+    assert json.loads(extract_json(text)) == {"title": "x}]", "items": [1, 2]}
+
+
+def test_finds_object_inside_unclosed_outer_bracket():
+    """닫히지 않은 바깥 괄호 안에서 완결된 JSON도 찾음"""
+    assert json.loads(extract_json('[[ {"a": 1} and then nothing')) == {"a": 1}
+    assert extract_json("no json here") is None
+
+
+def test_scanner_handles_adversarial_input():
+    """짝이 맞지 않는 괄호가 많은 입력도 선형 스캔으로 처리"""
+    text = "{[" * 50_000 + '] {"ok": true}'
+    assert scan_json_spans(text)[-1] == (len(text) - 12, len(text))
+    assert json.loads(extract_json(text)) == {"ok": True}
+    assert remove_trailing_commas('{"a": ",}", "b": [1,],}') == '{"a": ",}", "b": [1]}'
@@ -0,0 +1,64 @@
+import json
+import pytest
+from utils.json_stream import RecordStreamParser, StreamSchemaError
+
+SCHEMA = {"papers": ("title",), "investments": ("company",)}
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_records_are_yielded_as_they_close():
+    """레코드가 닫히는 즉시 반환되고 청크 경계와 무관하게 같은 결과"""
+    document = {
+        "papers": [{"title": "A {x}", "authors": ["k"]}, {"title": "B", "url": "https://a.b//c"}],
+        "tech_categories": ["agents"],
+        "investments": [{"company": "C", "investors": ["F"]}]
+    }
+    text = "Sure:\n```json\n" + json.dumps(document) + "\n```"
+
+    for size in (1, 3, 64):
+        parser = RecordStreamParser(SCHEMA)
+        yielded = [record for chunk in _chunks(text, size) for record in parser.feed(chunk)]
+        assert [category for category, _ in yielded] == ["papers", "papers", "investments"]
+        assert parser.close() == document
+
+
+def test_tolerates_template_comments_and_trailing_commas():
+    """템플릿 주석과 후행 쉼표 허용"""
+    parser = RecordStreamParser(SCHEMA)
+    parser.feed('{"papers": [{"title": "A",}, // 5-10개\n], "investments": []}')
+    assert parser.close()["papers"] == [{"title": "A"}]
+
+
+def test_schema_break_aborts_after_valid_records():
+    """스키마를 벗어나면 그 전에 완성된 레코드만 남기고 중단"""
+    parser = RecordStreamParser(SCHEMA)
+    assert len(parser.feed('{"papers": [{"title": "A"}, ')) == 1
+    with pytest.raises(StreamSchemaError):
+        parser.feed('{"name": "no title"}, {"title": "never parsed"}]}')
+    assert parser.records["papers"] == [{"title": "A"}]
+
+    with pytest.raises(StreamSchemaError):
+        RecordStreamParser(SCHEMA).feed('{"papers": "none"}')
+    incomplete = RecordStreamParser(SCHEMA)
+    incomplete.feed('{"papers": []}')
+    with pytest.raises(StreamSchemaError):
+        incomplete.close()
+
+
+@pytest.mark.parametrize("preamble", [
+    "Source: https://example.com/agents ",
+    "Results [JSON] below:\n",
+    "결과 (출처: https://arxiv.org/list/cs.AI) [요약]:\n```json\n"
+])
+def test_preamble_with_urls_and_brackets_is_ignored(preamble):
+    """객체 시작 전 설명 문장의 URL(//)과 괄호는 주석이나 최상위 값으로 해석하지 않음"""
+    document = {"papers": [{"title": "A"}], "investments": [{"company": "C"}]}
+    text = preamble + json.dumps(document)
+    for size in (1, 7, len(text)):
+        parser = RecordStreamParser(SCHEMA)
+        for chunk in _chunks(text, size):
+            parser.feed(chunk)
+        assert parser.close() == document
@@ -0,0 +1,55 @@
+import random
+from collections import Counter
+from analysis.keyword_sketch import CountMinSketch, SpaceSaving, StreamingKeywordSketch
+
+
+def _stream(seed=0, n=20_000):
+    """상위 몇 개 단어가 빈도를 지배하는 지프 분포 토큰 스트림"""
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(2000)]
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    return rng.choices(words, weights, k=n)
+
+
+def test_count_min_never_underestimates():
+    """추정값은 실제 빈도 이상이고 오차 한계 안"""
+    tokens = _stream()
+    sketch = CountMinSketch.from_error(epsilon=0.01, delta=0.01)
+    for token in tokens:
+        sketch.add(token)
+    for word, count in Counter(tokens).most_common(50):
+        assert count <= sketch.estimate(word) <= count + sketch.error_bound
+
+
+def test_space_saving_bounds_and_top_items():
+    """추적 항목의 실제 빈도는 [count - error, count] 안이며 상위 항목을 찾음"""
+    tokens = _stream(seed=1)
+    summary = SpaceSaving(capacity=100)
+    for token in tokens:
+        summary.add(token)
+    counts = Counter(tokens)
+    assert len(summary) == 100
+    for item, count, error in summary.items():
+        assert count - error <= counts[item] <= count
+    tracked = {item for item, _, _ in summary.items()}
+    assert {word for word, _ in counts.most_common(5)} <= tracked
+
+
+def test_streaming_sketch_windows_and_memory_bound():
+    """구간별 상위 키워드와 오차 범위를 반환하고 오래된 구간은 삭제"""
+    sketch = StreamingKeywordSketch(str.split, width=512, depth=4, capacity=50, max_windows=2)
+    sketch.update(["agent agent robot", "agent model"], window="2024-01")
+    sketch.update(["quantum quantum chip"], window="2024-02")
+    sketch.update_tokens(["quantum", "agent"], window="2024-02")
+
+    top = sketch.top_k(2, window="2024-01")
+    assert [item["keyword"] for item in top] == ["agent", "model"]
+    assert top[0]["frequency"] == top[0]["lower_bound"] == 3
+    assert sketch.top_k(1)[0] == {
+        "keyword": "agent", "frequency": 4, "score": 4 / 10, "lower_bound": 4, "upper_bound": 4
+    }
+    assert sketch.window_stats("2024-01")["documents"] == 2
+
+    sketch.update(["new window"], window="2024-03")
+    assert sketch.windows == ["2024-02", "2024-03"]
+    assert sketch.estimate("robot") == 0
@@ -0,0 +1,103 @@
+import sys
+import time
+import json
+import pytest
+from types import SimpleNamespace
+from utils import llm
+from utils.llm_cache import LLMCache
+from utils.token_budget import _get_encoding
+
+def test_cache_key_depends_on_model_settings():
+    """모델 설정별 캐시 키 분리 테스트"""
+    key = LLMCache.make_key("gpt-4", 0.7, 2000, "prompt")
+    assert key == LLMCache.make_key("gpt-4", 0.7, 2000, "prompt")
+    assert key != LLMCache.make_key("gpt-4", 0.2, 2000, "prompt")
+    assert key != LLMCache.make_key("gpt-4o", 0.7, 2000, "prompt")
+    assert key != LLMCache.make_key("gpt-4", 0.7, 2000, "other prompt")
+
+def test_hit_miss_counters(tmp_path):
+    """적중/미스 카운터 테스트"""
+    cache = LLMCache(tmp_path / "cache.sqlite3")
+    assert cache.get("k") is None
+    cache.put("k", "응답")
+    assert cache.get("k") == "응답"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+def test_lru_eviction(tmp_path):
+    """크기 상한 초과 시 LRU 제거 테스트"""
+    cache = LLMCache(tmp_path / "cache.sqlite3", max_size_mb=250 / (1024 * 1024))
+    cache.put("a", "x" * 100)
+    time.sleep(0.01)
+    cache.put("b", "x" * 100)
+    time.sleep(0.01)
+    assert cache.get("a") is not None  # a를 최근 사용으로 갱신
+    time.sleep(0.01)
+    cache.put("c", "x" * 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+
+def test_ttl_and_bypass(tmp_path):
+    """TTL 만료 및 캐시 우회 테스트"""
+    cache = LLMCache(tmp_path / "cache.sqlite3", ttl_seconds=0)
+    cache.put("k", "응답")
+    time.sleep(0.01)
+    assert cache.get("k") is None
+    assert cache.stats()["expired"] == 1
+
+    disabled = LLMCache(tmp_path / "other.sqlite3", enabled=False)
+    disabled.put("k", "응답")
+    assert disabled.get("k") is None
+
+class FakeChatModel:
+    model_name, temperature, max_tokens = "fake", 0.0, 100
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def invoke(self, prompt):
+        self.calls += 1
+        return SimpleNamespace(content=self.responses.pop(0))
+
+    def stream(self, prompt):
+        self.calls += 1
+        yield SimpleNamespace(content=self.responses.pop(0))
+
+@pytest.fixture
+def llm_cache(tmp_path, monkeypatch):
+    """임시 파일 캐시와 네트워크 없는 토큰 추정"""
+    monkeypatch.setitem(sys.modules, "tiktoken", None)
+    _get_encoding.cache_clear()
+    cache = LLMCache(tmp_path / "cache.sqlite3")
+    monkeypatch.setattr(llm, "_cache", cache)
+    yield cache
+    _get_encoding.cache_clear()
+
+def test_only_validated_responses_are_cached(llm_cache):
+    """호출자가 파싱하지 못한 응답은 저장하지 않고, 다음 호출에서 다시 요청"""
+    model = FakeChatModel("not json", '{"papers": []}')
+    assert llm.invoke_llm(model, "prompt", validate=json.loads).content == "not json"
+    assert llm_cache.stats()["writes"] == 0
+
+    assert llm.invoke_llm(model, "prompt", validate=json.loads).content == '{"papers": []}'
+    assert llm.invoke_llm(model, "prompt", validate=json.loads).content == '{"papers": []}'
+    assert model.calls == 2 and llm_cache.stats()["hits"] == 1
+
+def test_invalid_cached_response_is_evicted(llm_cache):
+    """검증 이전에 저장된 잘못된 응답은 조회 시 제거하고 모델을 다시 호출"""
+    model = FakeChatModel("truncated {", "[1, 2]")
+    llm.invoke_llm(model, "prompt")
+    assert llm.invoke_llm(model, "prompt", validate=json.loads).content == "[1, 2]"
+    assert model.calls == 2 and llm_cache.stats()["invalidated"] == 1
+
+    streamed = FakeChatModel("truncated {")
+    assert list(llm.stream_llm(streamed, "other", validate=json.loads)) == ["truncated {"]
+    assert llm_cache.stats()["writes"] == 2
+
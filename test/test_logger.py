@@ -0,0 +1,21 @@
+import logging
+from utils.logger import _LazyRotatingFileHandler
+from utils.startup_profile import ImportRecord, format_report
+
+
+def test_log_directory_is_created_on_first_record(tmp_path):
+    """로그 디렉토리와 파일은 핸들러 생성(임포트) 시점이 아니라 첫 기록 시 생성"""
+    path = tmp_path / "logs" / "app.log"
+    handler = _LazyRotatingFileHandler(str(path), maxBytes=1024, backupCount=1, encoding="utf-8")
+    assert not path.parent.exists()
+
+    handler.emit(logging.LogRecord("test", logging.INFO, __file__, 1, "started", None, None))
+    handler.close()
+    assert path.read_text(encoding="utf-8").strip() == "started"
+
+
+def test_startup_report_without_measurable_time():
+    """측정된 임포트 시간이 모두 0이어도 보고서 생성"""
+    report = format_report([ImportRecord("app", 0, 0, 0)])
+    assert "Total import time: 0.0 ms (1 modules)" in report and "0.0%  app" in report
+    assert format_report([]).startswith("Total import time: 0.0 ms (0 modules)")
@@ -0,0 +1,52 @@
+import json
+from datetime import date
+from data.models import Paper, Investment, as_records, normalize_research_data, json_default, to_date
+
+
+def test_paper_is_normalized_once_at_ingestion():
+    """날짜 파싱, 목록/숫자 변환, 알 수 없는 필드 보존"""
+    paper = Paper.from_dict({
+        "title": " Agents ",
+        "authors": "Kim, Lee; Park",
+        "publication_date": "2024-03",
+        "citations": "1,204",
+        "impact_score": "8.5/10",
+        "key_findings": "single finding",
+        "doi": "10.1/x"
+    })
+
+    assert paper.title == "Agents"
+    assert paper.authors == ["Kim", "Lee", "Park"]
+    assert paper.publication_date == date(2024, 3, 1)
+    assert (paper.citations, paper.impact_score) == (1204, 8.5)
+    assert paper.key_findings == ["single finding"]
+    assert not hasattr(paper, "__dict__")
+
+
+def test_dict_compatible_access_and_serialization():
+    """기존 사전 기반 코드와 JSON 직렬화 호환"""
+    investment = Investment.from_dict({"company": "A", "date": "2023-05-02", "investors": ["F"], "round": "B"})
+
+    assert investment["date"] == "2023-05-02"
+    assert investment.get("round") == "B" and investment.get("missing", 0) == 0
+    assert "company" in investment and "missing" not in investment
+    assert json.loads(json.dumps(investment, default=json_default))["round"] == "B"
+    assert eval(repr(investment)) == investment.to_dict()
+
+
+def test_invalid_items_are_dropped():
+    """필수 필드가 없거나 사전이 아닌 항목은 제외"""
+    assert [paper.title for paper in as_records([{"authors": ["x"]}, "text", {"title": "ok"}], Paper)] == ["ok"]
+    data = normalize_research_data({"papers": [{"title": "t"}], "news": [], "query": "q"})
+    assert isinstance(data["papers"][0], Paper) and data["query"] == "q"
+
+
+def test_to_date_requires_a_full_match():
+    """문자열 전체가 날짜 형식과 일치할 때만 변환 (잘못된 날짜를 앞부분으로 해석하지 않음)"""
+    assert to_date("2024-03-15") == date(2024, 3, 15)
+    assert to_date("2024-03") == date(2024, 3, 1)
+    assert to_date("2024") == date(2024, 1, 1)
+    assert to_date("2024-03-15T09:30:00Z") == date(2024, 3, 15)
+    for value in ("2024-13-45", "2024-02-30", "2024-1x", "2024년 3월", "20240315", ""):
+        assert to_date(value) is None
+
@@ -0,0 +1,79 @@
+import time
+import pytest
+from pipeline import Stage, PipelineGraph, StageScheduler
+
+def _stage(name, inputs, outputs, delay=0.0):
+    def func(state):
+        time.sleep(delay)
+        return {key: name for key in outputs}
+    return Stage(name=name, func=func, inputs=inputs, outputs=outputs)
+
+def test_dependencies_from_declared_keys():
+    """입출력 선언으로 의존성 추론 테스트"""
+    graph = PipelineGraph([
+        _stage("a", ("topic",), ("x",)),
+        _stage("b", ("x",), ("y",)),
+        _stage("c", ("x",), ("z",)),
+        _stage("d", ("y", "z"), ("w",))
+    ])
+    assert graph.dependencies["d"] == {"b", "c"}
+    assert graph.external_inputs == {"topic"}
+    assert graph.order.index("a") < graph.order.index("b") < graph.order.index("d")
+
+def test_cycle_detection():
+    """순환 의존성 검출 테스트"""
+    with pytest.raises(ValueError):
+        PipelineGraph([
+            _stage("a", ("y",), ("x",)),
+            _stage("b", ("x",), ("y",))
+        ])
+
+def test_independent_stages_run_concurrently():
+    """독립 스테이지 동시 실행 및 임계 경로 테스트"""
+    graph = PipelineGraph([
+        _stage("a", ("topic",), ("x",)),
+        _stage("b", ("x",), ("y",), delay=0.2),
+        _stage("c", ("x",), ("z",), delay=0.3),
+        _stage("d", ("y", "z"), ("w",))
+    ])
+    state, report = StageScheduler(graph, max_workers=4).run({"topic": "t"})
+
+    assert state["w"] == "d"
+    assert report.wall_time < 0.45
+    assert report.critical_path == ["a", "c", "d"]
+
+def test_missing_external_input():
+    """초기 입력 누락 검증 테스트"""
+    graph = PipelineGraph([_stage("a", ("topic",), ("x",))])
+    with pytest.raises(ValueError):
+        StageScheduler(graph).run({})
+
+def test_completed_stages_are_skipped():
+    """체크포인트로 복원된 스테이지 건너뛰기 테스트"""
+    calls = []
+    def tracked(name, inputs, outputs):
+        stage = _stage(name, inputs, outputs)
+        func = stage.func
+        def wrapper(state):
+            calls.append(name)
+            return func(state)
+        stage.func = wrapper
+        return stage
+
+    graph = PipelineGraph([
+        tracked("a", ("topic",), ("x",)),
+        tracked("b", ("x",), ("y",)),
+        tracked("c", ("y",), ("z",))
+    ])
+    completed = {"a": {"x": "saved"}, "b": {"y": "saved"}}
+    saved = []
+    state, _ = StageScheduler(graph).run(
+        {"topic": "t"},
+        completed=completed,
+        on_stage_complete=lambda name, outputs: saved.append(name)
+    )
+
+    assert calls == ["c"]
+    assert saved == ["c"]
+    assert state["x"] == "saved"
+    assert graph.descendants("a") == {"b", "c"}
@@ -0,0 +1,73 @@
+import time
+import threading
+import pytest
+from types import SimpleNamespace
+from utils.rate_limiter import AdaptiveRateLimiter
+
+
+class FakeRateLimitError(Exception):
+    def __init__(self, retry_after=None):
+        super().__init__("429")
+        headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+        self.response = SimpleNamespace(status_code=429, headers=headers)
+
+
+def test_concurrency_is_capped():
+    """동시 호출 수가 한도를 넘지 않음"""
+    limiter = AdaptiveRateLimiter(initial_concurrency=2, max_concurrency=2)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def call():
+        with limiter.slot():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak[0] == 2
+    assert limiter.stats()["calls"] == 8 and limiter.stats()["max_wait"] > 0
+
+
+def test_aimd_adjusts_limit():
+    """성공 시 천천히 늘리고 429/느린 응답 시 줄임"""
+    limiter = AdaptiveRateLimiter(initial_concurrency=4, max_concurrency=8, latency_target=10.0)
+    for _ in range(4):
+        with limiter.slot():
+            pass
+    assert limiter.stats()["concurrency_limit"] == 4 and limiter.limit > 4.9
+
+    with pytest.raises(FakeRateLimitError):
+        with limiter.slot():
+            raise FakeRateLimitError()
+    assert limiter.stats()["concurrency_limit"] == 2
+    assert limiter.stats()["rate_limited"] == 1
+
+
+def test_retry_after_pauses_new_calls():
+    """429의 Retry-After 동안 새 호출을 대기시킴"""
+    limiter = AdaptiveRateLimiter()
+    with pytest.raises(FakeRateLimitError):
+        with limiter.slot():
+            raise FakeRateLimitError(retry_after=0.1)
+    start = time.monotonic()
+    with limiter.slot():
+        pass
+    assert time.monotonic() - start >= 0.09
+
+
+def test_token_bucket_throttles_requests():
+    """분당 토큰 예산을 넘는 요청은 버킷이 채워질 때까지 대기"""
+    limiter = AdaptiveRateLimiter(tokens_per_minute=600)  # 초당 10 토큰
+    with limiter.slot(600):
+        pass
+    start = time.monotonic()
+    with limiter.slot(2):
+        pass
+    assert time.monotonic() - start >= 0.15
@@ -0,0 +1,37 @@
+from analysis.regex_tokenizer import tokenize, lemmatize, strip_particle, STOPWORDS
+from analysis.tokenization import TokenPipeline
+
+
+def test_tokenize_mixed_korean_english():
+    """영숫자 단어와 한글 어절을 분리하고 한글 어절의 조사/어미를 제거"""
+    tokens = tokenize("대규모 언어 모델은 gpt-4o 데이터를 학습하고, 전문가는 성능을 평가한다.")
+    assert tokens == ["대규모", "언어", "모델", "gpt", "4o", "데이터", "학습", "전문가", "성능", "평가"]
+
+
+def test_strip_particle_keeps_short_stems():
+    """어간이 한 글자만 남으면 조사로 보지 않음 (불용어 어간은 예외)"""
+    assert strip_particle("국가") == "국가"
+    assert strip_particle("효과") == "효과"
+    assert strip_particle("것은") == "것"
+    assert strip_particle("인공지능으로부터") == "인공지능"
+
+
+def test_strip_particle_follows_batchim_rules():
+    """조사처럼 끝나는 명사는 그대로 두고, 받침 규칙에 맞는 조사만 제거"""
+    nouns = ["디스플레이", "마이크로", "게이트웨이", "릴레이", "매크로", "연구결과", "재평가"]
+    assert [strip_particle(noun) for noun in nouns] == nouns
+    assert [strip_particle(noun + "를") for noun in ("디스플레이", "마이크로", "게이트웨이")] == \
+        ["디스플레이", "마이크로", "게이트웨이"]
+    assert strip_particle("연구결과와") == "연구결과"
+    assert [strip_particle(word) for word in ("모델이", "네트워크로", "서울로", "시스템으로", "기술과")] == \
+        ["모델", "네트워크", "서울", "시스템", "기술"]
+
+
+def test_lemmatize_plural_and_stopwords():
+    """영어 복수형만 단수로 바꾸고 한국어/영어 불용어를 제거"""
+    assert [lemmatize(word) for word in ("agents", "batteries", "processes", "analysis", "gas")] == \
+        ["agent", "battery", "process", "analysis", "gas"]
+    assert [lemmatize(word) for word in ("news", "series", "species", "robotics", "movies")] == \
+        ["news", "series", "species", "robotics", "movie"]
+    pipeline = TokenPipeline(tokenize, lemmatize, STOPWORDS)
+    assert pipeline.process("The agents 및 로봇은 것을 위해 models") == ("agent", "로봇", "model")
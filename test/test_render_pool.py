@@ -0,0 +1,37 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from utils.render_pool import RenderPool
+
+
+def _render(markdown_content, output_path, metadata):
+    if not markdown_content:
+        raise ValueError("empty report")
+    return output_path
+
+
+def test_inline_render_reports_result_and_error():
+    """프로세스 풀 없이 실행해도 결과와 오류를 Future로 전달"""
+    pool = RenderPool(use_processes=False)
+    assert pool._submit(_render, "PDF", "# Report", "report.pdf", {}).result() == "report.pdf"
+    failed = pool._submit(_render, "PDF", "", "empty.pdf", {})
+    assert isinstance(failed.exception(), ValueError)
+
+
+def test_cancelled_render_is_logged_without_callback_error(caplog):
+    """대기 중 취소된 렌더링은 완료 콜백에서 예외 없이 경고로 기록"""
+    pool = RenderPool(processes=1)
+    executor = ThreadPoolExecutor(max_workers=1)
+    pool._executor = executor
+    release = threading.Event()
+    try:
+        executor.submit(release.wait)
+        with caplog.at_level(logging.WARNING):
+            queued = pool._submit(_render, "HTML", "# Report", "report.html", {})
+            assert queued.cancel()
+    finally:
+        release.set()
+        pool.shutdown()
+
+    assert "HTML rendering cancelled for report.html" in caplog.text
+    assert "exception calling callback" not in caplog.text
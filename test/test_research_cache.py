@@ -0,0 +1,80 @@
+from pathlib import Path
+import pytest
+from data.research_cache import SemanticResearchCache
+from utils.glossary import Glossary
+
+GLOSSARY_PATH = Path(__file__).resolve().parent.parent / "assets" / "glossary" / "ko_en.tsv"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SemanticResearchCache(tmp_path, glossary=Glossary.from_files([GLOSSARY_PATH]))
+
+
+def _matches(cache, first, second):
+    overlap, cosine = cache.similarity(first, second)
+    return overlap >= cache.min_term_overlap and cosine >= cache.threshold
+
+
+@pytest.mark.parametrize("first, second", [
+    ("자율 에이전트", "인공지능 기반 자율 에이전트 기술"),
+    ("자율 에이전트", "autonomous agents"),
+    ("대규모 언어 모델", "large language models"),
+    ("양자 컴퓨팅", "양자 컴퓨팅 기술 동향")
+])
+def test_same_topic_pairs_hit(cache, first, second):
+    """표현만 다른 같은 주제는 재사용"""
+    assert _matches(cache, first, second)
+
+
+@pytest.mark.parametrize("first, second", [
+    ("인공지능 기반 신약 개발 기술", "인공지능 기반 자율 에이전트 기술"),
+    ("다중 에이전트 시스템", "자율 에이전트")
+])
+def test_unrelated_topic_pairs_miss(cache, first, second):
+    """공통 일반어(인공지능 기반 … 기술)만 같은 주제는 재사용하지 않음"""
+    assert not _matches(cache, first, second)
+
+
+@pytest.mark.parametrize("first, second", [
+    ("large language models", "large language model safety"),
+    ("인공지능 기반 자율주행 기술", "인공지능 기반 자율 에이전트 기술")
+])
+def test_near_miss_pairs_miss(cache, first, second):
+    """문자열은 비슷해도 핵심어가 하나라도 다르면 다른 주제"""
+    assert cache.similarity(first, second)[1] >= cache.threshold
+    assert not _matches(cache, first, second)
+
+
+def test_lookup_returns_matching_entry_only(cache):
+    """저장한 수집 결과를 같은 주제에만 반환"""
+    cache.add("자율 에이전트", {"query": "자율 에이전트", "papers": [{"title": "A"}]})
+
+    hit = cache.lookup("인공지능 기반 자율 에이전트 기술")
+    assert hit["papers"] == [{"title": "A"}] and hit["cache_hit"]["matched_query"] == "자율 에이전트"
+    assert cache.lookup("인공지능 기반 신약 개발 기술") is None
+
+
+def test_lookup_vectorizes_only_the_query(cache, monkeypatch):
+    """항목의 벡터는 저장 시 한 번만 계산하고 조회 시에는 질의만 벡터화"""
+    for topic in ["자율 에이전트", "양자 컴퓨팅", "대규모 언어 모델"]:
+        cache.add(topic, {"query": topic, "papers": []})
+
+    calls = []
+    transform = cache.vectorizer.transform
+    monkeypatch.setattr(cache.vectorizer, "transform", lambda text: calls.append(text) or transform(text))
+    assert cache.lookup("양자 컴퓨팅 기술 동향")["cache_hit"]["matched_query"] == "양자 컴퓨팅"
+    assert len(calls) == 1
+
+
+def test_reloaded_and_pruned_index_keeps_features_in_sync(tmp_path):
+    """색인을 다시 읽은 캐시도 같은 항목을 찾고, 제거된 항목은 비교 대상에서 빠짐"""
+    glossary = Glossary.from_files([GLOSSARY_PATH])
+    SemanticResearchCache(tmp_path, glossary=glossary).add("자율 에이전트", {"papers": [{"title": "A"}]})
+
+    cache = SemanticResearchCache(tmp_path, glossary=glossary, max_entries=1)
+    assert cache.lookup("autonomous agents")["papers"] == [{"title": "A"}]
+
+    cache.add("양자 컴퓨팅", {"papers": [{"title": "B"}]})
+    assert cache.lookup("autonomous agents") is None
+    assert set(cache._features) == {entry["id"] for entry in cache._entries}
@@ -0,0 +1,59 @@
+import sys
+import types
+import pytest
+from benchmarks.generators import generate_research_data
+from data.research_digest import build_research_digest, slice_digest
+from utils.token_budget import count_tokens, fit_lists_to_budget, to_prompt_json, _get_encoding
+
+
+@pytest.fixture(autouse=True)
+def offline_tokenizer(monkeypatch):
+    """네트워크 없이 실행되도록 tiktoken 대신 문자 수 추정 사용"""
+    monkeypatch.setitem(sys.modules, "tiktoken", None)
+    _get_encoding.cache_clear()
+    yield
+    _get_encoding.cache_clear()
+
+
+def test_encoding_failure_falls_back_once(monkeypatch):
+    """BPE 파일 다운로드 실패 등 인코딩 오류는 한 번만 시도하고 문자 수 추정으로 대체"""
+    calls = []
+
+    def encoding_for_model(model):
+        calls.append(model)
+        raise OSError("Name or service not known")
+
+    monkeypatch.setitem(sys.modules, "tiktoken", types.SimpleNamespace(encoding_for_model=encoding_for_model))
+    assert count_tokens("hello world") == count_tokens("hello world") > 0
+    assert calls == ["gpt-4o"]
+
+
+def test_fit_lists_to_budget_keeps_leading_items():
+    """예산을 넘으면 목록 앞부분(중요도 높은 항목)만 남김"""
+    data = {"query": "q", "items": [f"item-{i}" for i in range(500)]}
+    fitted = fit_lists_to_budget(data, budget=100)
+
+    assert count_tokens(to_prompt_json(fitted)) <= 100
+    assert fitted["items"] == data["items"][:len(fitted["items"])]
+    assert len(data["items"]) == 500
+
+
+def test_digest_is_bounded_and_ranked():
+    """요약본은 예산 이내이며 논문은 영향도 순으로 정렬"""
+    research_data = generate_research_data(400)
+    digest = build_research_digest(research_data, max_tokens=2000)
+
+    assert digest["counts"]["papers"] == 400
+    assert count_tokens(to_prompt_json(digest)) <= 2100
+    scores = [paper["impact_score"] for paper in digest["papers"]]
+    assert scores == sorted(scores, reverse=True)
+    assert "methodology" not in digest["papers"][0]
+
+
+def test_slice_contains_only_agent_categories():
+    """에이전트 슬라이스는 필요한 카테고리만 예산 이내로 포함"""
+    digest = build_research_digest(generate_research_data(400), max_tokens=4000)
+    risk = slice_digest(digest, "risk", budget=500)
+
+    assert "papers" not in risk and "news" in risk
+    assert count_tokens(to_prompt_json(risk)) <= 600
@@ -0,0 +1,53 @@
+from data.models import Paper
+from data.research_store import ResearchStore, to_columns, from_columns
+
+
+def _research_data(query):
+    return {
+        "query": query,
+        "english_query": "autonomous agents",
+        "papers": [
+            Paper.from_dict({"title": "A", "authors": "Kim, Lee", "publication_date": "2024-03-01", "venue": "NeurIPS"}),
+            {"title": "B", "citations": "12"}
+        ],
+        "news": [{"title": "뉴스", "date": "2024-05"}],
+        "patents": [],
+        "investments": [{"company": "Acme", "funding_amount": "$10M"}]
+    }
+
+
+def test_columns_roundtrip():
+    """열 형식 변환은 필드명을 한 번만 저장하고 없는 필드는 복원하지 않음"""
+    table = to_columns([{"title": "A", "x": 1}, {"title": "B"}])
+    assert table == {"count": 2, "columns": {"title": ["A", "B"], "x": [1, None]}}
+    assert from_columns(table) == [{"title": "A", "x": 1}, {"title": "B"}]
+
+
+def test_save_and_load_with_index(tmp_path):
+    """저장한 실행을 색인으로 조회하고 레코드 모델로 복원"""
+    store = ResearchStore(tmp_path)
+    entry = store.save(_research_data("자율 에이전트"), "자율 에이전트", "20250101_000000")
+    store.save(_research_data("다른 주제"), "다른 주제", "20250102_000000")
+
+    assert entry["counts"] == {"papers": 2, "news": 1, "patents": 0, "investments": 1}
+    reopened = ResearchStore(tmp_path)
+    assert [run["query"] for run in reopened.list_runs()] == ["다른 주제", "자율 에이전트"]
+
+    loaded = reopened.latest("자율 에이전트")
+    paper = loaded["papers"][0]
+    assert isinstance(paper, Paper) and paper.authors == ["Kim", "Lee"]
+    assert paper.publication_date.isoformat() == "2024-03-01" and paper["venue"] == "NeurIPS"
+    assert loaded["papers"][1].citations == 12
+    assert loaded["english_query"] == "autonomous agents"
+
+
+def test_prunes_oldest_runs(tmp_path):
+    """max_runs를 넘으면 오래된 실행 파일과 색인 항목을 삭제"""
+    store = ResearchStore(tmp_path, max_runs=2)
+    first = store.save(_research_data("q"), "q", "20250101_000000")
+    for day in (2, 3):
+        store.save(_research_data("q"), "q", f"2025010{day}_000000")
+
+    assert len(store.list_runs("q")) == 2
+    assert store.load(first["id"]) is None
+    assert not (tmp_path / first["file"]).exists()
@@ -0,0 +1,86 @@
+import random
+import pytest
+from types import SimpleNamespace
+from utils.exceptions import ValidationError, CircuitOpenError, DataCollectionError
+from utils.retry import (
+    call_with_retry, retry_budget, backoff_delay, retry_after_seconds, already_gave_up, is_provider_error
+)
+
+
+class FakeHTTPError(Exception):
+    def __init__(self, status, headers=None):
+        super().__init__(f"HTTP {status}")
+        self.response = SimpleNamespace(status_code=status, headers=headers or {})
+
+
+def _failing(errors):
+    calls = []
+    def func():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+    return func, calls
+
+
+def test_backoff_grows_with_jitter_and_honours_retry_after():
+    """지수 백오프 상한 이내의 지터, Retry-After 헤더 대기"""
+    rng = random.Random(0)
+    assert all(0 <= backoff_delay(4, 1.0, 30.0, rng=rng) <= 8.0 for _ in range(100))
+    assert all(4.0 <= backoff_delay(4, 1.0, 30.0, rate_limited=True, rng=rng) <= 8.0 for _ in range(100))
+    assert backoff_delay(20, 1.0, 30.0, rate_limited=True, rng=rng) <= 30.0
+
+    sleeps = []
+    func, calls = _failing([FakeHTTPError(429, {"retry-after": "2"})])
+    assert call_with_retry(func, base_delay=0.01, sleep=sleeps.append) == "ok"
+    assert sleeps == [2.0] and len(calls) == 2
+    assert retry_after_seconds(FakeHTTPError(503, {"retry-after-ms": "1500"})) == 1.5
+
+
+def test_non_retryable_errors_fail_fast():
+    """검증 에러/4xx 응답/너무 긴 Retry-After는 재시도하지 않음"""
+    for error in (ValidationError("bad"), FakeHTTPError(401), FakeHTTPError(429, {"retry-after": "600"})):
+        func, calls = _failing([error])
+        with pytest.raises(type(error)):
+            call_with_retry(func, max_attempts=5, max_delay=30.0, sleep=lambda _: None)
+        assert len(calls) == 1
+
+
+def test_nested_layers_do_not_multiply_attempts():
+    """안쪽 계층이 포기한 실패는 바깥 계층이 다시 재시도하지 않음"""
+    calls = []
+    def inner():
+        calls.append(1)
+        raise ConnectionError("down")
+
+    def outer():
+        try:
+            call_with_retry(inner, max_attempts=3, sleep=lambda _: None)
+        except ConnectionError as e:
+            raise RuntimeError("collection failed") from e
+
+    with pytest.raises(RuntimeError) as info:
+        call_with_retry(outer, max_attempts=3, sleep=lambda _: None)
+    assert len(calls) == 3
+    assert already_gave_up(info.value)
+
+
+def test_retry_budget_is_shared_within_run():
+    """retry_budget 블록 안의 재시도는 하나의 예산을 함께 소비"""
+    with retry_budget(2) as budget:
+        func, calls = _failing([ConnectionError()] * 2)
+        assert call_with_retry(func, max_attempts=5, sleep=lambda _: None) == "ok"
+        func, calls = _failing([ConnectionError()] * 2)
+        with pytest.raises(ConnectionError):
+            call_with_retry(func, max_attempts=5, sleep=lambda _: None)
+        assert len(calls) == 1 and budget.remaining == 0
+
+
+def test_provider_errors_are_recognized_through_wrappers():
+    """회로 열림/레이트 리밋/5xx/시간 초과는 감싼 예외 안에 있어도 공급자 오류, 파싱/요청 오류는 아님"""
+    for error in (CircuitOpenError("open"), FakeHTTPError(429), FakeHTTPError(503), TimeoutError()):
+        wrapped = DataCollectionError("collection failed")
+        wrapped.__cause__ = error
+        assert is_provider_error(error) and is_provider_error(wrapped)
+    for error in (ValueError("bad json"), FakeHTTPError(400), ValidationError("bad")):
+        assert not is_provider_error(error)
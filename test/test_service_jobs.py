@@ -0,0 +1,34 @@
+import time
+from service.jobs import JobManager
+
+class FakePipeline:
+    def run(self, topic, resume=False, from_stage=None, progress=None):
+        progress("research", "running")
+        if topic == "실패":
+            raise RuntimeError("boom")
+        progress("research", "completed")
+        return {"run_id": "run-1", "report_md_path": "/tmp/report.md"}
+
+def _wait(job, timeout=2.0):
+    deadline = time.time() + timeout
+    while not job.finished and time.time() < deadline:
+        time.sleep(0.01)
+
+def test_jobs_report_status_and_stage_progress():
+    """작업 상태 및 스테이지 진행 기록 테스트"""
+    manager = JobManager(FakePipeline, workers=2)
+    manager.start()
+    try:
+        ok = manager.submit("자율 에이전트")
+        failed = manager.submit("실패")
+        _wait(ok)
+        _wait(failed)
+    finally:
+        manager.stop(timeout=1)
+
+    assert ok.status == "succeeded"
+    assert ok.stages == {"research": "completed"}
+    assert ok.artifacts == {"md": "/tmp/report.md"}
+    assert failed.status == "failed"
+    assert failed.stages == {"research": "failed"}
+    assert "boom" in failed.error
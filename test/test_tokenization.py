@@ -0,0 +1,40 @@
+from analysis.tokenization import TokenPipeline
+
+
+def _pipeline(calls, **options):
+    def lemmatize(token):
+        calls.append(token)
+        return token.rstrip("s")
+    return TokenPipeline(str.split, lemmatize, {"the"}, **options)
+
+
+def test_process_filters_and_lemmatizes_once():
+    """불용어와 비영숫자 토큰을 제외하고 같은 단어의 표제어는 한 번만 계산"""
+    calls = []
+    pipeline = _pipeline(calls)
+    assert pipeline.process("The agents , agents plan") == ("agent", "agent", "plan")
+    assert calls == ["agents", "plan"]
+
+
+def test_document_cache_reuses_tokens():
+    """같은 내용의 문서는 배치 안팎에서 다시 토큰화하지 않음"""
+    calls = []
+    pipeline = _pipeline(calls)
+    counter = pipeline.count(["robots learn", "robots learn", "agents plan"])
+    assert counter == {"robot": 2, "learn": 2, "agent": 1, "plan": 1}
+
+    pipeline.lemma.cache_clear()
+    calls.clear()
+    assert pipeline.tokens("robots learn") == ("robot", "learn")
+    assert calls == []
+    assert pipeline.stats()["document_hits"] == 1
+
+
+def test_document_cache_is_bounded():
+    """문서 캐시는 최근 사용 순으로 크기를 유지"""
+    pipeline = _pipeline([], document_cache_size=2)
+    pipeline.tokenize_batch(["a", "b"])
+    pipeline.tokens("a")
+    pipeline.tokens("c")
+    assert pipeline.stats()["documents_cached"] == 2
+    assert pipeline.tokenize_batch(["a"]) and pipeline.stats()["document_hits"] == 2
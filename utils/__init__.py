@@ -5,7 +5,6 @@ Utility functions and classes for the project
 from .logger import logger
 from .exceptions import PromptError, DataCollectionError, StorageError
 from .decorators import log_execution_time, retry, validate_input
-from .pdf_generator import PDFGenerator
 
 __all__ = [
     'logger',
@@ -17,3 +16,10 @@ __all__ = [
     'validate_input',
     'PDFGenerator'
 ]
+
+def __getattr__(name):
+    # PDFGenerator는 WeasyPrint를 불러오므로 처음 사용할 때 임포트
+    if name == 'PDFGenerator':
+        from .pdf_generator import PDFGenerator
+        return PDFGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
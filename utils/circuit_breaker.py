@@ -0,0 +1,150 @@
+"""
+LLM 호출 서킷 브레이커
+최근 호출의 공급자 오류 비율이 임계값을 넘으면 회로를 열어 이후 호출을 즉시 실패시키고
+(CircuitOpenError), 대기 시간이 지나면 한 번의 시험 호출(half-open)로 복구 여부를 확인합니다.
+시험 호출이 성공하면 회로를 닫고, 실패하면 대기 시간을 늘려 다시 엽니다.
+"""
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Deque, Tuple, Optional
+from utils.exceptions import CircuitOpenError
+from utils.retry import is_retryable
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def is_provider_failure(error: BaseException) -> bool:
+    """공급자 상태를 나타내는 오류인지 (429/5xx/시간 초과/연결 오류). 잘못된 요청 등은 제외"""
+    return isinstance(error, Exception) and not isinstance(error, CircuitOpenError) and is_retryable(error)
+
+
+class CircuitBreaker:
+    """
+    오류 비율 기반 서킷 브레이커
+
+    Args:
+        failure_threshold: 회로를 여는 오류 비율 (0~1)
+        min_calls: 비율을 판단하기 위한 최소 호출 수
+        window_seconds: 오류 비율을 계산하는 최근 구간
+        open_seconds: 회로가 열린 뒤 시험 호출까지의 대기 시간 (연속 실패 시 2배씩, max_open_seconds까지)
+    """
+    def __init__(self, failure_threshold: float = 0.5, min_calls: int = 5, window_seconds: float = 60.0,
+                 open_seconds: float = 30.0, max_open_seconds: float = 300.0, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.failure_threshold = failure_threshold
+        self.min_calls = max(1, min_calls)
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.max_open_seconds = max(open_seconds, max_open_seconds)
+        self.state = CLOSED
+        self._calls: Deque[Tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        self._cooldown = open_seconds
+        self._probing = False
+        self._lock = threading.Lock()
+        self._stats = {"rejected": 0, "opened": 0}
+
+    def _trim(self, now: float) -> None:
+        while self._calls and self._calls[0][0] < now - self.window_seconds:
+            self._calls.popleft()
+
+    def _open(self, now: float) -> None:
+        self.state = OPEN
+        self._opened_at = now
+        self._stats["opened"] += 1
+        logger.warning(f"LLM circuit opened for {self._cooldown:.0f}s")
+
+    def retry_in(self) -> float:
+        """열린 회로가 시험 호출을 허용할 때까지 남은 시간 (닫혀 있으면 0)"""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self._cooldown - time.monotonic())
+
+    @property
+    def is_open(self) -> bool:
+        """호출이 즉시 거부되는 상태인지"""
+        return self.enabled and self.retry_in() > 0
+
+    def before_call(self) -> None:
+        """
+        호출 허용 여부 확인
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있거나 다른 시험 호출이 진행 중인 경우
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            now = time.monotonic()
+            if self.state == OPEN and now >= self._opened_at + self._cooldown:
+                self.state = HALF_OPEN
+                self._probing = False
+            if self.state == OPEN or (self.state == HALF_OPEN and self._probing):
+                self._stats["rejected"] += 1
+                remaining = max(0.0, self._opened_at + self._cooldown - now)
+                raise CircuitOpenError(f"LLM circuit is open (retry in {remaining:.0f}s)")
+            if self.state == HALF_OPEN:
+                self._probing = True
+
+    def record(self, error: Optional[BaseException] = None) -> None:
+        """호출 결과 기록 (공급자 오류가 아닌 예외는 집계하지 않음)"""
+        if not self.enabled:
+            return
+        failed = error is not None and is_provider_failure(error)
+        if error is not None and not failed:
+            with self._lock:
+                self._probing = False
+            return
+        with self._lock:
+            now = time.monotonic()
+            if self.state == HALF_OPEN:
+                self._probing = False
+                if failed:
+                    self._cooldown = min(self.max_open_seconds, self._cooldown * 2)
+                    self._open(now)
+                else:
+                    logger.info("LLM circuit closed after successful probe")
+                    self.state = CLOSED
+                    self._cooldown = self.open_seconds
+                    self._calls.clear()
+                return
+
+            self._calls.append((now, failed))
+            self._trim(now)
+            failures = sum(1 for _, item in self._calls if item)
+            if (self.state == CLOSED and len(self._calls) >= self.min_calls
+                    and failures / len(self._calls) >= self.failure_threshold):
+                self._calls.clear()
+                self._open(now)
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """before_call/record를 감싼 컨텍스트"""
+        self.before_call()
+        try:
+            yield
+        except BaseException as e:
+            self.record(e)
+            raise
+        self.record()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            self._trim(now)
+            stats = dict(self._stats)
+            stats.update({
+                "state": self.state,
+                "window_calls": len(self._calls),
+                "window_failures": sum(1 for _, failed in self._calls if failed)
+            })
+        stats["enabled"] = self.enabled
+        return stats
@@ -1,7 +1,10 @@
 import time
 import functools
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 from utils.logger import logger
+from utils.exceptions import ValidationError
+from utils.retry import call_with_retry
+from config import config
 
 def log_execution_time(func: Callable) -> Callable:
     """함수 실행 시간 로깅 데코레이터"""
@@ -18,23 +21,28 @@ def log_execution_time(func: Callable) -> Callable:
             raise
     return wrapper
 
-def retry(max_attempts: int = 3, delay: float = 1.0) -> Callable:
-    """재시도 데코레이터"""
+def retry(max_attempts: int = 3, delay: Optional[float] = None, max_delay: Optional[float] = None) -> Callable:
+    """
+    재시도 데코레이터 (지수 백오프 + 지터)
+
+    재시도할 수 없는 에러는 즉시 전파하고, 안쪽 계층에서 이미 재시도를 포기한 에러는
+    다시 재시도하지 않으며, retry_budget 블록 안에서는 실행 전체의 재시도 예산을 공유합니다.
+
+    Args:
+        max_attempts: 최대 시도 횟수
+        delay: 첫 재시도 대기 시간 상한 (기본값 config.retry.base_delay)
+        max_delay: 재시도 대기 시간 상한 (기본값 config.retry.max_delay)
+    """
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            attempts = 0
-            while attempts < max_attempts:
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    attempts += 1
-                    if attempts == max_attempts:
-                        logger.error(f"Failed after {max_attempts} attempts: {e}")
-                        raise
-                    logger.warning(f"Attempt {attempts} failed, retrying in {delay} seconds")
-                    time.sleep(delay)
-            return None
+            return call_with_retry(
+                func, args, kwargs,
+                max_attempts=max_attempts,
+                base_delay=config.retry.base_delay if delay is None else delay,
+                max_delay=config.retry.max_delay if max_delay is None else max_delay,
+                name=func.__name__
+            )
         return wrapper
     return decorator
 
@@ -46,5 +54,5 @@ def validate_input(func: Callable) -> Callable:
             return func(*args, **kwargs)
         except Exception as e:
             logger.error(f"Validation error in {func.__name__}: {e}")
-            raise ValidationError(str(e))
+            raise ValidationError(str(e)) from e
     return wrapper
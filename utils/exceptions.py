@@ -25,3 +25,7 @@ class VisualizationError(TrendAnalysisError):
 class StorageError(TrendAnalysisError):
     """저장소 관련 에러"""
     pass
+
+class CircuitOpenError(APIError):
+    """서킷 브레이커가 열려 있어 호출을 거부한 경우"""
+    pass
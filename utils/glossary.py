@@ -0,0 +1,236 @@
+"""
+쿼리 번역용 용어집과 번역 메모
+한국어 기술 용어 → 영어 용어집(TSV)을 Aho-Corasick 오토마톤으로 색인하여 쿼리 길이에
+선형인 시간으로 모든 용어를 한 번에 찾고, 가장 왼쪽/가장 긴 용어부터 겹치지 않게 치환합니다.
+띄어쓰기 차이("자율 에이전트"/"자율에이전트")는 매칭 시 무시합니다.
+번역 메모는 이전에 번역한 쿼리를 JSON 파일에 보관하여 같은 쿼리의 재번역을 막습니다.
+"""
+import os
+import re
+import json
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Iterable, Union
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+PathLike = Union[str, Path]
+
+
+def normalize_query(text: str) -> str:
+    """메모 키용 정규화 (연속 공백 축약, 소문자)"""
+    return _WHITESPACE_PATTERN.sub(' ', text).strip().lower()
+
+
+def is_ascii(text: str) -> bool:
+    return all(ord(char) < 128 for char in text)
+
+
+def load_glossary_file(path: PathLike) -> Dict[str, str]:
+    """
+    "한국어<TAB>영어" 형식의 TSV 용어집 로드
+
+    빈 줄과 #으로 시작하는 줄은 무시하며, 같은 용어가 여러 번 나오면 뒤의 항목이 우선합니다.
+    """
+    terms: Dict[str, str] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            source, sep, target = line.partition('\t')
+            if not sep or not source.strip() or not target.strip():
+                logger.warning(f"Skipping malformed glossary line {path}:{line_number}")
+                continue
+            terms[source.strip()] = target.strip()
+    return terms
+
+
+class AhoCorasick:
+    """
+    다중 패턴 문자열 매처
+
+    패턴 수와 무관하게 입력 길이(+ 매치 수)에 선형인 시간으로 모든 출현 위치를 찾습니다.
+    """
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]  # 노드에서 끝나는 패턴 길이 (실패 링크 경유 포함)
+        for pattern in patterns:
+            if pattern:
+                self._add(pattern)
+        self._build()
+
+    def _add(self, pattern: str) -> None:
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        if len(pattern) not in self._output[node]:
+            self._output[node].append(len(pattern))
+
+    def _build(self) -> None:
+        """너비 우선으로 실패 링크 구성"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find_all(self, text: str) -> List[Tuple[int, int]]:
+        """모든 매치의 (시작, 끝) 위치 목록"""
+        matches = []
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            for length in self._output[node]:
+                matches.append((index + 1 - length, index + 1))
+        return matches
+
+    def find_longest(self, text: str) -> List[Tuple[int, int]]:
+        """가장 왼쪽에서 시작하는 가장 긴 매치부터 겹치지 않게 선택"""
+        selected = []
+        position = 0
+        for start, end in sorted(self.find_all(text), key=lambda span: (span[0], -span[1])):
+            if start >= position:
+                selected.append((start, end))
+                position = end
+        return selected
+
+
+class Glossary:
+    """
+    용어집 기반 쿼리 번역
+
+    Args:
+        terms: 한국어 용어 → 영어 용어 사전
+    """
+    def __init__(self, terms: Dict[str, str]) -> None:
+        self.terms: Dict[str, str] = {}
+        for source, target in terms.items():
+            key = self._key(source)
+            if key:
+                self.terms[key] = target
+        self._matcher = AhoCorasick(self.terms)
+
+    @classmethod
+    def from_files(cls, paths: Iterable[PathLike]) -> "Glossary":
+        """TSV 용어집 파일들을 합쳐서 로드 (없는 파일은 건너뜀, 뒤의 파일이 우선)"""
+        terms: Dict[str, str] = {}
+        for path in paths:
+            if not Path(path).exists():
+                logger.warning(f"Glossary file not found: {path}")
+                continue
+            terms.update(load_glossary_file(path))
+        return cls(terms)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    @staticmethod
+    def _key(text: str) -> str:
+        return _WHITESPACE_PATTERN.sub('', text).lower()
+
+    def _matches(self, text: str) -> List[Tuple[int, int, str]]:
+        """원문 기준 (시작, 끝, 영어 용어) 목록"""
+        # 공백을 제거한 문자열에서 찾고 원문 위치로 되돌림
+        positions = [index for index, char in enumerate(text) if not char.isspace()]
+        compact = "".join(text[index] for index in positions)
+        if len(compact.lower()) == len(compact):
+            # 소문자 변환으로 길이가 바뀌는 문자가 있으면 위치가 어긋나므로 원문 그대로 매칭
+            compact = compact.lower()
+        return [
+            (positions[start], positions[end - 1] + 1, self.terms[compact[start:end]])
+            for start, end in self._matcher.find_longest(compact)
+        ]
+
+    def matched_terms(self, text: str) -> List[str]:
+        """쿼리에 등장한 용어의 영어 번역 (등장 순서, 중복 제거)"""
+        return list(dict.fromkeys(target for _, _, target in self._matches(text)))
+
+    def substitute(self, text: str) -> str:
+        """등장한 용어를 영어 용어로 치환 (용어집에 없는 부분은 그대로)"""
+        parts = []
+        position = 0
+        for start, end, target in self._matches(text):
+            parts.append(text[position:start])
+            parts.append(f" {target} ")
+            position = end
+        parts.append(text[position:])
+        return _WHITESPACE_PATTERN.sub(' ', "".join(parts)).strip()
+
+    def translate(self, text: str) -> Optional[str]:
+        """
+        용어 치환으로 쿼리 번역
+
+        Returns:
+            치환 결과가 모두 ASCII(번역되지 않은 한국어가 없음)이면 번역문, 아니면 None
+        """
+        translated = self.substitute(text)
+        return translated if translated and is_ascii(translated) else None
+
+
+class TranslationMemo:
+    """
+    번역 결과 영구 메모 (JSON 파일)
+
+    쿼리는 공백/대소문자를 정규화한 키로 저장하며, 기록할 때마다 임시 파일을 거쳐 원자적으로 교체합니다.
+    """
+    def __init__(self, path: PathLike) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, str]] = None
+
+    def _load(self) -> Dict[str, str]:
+        if self._entries is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable translation memo {self.path}: {e}")
+                self._entries = {}
+        return self._entries
+
+    def get(self, query: str) -> Optional[str]:
+        with self._lock:
+            return self._load().get(normalize_query(query))
+
+    def put(self, query: str, translation: str) -> None:
+        with self._lock:
+            entries = self._load()
+            key = normalize_query(query)
+            if entries.get(key) == translation:
+                return
+            entries[key] = translation
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self.path.with_suffix(".json.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Failed to write translation memo {self.path}: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
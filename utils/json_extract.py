@@ -0,0 +1,177 @@
+"""
+LLM 응답에서 JSON 추출
+정규식 역추적 없이 문자열과 괄호를 추적하는 단일 패스 스캐너로 후보 구간을 찾습니다.
+코드 블록(```json ... ```) 안의 JSON을 우선하며, 앞뒤 설명 문장과
+후행 쉼표 같은 흔한 LLM 출력 결함을 허용합니다. 전체 비용은 입력 길이에 선형입니다.
+"""
+import json
+from typing import List, Tuple, Optional, Iterator
+
+_FENCE = "```"
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+def iter_fenced_blocks(text: str) -> Iterator[str]:
+    """``` 로 감싼 코드 블록 내용 (언어 표기 줄 제외)"""
+    position = 0
+    while True:
+        start = text.find(_FENCE, position)
+        if start < 0:
+            return
+        end = text.find(_FENCE, start + len(_FENCE))
+        if end < 0:
+            return
+        block = text[start + len(_FENCE):end]
+        # 첫 줄이 언어 표기(json 등)이면 제거
+        newline = block.find("\n")
+        if newline >= 0 and block[:newline].strip().isalnum():
+            block = block[newline + 1:]
+        elif block.lstrip().lower().startswith("json"):
+            block = block.lstrip()[4:]
+        yield block.strip()
+        position = end + len(_FENCE)
+
+
+def scan_json_spans(text: str) -> List[Tuple[int, int]]:
+    """
+    괄호 균형이 맞는 JSON 후보 구간 목록
+
+    문자열 리터럴 안의 괄호와 이스케이프를 고려합니다. 짝이 맞지 않는 닫는 괄호를
+    만나면 열린 괄호를 모두 버리고 그 위치부터 계속 진행하며 (되돌아가지 않음),
+    닫히지 않은 바깥 괄호 안에서 완결된 구간도 후보가 됩니다.
+    서로 포함되지 않는 가장 바깥 구간만 반환하므로 후보 파싱 비용의 합도 선형입니다.
+
+    Returns:
+        (시작, 끝) 인덱스 목록 (시작 위치 순). text[시작:끝]이 후보
+    """
+    closed: List[Tuple[int, int]] = []
+    stack: List[Tuple[str, int]] = []
+    in_string = False
+    escaped = False
+
+    for index, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char in _CLOSERS:
+            stack.append((_CLOSERS[char], index))
+        elif not stack:
+            # 괄호 밖의 따옴표는 설명 문장의 일부이므로 문자열로 취급하지 않음
+            continue
+        elif char == '"':
+            in_string = True
+        elif char in "}]":
+            closer, start = stack.pop()
+            if char != closer:
+                stack.clear()
+                continue
+            closed.append((start, index + 1))
+
+    # 괄호 구간은 중첩되거나 서로소이므로 시작 순 정렬 후 앞 구간에 포함되지 않는 것만 유지
+    spans: List[Tuple[int, int]] = []
+    for start, end in sorted(closed):
+        if not spans or start >= spans[-1][1]:
+            spans.append((start, end))
+    return spans
+
+
+def remove_trailing_commas(candidate: str) -> str:
+    """문자열 밖의 `,}` / `,]` 후행 쉼표 제거"""
+    result: List[str] = []
+    pending_comma = -1
+    in_string = False
+    escaped = False
+
+    for char in candidate:
+        if in_string:
+            result.append(char)
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+
+        if char in "}]" and pending_comma >= 0:
+            del result[pending_comma]
+            pending_comma = -1
+        elif char == ",":
+            pending_comma = len(result)
+        elif not char.isspace():
+            pending_comma = -1
+
+        if char == '"':
+            in_string = True
+        result.append(char)
+
+    return "".join(result)
+
+
+def _loads_candidate(candidate: str) -> Optional[str]:
+    """그대로 또는 보정 후 파싱되면 파싱 가능한 문자열 반환"""
+    try:
+        json.loads(candidate)
+        return candidate
+    except ValueError:
+        pass
+    repaired = remove_trailing_commas(candidate)
+    if repaired != candidate:
+        try:
+            json.loads(repaired)
+            return repaired
+        except ValueError:
+            pass
+    return None
+
+
+def extract_json(text: str) -> Optional[str]:
+    """
+    응답 텍스트에서 JSON 부분 추출
+
+    우선순위: 코드 블록 전체 → 코드 블록 내부 후보 → 본문의 객체 후보 → 본문의 배열 후보
+
+    Returns:
+        json.loads로 파싱 가능한 JSON 문자열 (없으면 None)
+    """
+    if not text:
+        return None
+
+    for block in iter_fenced_blocks(text):
+        parsed = _loads_candidate(block)
+        if parsed is not None:
+            return parsed
+        for start, end in scan_json_spans(block):
+            parsed = _loads_candidate(block[start:end])
+            if parsed is not None:
+                return parsed
+
+    spans = scan_json_spans(text)
+    parsed = _first_valid(text, spans)
+    if parsed is not None:
+        return parsed
+
+    # 파싱되지 않는 바깥 구간 안쪽을 한 단계만 더 살펴봄 (비용은 여전히 선형)
+    inner_spans = [
+        (start + 1 + inner_start, start + 1 + inner_end)
+        for start, end in spans
+        for inner_start, inner_end in scan_json_spans(text[start + 1:end - 1])
+    ]
+    return _first_valid(text, inner_spans)
+
+
+def _first_valid(text: str, spans: List[Tuple[int, int]]) -> Optional[str]:
+    """객체 후보를 배열 후보보다 먼저 시도"""
+    for opener in "{[":
+        for start, end in spans:
+            if text[start] == opener:
+                parsed = _loads_candidate(text[start:end])
+                if parsed is not None:
+                    return parsed
+    return None
@@ -0,0 +1,202 @@
+"""
+LLM 스트리밍 응답의 점진적 JSON 파싱
+{"papers": [...], "news": [...], ...} 형태의 응답을 청크 단위로 받아, 카테고리 배열 안의
+레코드가 닫히는 즉시 (카테고리, 레코드)를 반환합니다. 첫 '{' 이전의 설명 문장은 무시하며,
+카테고리 값이 배열이 아니거나, 레코드가 객체가 아니거나 필수 필드가 없으면
+StreamSchemaError를 발생시켜 생성이 끝나기 전에 중단할 수 있게 합니다.
+"""
+import json
+from typing import Dict, Any, List, Tuple, Optional, Iterable, Set
+from utils.exceptions import DataCollectionError
+from utils.json_extract import remove_trailing_commas
+
+Record = Tuple[str, Dict[str, Any]]
+
+
+class StreamSchemaError(DataCollectionError):
+    """스트리밍 응답이 기대한 스키마를 벗어난 경우"""
+    pass
+
+
+class RecordStreamParser:
+    """
+    카테고리 배열 레코드의 점진적 파서 (입력 길이에 선형, 청크 경계 무관)
+
+    Args:
+        categories: 레코드 배열로 기대하는 최상위 키와 각 레코드의 필수 필드
+            예: {"papers": ("title",), "investments": ("company",)}
+    """
+    def __init__(self, categories: Dict[str, Iterable[str]]) -> None:
+        self.categories = {name: tuple(fields) for name, fields in categories.items()}
+        self.records: Dict[str, List[Dict[str, Any]]] = {name: [] for name in self.categories}
+        self.extras: Dict[str, Any] = {}
+        self.done = False
+
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._in_comment = False
+        self._slash = False
+        self._seen: Set[str] = set()
+
+        self._key_chars: Optional[List[str]] = None  # 최상위 키 문자열
+        self._pending_key: Optional[str] = None
+        self._current_key: Optional[str] = None
+        self._expect_value = False
+        self._array_key: Optional[str] = None  # 현재 위치한 카테고리 배열
+        self._record_chars: Optional[List[str]] = None  # 수집 중인 레코드 원문
+        self._value_chars: Optional[List[str]] = None  # 수집 중인 카테고리 외 최상위 값 원문
+
+    def feed(self, chunk: str) -> List[Record]:
+        """청크를 소비하고 새로 완성된 레코드 목록 반환"""
+        completed: List[Record] = []
+        for char in chunk:
+            if self.done:
+                break
+            self._consume(char, completed)
+        return completed
+
+    def close(self) -> Dict[str, Any]:
+        """
+        스트림 종료 처리
+
+        Returns:
+            카테고리별 레코드와 기타 최상위 값을 합친 사전
+
+        Raises:
+            StreamSchemaError: 최상위 객체가 닫히지 않았거나 카테고리가 빠진 경우
+        """
+        if not self.done:
+            raise StreamSchemaError("Stream ended before the top-level object was closed")
+        missing = [name for name in self.categories if name not in self._seen]
+        if missing:
+            raise StreamSchemaError(f"Stream is missing categories: {missing}")
+        return {**self.extras, **self.records}
+
+    def _capture(self, char: str) -> None:
+        if self._record_chars is not None:
+            self._record_chars.append(char)
+        elif self._value_chars is not None:
+            self._value_chars.append(char)
+
+    def _consume(self, char: str, completed: List[Record]) -> None:
+        if self._in_string:
+            self._capture(char)
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                if self._key_chars is not None:
+                    self._pending_key = "".join(self._key_chars)
+                    self._key_chars = None
+            elif self._key_chars is not None:
+                self._key_chars.append(char)
+            return
+
+        if not self._started:
+            # 객체 시작 전의 설명 문장(URL, 괄호 포함)이나 코드 블록 표기는 '{'가 나올 때까지 무시
+            if char == "{":
+                self._started = True
+                self._depth = 1
+            return
+
+        if self._in_comment:
+            if char == "\n":
+                self._in_comment = False
+            return
+
+        # 객체 안에서 템플릿의 // 주석을 그대로 출력하는 경우 허용 (문자열 밖의 '/'는 JSON에 올 수 없음)
+        if char == "/":
+            self._in_comment = self._slash
+            self._slash = not self._slash
+            return
+        self._slash = False
+
+        if self._depth == 1 and self._value_chars is not None and char in ",}":
+            self._finish_value()
+
+        self._capture(char)
+        if char.isspace():
+            return
+
+        if self._depth == 1 and self._value_chars is None:
+            self._consume_top_level(char)
+        elif self._depth == 2 and self._array_key is not None and self._record_chars is None:
+            self._consume_category_array(char)
+        else:
+            self._consume_nested(char, completed)
+
+    def _consume_top_level(self, char: str) -> None:
+        """최상위 객체의 키와 값 시작 처리"""
+        if self._expect_value:
+            self._expect_value = False
+            key = self._current_key
+            if key in self.categories:
+                if char != "[":
+                    raise StreamSchemaError(f"Category '{key}' is not an array")
+                self._seen.add(key)
+                self._array_key = key
+                self._depth = 2
+            else:
+                self._value_chars = [char]
+                self._consume_nested(char, [])
+            return
+
+        if char == '"':
+            self._in_string = True
+            self._key_chars = []
+        elif char == ":":
+            self._current_key = self._pending_key
+            self._pending_key = None
+            self._expect_value = True
+        elif char == "}":
+            self._depth = 0
+            self.done = True
+
+    def _consume_category_array(self, char: str) -> None:
+        """카테고리 배열의 원소 경계 처리"""
+        if char == "{":
+            self._record_chars = ["{"]
+            self._depth = 3
+        elif char == "]":
+            self._array_key = None
+            self._depth = 1
+        elif char != ",":
+            raise StreamSchemaError(f"Non-object element in '{self._array_key}' array")
+
+    def _consume_nested(self, char: str, completed: List[Record]) -> None:
+        """레코드 또는 카테고리 외 값 내부의 문자열/괄호 깊이 추적"""
+        if char == '"':
+            self._in_string = True
+        elif char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+            if self._record_chars is not None and self._depth == 2:
+                self._finish_record(completed)
+
+    def _finish_record(self, completed: List[Record]) -> None:
+        category = self._array_key
+        text = "".join(self._record_chars)
+        self._record_chars = None
+        try:
+            record = json.loads(remove_trailing_commas(text))
+        except ValueError as e:
+            raise StreamSchemaError(f"Malformed record in '{category}': {e}")
+        missing = [field for field in self.categories[category] if field not in record]
+        if missing:
+            raise StreamSchemaError(f"Record in '{category}' is missing fields {missing}")
+        self.records[category].append(record)
+        completed.append((category, record))
+
+    def _finish_value(self) -> None:
+        text = "".join(self._value_chars).strip()
+        self._value_chars = None
+        try:
+            self.extras[self._current_key] = json.loads(remove_trailing_commas(text))
+        except ValueError:
+            # 부가 필드는 파싱되지 않아도 레코드 스트림을 중단하지 않음
+            pass
@@ -0,0 +1,273 @@
+"""
+LLM 호출 공통 경로
+모든 에이전트와 DataCollector는 get_chat_model로 연결 풀을 공유하는 채팅 모델을 받고,
+LLM 호출은 invoke_llm을 거치며,
+여기서 프롬프트 토큰 수를 기록하고 응답 캐시를 조회/저장하며(호출자가 검증한 응답만 저장),
+캐시에 없는 호출은 서킷 브레이커와 프로세스 전역 속도 제한기를 통과한 뒤 모델로 전달합니다.
+"""
+import os
+import logging
+import threading
+from typing import Any, Callable, Optional, Tuple, List, Iterator, Dict
+from langchain_core.messages import AIMessage
+from utils.llm_cache import LLMCache
+from utils.token_budget import TokenLedger, count_tokens
+from utils.rate_limiter import AdaptiveRateLimiter
+from utils.circuit_breaker import CircuitBreaker
+from config import config
+
+logger = logging.getLogger(__name__)
+
+_cache: Optional[LLMCache] = None
+_cache_lock = threading.Lock()
+_ledger = TokenLedger()
+_limiter: Optional[AdaptiveRateLimiter] = None
+_breaker: Optional[CircuitBreaker] = None
+_http_client: Any = None
+_chat_models: Dict[Tuple[Any, ...], Any] = {}
+_client_lock = threading.Lock()
+
+
+def _create_http_client() -> Any:
+    """keep-alive 연결 풀을 가진 httpx 클라이언트 (h2가 설치되어 있으면 HTTP/2)"""
+    import httpx
+    settings = config.llm_client
+    http2 = settings.http2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.info("h2 is not installed; LLM HTTP client falls back to HTTP/1.1")
+            http2 = False
+    return httpx.Client(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry_seconds
+        ),
+        timeout=httpx.Timeout(settings.timeout_seconds, connect=settings.connect_timeout_seconds)
+    )
+
+
+def get_chat_model(model_name: Optional[str] = None, temperature: Optional[float] = None,
+                   max_tokens: Optional[int] = None) -> Any:
+    """
+    모델 설정별로 하나씩 생성되는 공유 채팅 모델
+
+    모든 인스턴스는 프로세스 전역 HTTP 클라이언트를 사용하므로, 에이전트 수나
+    배치/서비스 실행 횟수와 관계없이 연결과 TLS 세션을 재사용합니다.
+
+    Args:
+        model_name / temperature / max_tokens: 생략하면 config.openai 값
+    """
+    global _http_client
+    settings = (
+        model_name or config.openai.model_name,
+        config.openai.temperature if temperature is None else temperature,
+        config.openai.max_tokens if max_tokens is None else max_tokens
+    )
+    with _client_lock:
+        model = _chat_models.get(settings)
+        if model is None:
+            from langchain_openai import ChatOpenAI
+            if _http_client is None:
+                _http_client = _create_http_client()
+            model = ChatOpenAI(
+                model_name=settings[0],
+                temperature=settings[1],
+                max_tokens=settings[2],
+                http_client=_http_client
+            )
+            _chat_models[settings] = model
+    return model
+
+
+def close_llm_clients() -> None:
+    """공유 HTTP 클라이언트의 연결 종료 (서비스 종료 시)"""
+    global _http_client
+    with _client_lock:
+        if _http_client is not None:
+            _http_client.close()
+            _http_client = None
+        _chat_models.clear()
+
+
+def get_llm_cache() -> LLMCache:
+    """프로세스 전역 LLM 응답 캐시"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            bypass = os.getenv("LLM_CACHE_BYPASS", "").lower() in ("1", "true", "yes")
+            _cache = LLMCache(
+                path=config.llm_cache.path,
+                max_size_mb=config.llm_cache.max_size_mb,
+                ttl_seconds=config.llm_cache.ttl_seconds,
+                enabled=config.llm_cache.enabled and not bypass
+            )
+    return _cache
+
+
+def get_rate_limiter() -> AdaptiveRateLimiter:
+    """프로세스 전역 LLM 호출 속도 제한기"""
+    global _limiter
+    with _cache_lock:
+        if _limiter is None:
+            settings = config.rate_limit
+            _limiter = AdaptiveRateLimiter(
+                requests_per_minute=settings.requests_per_minute,
+                tokens_per_minute=settings.tokens_per_minute,
+                initial_concurrency=settings.initial_concurrency,
+                min_concurrency=settings.min_concurrency,
+                max_concurrency=settings.max_concurrency,
+                latency_target=settings.latency_target_seconds,
+                enabled=settings.enabled
+            )
+    return _limiter
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """프로세스 전역 LLM 서킷 브레이커"""
+    global _breaker
+    with _cache_lock:
+        if _breaker is None:
+            settings = config.circuit_breaker
+            _breaker = CircuitBreaker(
+                failure_threshold=settings.failure_threshold,
+                min_calls=settings.min_calls,
+                window_seconds=settings.window_seconds,
+                open_seconds=settings.open_seconds,
+                max_open_seconds=settings.max_open_seconds,
+                enabled=settings.enabled
+            )
+    return _breaker
+
+
+def get_token_ledger() -> TokenLedger:
+    """프로세스 전역 프롬프트 토큰 기록"""
+    return _ledger
+
+
+def render_prompt(prompt_input: Any) -> str:
+    """캐시 키 계산을 위한 프롬프트 직렬화"""
+    if isinstance(prompt_input, str):
+        return prompt_input
+    if hasattr(prompt_input, "to_messages"):
+        prompt_input = prompt_input.to_messages()
+    if isinstance(prompt_input, (list, tuple)):
+        return "\n".join(
+            f"{getattr(message, 'type', 'text')}: {getattr(message, 'content', message)}"
+            for message in prompt_input
+        )
+    return str(prompt_input)
+
+
+def _prepare_call(llm: Any, prompt_input: Any, label: str) -> Tuple[LLMCache, Optional[str], Optional[str], int]:
+    """토큰 기록 후 (캐시, 캐시 키, 모델명, 요청 토큰 추정치) 반환. 캐시가 꺼져 있으면 키는 None"""
+    cache = get_llm_cache()
+    model = getattr(llm, "model_name", None)
+    prompt_text = render_prompt(prompt_input)
+
+    prompt_tokens = count_tokens(prompt_text, config.token_budget.encoding_model)
+    _ledger.record(label, prompt_tokens)
+    logger.debug(f"Prompt for {label}: {prompt_tokens} tokens")
+    # 공급자의 TPM 계산과 같이 프롬프트에 최대 출력 토큰을 더해 예약
+    request_tokens = prompt_tokens + (getattr(llm, "max_tokens", None) or 0)
+
+    if not cache.enabled:
+        return cache, None, model, request_tokens
+    key = cache.make_key(
+        model=model,
+        temperature=getattr(llm, "temperature", None),
+        max_tokens=getattr(llm, "max_tokens", None),
+        prompt=prompt_text
+    )
+    return cache, key, model, request_tokens
+
+
+def _accepts(validate: Optional[Callable[[str], Any]], content: str, label: str) -> bool:
+    """validate가 없거나 응답을 받아들이면 True (검증 중 예외는 거부로 처리)"""
+    if validate is None:
+        return True
+    try:
+        return bool(validate(content))
+    except Exception as e:
+        logger.debug(f"Response for {label} failed validation: {e}")
+        return False
+
+
+def invoke_llm(llm: Any, prompt_input: Any, label: str = "llm",
+               validate: Optional[Callable[[str], Any]] = None) -> Any:
+    """
+    LLM 호출 (토큰 기록 및 응답 캐시 경유)
+
+    Args:
+        llm: ChatOpenAI 등 invoke를 지원하는 채팅 모델
+        prompt_input: 문자열, 메시지 목록 또는 PromptValue
+        label: 토큰 사용량을 집계할 호출 주체 이름
+        validate: 응답 텍스트를 호출자가 파싱할 수 있는지 확인하는 함수. 참을 반환한 응답만
+            캐시에 저장하며, 검증에 실패한 캐시 항목은 제거하고 모델을 다시 호출합니다.
+
+    Returns:
+        content 속성을 가진 응답 메시지
+
+    Raises:
+        CircuitOpenError: 공급자 오류가 누적되어 서킷 브레이커가 열린 경우
+    """
+    cache, key, model, request_tokens = _prepare_call(llm, prompt_input, label)
+    if key:
+        cached = cache.get(key)
+        if cached is not None:
+            if _accepts(validate, cached, label):
+                return AIMessage(content=cached)
+            logger.warning(f"Discarding cached response for {label} that failed validation")
+            cache.delete(key)
+
+    # 회로가 열려 있으면 대기열에 들어가지 않고 즉시 실패
+    with get_circuit_breaker().guard(), get_rate_limiter().slot(request_tokens):
+        response = llm.invoke(prompt_input)
+
+    content = response.content
+    if key and isinstance(content, str) and content and _accepts(validate, content, label):
+        cache.put(key, content, model=model)
+
+    return response
+
+
+def stream_llm(llm: Any, prompt_input: Any, label: str = "llm",
+               validate: Optional[Callable[[str], Any]] = None) -> Iterator[str]:
+    """
+    LLM 스트리밍 호출 (토큰 기록 및 응답 캐시 경유)
+
+    캐시에 있으면 저장된 응답을 한 청크로 반환합니다. 끝까지 소비된 응답만 캐시에
+    저장하므로, 소비자가 도중에 중단(close)한 응답은 저장되지 않습니다.
+    validate는 소비자가 모든 청크를 받은 뒤 전체 응답으로 호출되며, 거부한 응답은
+    저장하지 않고 캐시에서 꺼낸 응답이면 제거합니다.
+
+    Yields:
+        응답 텍스트 청크
+    """
+    cache, key, model, request_tokens = _prepare_call(llm, prompt_input, label)
+    if key:
+        cached = cache.get(key)
+        if cached is not None:
+            yield cached
+            if not _accepts(validate, cached, label):
+                logger.warning(f"Discarding cached response for {label} that failed validation")
+                cache.delete(key)
+            return
+
+    parts: List[str] = []
+    # 스트림이 끝날 때까지 동시 호출 한도를 점유하고, 지연 시간은 첫 청크 기준으로 측정
+    with get_circuit_breaker().guard(), get_rate_limiter().slot(request_tokens) as permit:
+        for chunk in llm.stream(prompt_input):
+            permit.first_response()
+            content = chunk.content if isinstance(chunk.content, str) else ""
+            if content:
+                parts.append(content)
+                yield content
+
+    if key and parts:
+        content = "".join(parts)
+        if _accepts(validate, content, label):
+            cache.put(key, content, model=model)
@@ -0,0 +1,153 @@
+"""
+LLM 응답 캐시
+모델 설정과 렌더링된 프롬프트의 해시를 키로 응답을 SQLite 파일에 저장합니다.
+전체 크기 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거(LRU)하고,
+TTL이 지난 항목은 조회 시 폐기합니다. 호출자가 파싱에 실패한 응답은 delete로 제거합니다.
+"""
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """콘텐츠 주소 기반 디스크 LLM 응답 캐시"""
+    def __init__(self, path: Path, max_size_mb: float = 200.0, ttl_seconds: Optional[float] = None,
+                 enabled: bool = True) -> None:
+        self.path = Path(path)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "expired": 0, "invalidated": 0}
+
+    @staticmethod
+    def make_key(model: Optional[str], temperature: Optional[float], max_tokens: Optional[int],
+                 prompt: str) -> str:
+        """모델 설정과 프롬프트 해시로 캐시 키 생성"""
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        material = json.dumps([model, temperature, max_tokens, prompt_hash])
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " model TEXT,"
+                " response TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+
+            response, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self._stats["hits"] += 1
+            return response
+
+    def put(self, key: str, response: str, model: Optional[str] = None) -> None:
+        """응답 저장 후 크기 상한 초과분 제거"""
+        if not self.enabled:
+            return
+
+        size = len(response.encode('utf-8'))
+        if size > self.max_size_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now)
+            )
+            self._stats["writes"] += 1
+            self._evict(conn)
+            conn.commit()
+
+    def delete(self, key: str) -> None:
+        """항목 제거 (저장된 응답을 호출자가 사용할 수 없는 경우)"""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            conn = self._connection()
+            if conn.execute("DELETE FROM responses WHERE key = ?", (key,)).rowcount:
+                self._stats["invalidated"] += 1
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """전체 크기가 상한 이하가 될 때까지 LRU 순으로 제거"""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        rows = conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_size_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM responses")
+            conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 카운터 및 저장 현황"""
+        with self._lock:
+            stats = dict(self._stats)
+            if self._conn is not None:
+                entries, total = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                ).fetchone()
+                stats.update({"entries": entries, "size_bytes": total})
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["enabled"] = self.enabled
+        return stats
@@ -1,9 +1,19 @@
 import logging
 from logging.handlers import RotatingFileHandler
+from pathlib import Path
 from typing import Optional
 from config import config
 import threading
 
+class _LazyRotatingFileHandler(RotatingFileHandler):
+    """첫 기록 시점에 파일과 디렉토리를 만드는 회전 파일 핸들러 (임포트 시 파일시스템을 변경하지 않음)"""
+    def __init__(self, filename: str, **kwargs) -> None:
+        super().__init__(filename, delay=True, **kwargs)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
 class Logger:
     _instance = None
     _lock = threading.Lock()
@@ -23,8 +33,8 @@ class Logger:
                     datefmt=config.logging.date_format
                 )
 
-                # 파일 핸들러 설정
-                file_handler = RotatingFileHandler(
+                # 파일 핸들러 설정 (로그 디렉토리는 첫 기록 시 생성)
+                file_handler = _LazyRotatingFileHandler(
                     filename=str(config.logging.file_path),
                     maxBytes=10*1024*1024,  # 10MB
                     backupCount=5,
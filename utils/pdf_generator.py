@@ -8,7 +8,6 @@ import markdown
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
-from weasyprint import HTML, CSS
 from config import config
 from utils.logger import logger
 
@@ -205,7 +204,8 @@ class PDFGenerator:
             font_dir = str(config.paths.fonts_dir).replace('\\', '/')
             css = self.css_template % (font_dir, font_dir)
             
-            # HTML을 PDF로 변환
+            # HTML을 PDF로 변환 (WeasyPrint는 임포트 비용이 커서 사용 시점에 로드)
+            from weasyprint import HTML, CSS
             HTML(string=full_html).write_pdf(
                 output_path,
                 stylesheets=[CSS(string=css)]
@@ -0,0 +1,155 @@
+"""
+LLM 호출 적응형 속도 제한
+프로세스 전체의 LLM 호출이 분당 요청 수(RPM)/토큰 수(TPM) 토큰 버킷과 동시 실행 한도를
+함께 통과하도록 합니다. 동시 실행 한도는 AIMD 방식으로 조정합니다:
+응답이 목표 지연 이내면 한도를 조금씩 늘리고, 429 응답이나 목표를 넘는 지연이 관측되면
+곱으로 줄입니다. 429에 Retry-After가 있으면 그 시간 동안 새 호출을 멈춥니다.
+"""
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, Optional
+from utils.retry import is_rate_limited, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """분당 용량만큼 연속적으로 채워지는 토큰 버킷 (잠금은 호출자가 담당)"""
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.available = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.available = min(self.capacity, self.available + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount만큼 꺼낼 수 있을 때까지 남은 시간 (용량보다 큰 요청은 용량으로 취급)"""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return 0.0 if self.available >= amount else (amount - self.available) / self._rate
+
+    def take(self, amount: float) -> None:
+        self.available -= min(amount, self.capacity)
+
+
+class Permit:
+    """속도 제한 통과 후 호출 결과를 기록하는 핸들"""
+    def __init__(self, tokens: int, started: float) -> None:
+        self.tokens = tokens
+        self.started = started
+        self.latency: Optional[float] = None
+
+    def first_response(self) -> None:
+        """스트리밍에서 첫 청크 수신 시점을 지연 시간으로 기록"""
+        if self.latency is None:
+            self.latency = time.monotonic() - self.started
+
+
+class AdaptiveRateLimiter:
+    """
+    RPM/TPM 토큰 버킷과 AIMD 동시 실행 한도를 결합한 프로세스 전역 속도 제한기
+
+    Args:
+        requests_per_minute: 분당 요청 수 상한 (0이면 제한 없음)
+        tokens_per_minute: 분당 토큰 수 상한 (0이면 제한 없음)
+        initial_concurrency: 시작 동시 실행 한도
+        min_concurrency / max_concurrency: 동시 실행 한도 범위
+        latency_target: 이 시간(초)을 넘는 응답은 과부하 신호로 보고 한도를 줄임
+    """
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0,
+                 initial_concurrency: int = 4, min_concurrency: int = 1, max_concurrency: int = 16,
+                 latency_target: float = 30.0, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.limit = float(min(max(initial_concurrency, self.min_concurrency), self.max_concurrency))
+        self.latency_target = latency_target
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+        self._stats = {"calls": 0, "rate_limited": 0, "slow": 0, "total_wait": 0.0, "max_wait": 0.0}
+
+    def _wait_time(self, tokens: int, now: float) -> float:
+        waits = [self._paused_until - now]
+        if self._requests:
+            waits.append(self._requests.wait_time(1, now))
+        if self._tokens:
+            waits.append(self._tokens.wait_time(tokens, now))
+        return max(waits)
+
+    def acquire(self, tokens: int = 0) -> Permit:
+        """동시 실행 한도와 버킷이 허용할 때까지 대기 후 통과"""
+        requested = time.monotonic()
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                if self._in_flight < int(self.limit):
+                    wait = self._wait_time(tokens, now)
+                    if wait <= 0:
+                        break
+                    self._condition.wait(wait)
+                else:
+                    self._condition.wait()
+            if self._requests:
+                self._requests.take(1)
+            if self._tokens:
+                self._tokens.take(tokens)
+            self._in_flight += 1
+            waited = now - requested
+            self._stats["calls"] += 1
+            self._stats["total_wait"] += waited
+            self._stats["max_wait"] = max(self._stats["max_wait"], waited)
+        return Permit(tokens, now)
+
+    def release(self, permit: Permit, error: Optional[BaseException] = None) -> None:
+        """호출 결과를 반영하여 동시 실행 한도 조정"""
+        now = time.monotonic()
+        latency = permit.latency if permit.latency is not None else now - permit.started
+        with self._condition:
+            self._in_flight -= 1
+            if error is not None and is_rate_limited(error):
+                self._stats["rate_limited"] += 1
+                self.limit = max(self.min_concurrency, self.limit / 2)
+                pause = retry_after_seconds(error)
+                if pause:
+                    self._paused_until = max(self._paused_until, now + pause)
+                logger.warning(f"LLM rate limited; concurrency limit lowered to {int(self.limit)}")
+            elif error is None and latency > self.latency_target:
+                self._stats["slow"] += 1
+                self.limit = max(self.min_concurrency, self.limit * 0.9)
+            elif error is None:
+                # 한도만큼 성공하면 1 증가
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, tokens: int = 0) -> Iterator[Permit]:
+        """acquire/release를 감싼 컨텍스트 (블록 안의 예외로 429 여부 판단)"""
+        if not self.enabled:
+            yield Permit(tokens, time.monotonic())
+            return
+        permit = self.acquire(tokens)
+        try:
+            yield permit
+        except BaseException as e:
+            self.release(permit, e)
+            raise
+        self.release(permit)
+
+    def stats(self) -> Dict[str, Any]:
+        """대기 시간 및 한도 현황"""
+        with self._condition:
+            stats = dict(self._stats)
+            stats.update({"concurrency_limit": int(self.limit), "in_flight": self._in_flight})
+        stats["avg_wait"] = round(stats["total_wait"] / stats["calls"], 3) if stats["calls"] else 0.0
+        stats["total_wait"] = round(stats["total_wait"], 3)
+        stats["max_wait"] = round(stats["max_wait"], 3)
+        stats["enabled"] = self.enabled
+        return stats
@@ -0,0 +1,107 @@
+"""
+보고서 렌더링 프로세스 풀
+WeasyPrint 레이아웃은 CPU를 많이 쓰고 GIL을 점유하므로 PDF/HTML 생성을
+별도 프로세스에서 수행하고 Future로 완료/오류를 전달합니다.
+"""
+import atexit
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Any, Optional, Callable
+from utils.logger import logger
+from config import config
+
+_pool: Optional["RenderPool"] = None
+_pool_lock = threading.Lock()
+
+# 워커 프로세스별 PDFGenerator (폰트/CSS 준비 비용을 한 번만 지불)
+_generator = None
+
+
+def _get_generator():
+    global _generator
+    if _generator is None:
+        from utils.pdf_generator import PDFGenerator
+        _generator = PDFGenerator()
+    return _generator
+
+
+def _render_pdf(markdown_content: str, output_path: str, metadata: Dict[str, Any]) -> str:
+    return _get_generator().generate_pdf(markdown_content, output_path, metadata)
+
+
+def _render_html(markdown_content: str, output_path: str, metadata: Dict[str, Any]) -> str:
+    return _get_generator().generate_html(markdown_content, output_path, metadata)
+
+
+class RenderPool:
+    """PDF/HTML 렌더링 작업 제출기"""
+    def __init__(self, processes: int = 2, use_processes: bool = True) -> None:
+        self.processes = max(1, processes)
+        self.use_processes = use_processes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # 스레드가 있는 프로세스에서 fork하면 잠금 상태가 복제되므로 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _submit(self, func: Callable[..., str], kind: str, markdown_content: str,
+                output_path: str, metadata: Dict[str, Any]) -> "Future[str]":
+        if self.use_processes:
+            future = self._get_executor().submit(func, markdown_content, output_path, metadata)
+        else:
+            future = Future()
+            try:
+                future.set_result(func(markdown_content, output_path, metadata))
+            except Exception as e:
+                future.set_exception(e)
+
+        def _log_result(done: "Future[str]") -> None:
+            # 취소된 Future의 exception()은 CancelledError를 일으키므로 먼저 확인
+            if done.cancelled():
+                logger.warning(f"{kind} rendering cancelled for {output_path}")
+                return
+            error = done.exception()
+            if error:
+                logger.error(f"{kind} rendering failed for {output_path}: {error}")
+            else:
+                logger.info(f"{kind} rendering completed: {done.result()}")
+
+        future.add_done_callback(_log_result)
+        return future
+
+    def submit_pdf(self, markdown_content: str, output_path: str,
+                   metadata: Optional[Dict[str, Any]] = None) -> "Future[str]":
+        """PDF 렌더링 제출"""
+        return self._submit(_render_pdf, "PDF", markdown_content, output_path, metadata or {})
+
+    def submit_html(self, markdown_content: str, output_path: str,
+                    metadata: Optional[Dict[str, Any]] = None) -> "Future[str]":
+        """HTML 렌더링 제출"""
+        return self._submit(_render_html, "HTML", markdown_content, output_path, metadata or {})
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+
+
+def get_render_pool() -> RenderPool:
+    """프로세스 전역 렌더링 풀"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = RenderPool(
+                processes=config.render.processes,
+                use_processes=config.render.use_process_pool
+            )
+            atexit.register(_pool.shutdown)
+    return _pool
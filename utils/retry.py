@@ -0,0 +1,232 @@
+"""
+재시도 정책
+지수 백오프 + 지터, Retry-After/레이트 리밋 응답 처리, 재시도하지 않을 에러 분류,
+그리고 한 실행 안에서 중첩된 재시도 계층이 함께 소비하는 재시도 예산을 제공합니다.
+
+재시도 데코레이터가 여러 계층에 겹쳐 있어도 실패가 곱절로 늘지 않도록, 안쪽 계층이
+포기한 예외에는 표시를 남겨 바깥 계층은 같은 실패를 다시 재시도하지 않습니다.
+"""
+import time
+import random
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Iterator, Optional, Tuple, Type
+from utils.exceptions import ValidationError, PromptError, CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+# 재시도해도 결과가 같은 에러 (입력/프롬프트/코드 오류)
+NON_RETRYABLE_ERRORS: Tuple[Type[BaseException], ...] = (
+    ValidationError, PromptError, TypeError, AttributeError, NotImplementedError
+)
+
+# 재시도하지 않는 HTTP 상태 코드 (요청 자체가 잘못되었거나 권한이 없음)
+NON_RETRYABLE_STATUS = frozenset({400, 401, 403, 404, 409, 422})
+
+# 공급자 쪽 시간 초과/연결 오류 예외 이름 (openai/httpx)
+_PROVIDER_ERROR_NAMES = frozenset({
+    "APITimeoutError", "APIConnectionError", "TimeoutException", "ConnectTimeout",
+    "ReadTimeout", "ConnectError", "RemoteProtocolError"
+})
+
+_GAVE_UP_ATTR = "_retry_gave_up"
+
+
+class RetryBudget:
+    """
+    실행 단위 재시도 예산 (스레드 간 공유)
+
+    Args:
+        limit: 실행 전체에서 허용하는 재시도 횟수 (첫 시도는 포함하지 않음)
+    """
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.used >= self.limit:
+                return False
+            self.used += 1
+            return True
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            return max(0, self.limit - self.used)
+
+
+_current_budget: contextvars.ContextVar[Optional[RetryBudget]] = contextvars.ContextVar("retry_budget", default=None)
+
+
+@contextmanager
+def retry_budget(limit: int) -> Iterator[RetryBudget]:
+    """
+    블록 안의 재시도가 공유할 예산 설정
+
+    스레드 풀에서 실행되는 작업도 contextvars.copy_context()로 제출하면 같은 예산을 사용합니다.
+    """
+    budget = RetryBudget(limit)
+    token = _current_budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _current_budget.reset(token)
+
+
+def current_budget() -> Optional[RetryBudget]:
+    return _current_budget.get()
+
+
+def exception_chain(error: BaseException) -> Iterator[BaseException]:
+    """예외와 그 원인(__cause__/__context__)을 차례로 반환"""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        error = error.__cause__ or error.__context__
+
+
+def caused_by(error: BaseException, error_type: Type[BaseException]) -> bool:
+    """예외 또는 그 원인 중 error_type이 있는지"""
+    return any(isinstance(item, error_type) for item in exception_chain(error))
+
+
+def mark_gave_up(error: BaseException) -> None:
+    """재시도 판단이 끝난 예외로 표시 (바깥 계층은 재시도하지 않음)"""
+    try:
+        setattr(error, _GAVE_UP_ATTR, True)
+    except AttributeError:
+        pass
+
+
+def already_gave_up(error: BaseException) -> bool:
+    """예외 또는 그 원인 중 안쪽 재시도 계층이 이미 포기한 것이 있는지"""
+    return any(getattr(item, _GAVE_UP_ATTR, False) for item in exception_chain(error))
+
+
+def status_code(error: BaseException) -> Optional[int]:
+    """HTTP 클라이언트 예외의 상태 코드 (openai/httpx 예외 형식)"""
+    code = getattr(error, "status_code", None)
+    if code is None:
+        code = getattr(getattr(error, "response", None), "status_code", None)
+    return code if isinstance(code, int) else None
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    return status_code(error) == 429 or "RateLimit" in type(error).__name__
+
+
+def is_retryable(error: BaseException) -> bool:
+    if isinstance(error, NON_RETRYABLE_ERRORS):
+        return False
+    # 회로가 열려 있으면 다른 예외로 감싸져 있어도 재시도하지 않음
+    if caused_by(error, CircuitOpenError):
+        return False
+    return status_code(error) not in NON_RETRYABLE_STATUS
+
+
+def is_provider_error(error: BaseException) -> bool:
+    """
+    예외 또는 그 원인이 LLM 공급자 상태를 나타내는지 (회로 열림, 레이트 리밋, 5xx, 시간 초과, 연결 오류)
+
+    이런 오류는 수집기가 빈 결과로 삼키지 않고 호출자에게 전달하여 서킷 브레이커와
+    stale 보고서 경로가 동작하도록 합니다. 응답 파싱 실패 등은 해당하지 않습니다.
+    """
+    for item in exception_chain(error):
+        code = status_code(item)
+        if (isinstance(item, (CircuitOpenError, TimeoutError, ConnectionError)) or is_rate_limited(item)
+                or (code is not None and code >= 500) or type(item).__name__ in _PROVIDER_ERROR_NAMES):
+            return True
+    return False
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """예외의 retry_after 속성 또는 응답 헤더(retry-after-ms, retry-after)에서 대기 시간 추출"""
+    value = getattr(error, "retry_after", None)
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        milliseconds = headers.get("retry-after-ms")
+        if milliseconds is not None:
+            return max(0.0, float(milliseconds) / 1000)
+        header = headers.get("retry-after")
+        if header is None:
+            return None
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            # HTTP-date 형식
+            retry_at = parsedate_to_datetime(header)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, base: float, maximum: float, rate_limited: bool = False,
+                  rng: Optional[random.Random] = None) -> float:
+    """
+    attempt번째 실패 후 대기 시간
+
+    일반 실패는 full jitter(0 ~ 지수 상한 사이 균등)로 동시 재시도를 분산하고,
+    레이트 리밋은 equal jitter(상한의 절반 이상)로 최소 대기 시간을 보장합니다.
+    """
+    rng = rng or random
+    ceiling = min(maximum, base * (2 ** (attempt - 1)))
+    if rate_limited:
+        return ceiling / 2 + rng.uniform(0, ceiling / 2)
+    return rng.uniform(0, ceiling)
+
+
+def call_with_retry(func: Callable[..., Any], args: tuple = (), kwargs: Optional[dict] = None,
+                    max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                    sleep: Callable[[float], None] = time.sleep, name: Optional[str] = None) -> Any:
+    """
+    재시도 정책에 따라 함수 호출
+
+    다음 경우에는 즉시 예외를 다시 발생시킵니다: 재시도할 수 없는 에러, 안쪽 계층이 이미
+    포기한 에러, Retry-After가 max_delay보다 긴 경우, 실행 재시도 예산 소진, 시도 횟수 소진.
+    """
+    kwargs = kwargs or {}
+    name = name or getattr(func, "__name__", "call")
+    attempt = 0
+    while True:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            attempt += 1
+            reason = None
+            if already_gave_up(e):
+                raise
+            if not is_retryable(e):
+                reason = "non-retryable error"
+            elif attempt >= max_attempts:
+                reason = f"{max_attempts} attempts"
+
+            retry_after = retry_after_seconds(e) if reason is None else None
+            if retry_after is not None and retry_after > max_delay:
+                reason = f"retry-after {retry_after:.1f}s exceeds {max_delay:.1f}s"
+
+            budget = current_budget()
+            if reason is None and budget is not None and not budget.try_acquire():
+                reason = f"retry budget of {budget.limit} exhausted"
+
+            if reason is not None:
+                logger.error(f"{name} failed ({reason}): {e}")
+                mark_gave_up(e)
+                raise
+
+            wait = backoff_delay(attempt, base_delay, max_delay, is_rate_limited(e))
+            if retry_after is not None:
+                wait = max(wait, retry_after)
+            logger.warning(f"{name} attempt {attempt} failed ({type(e).__name__}), retrying in {wait:.2f} seconds")
+            sleep(wait)
@@ -0,0 +1,72 @@
+"""
+시작 시간 프로파일링
+새 인터프리터에서 `python -X importtime`으로 대상 모듈을 임포트하고
+모듈/최상위 패키지별 임포트 비용을 집계합니다.
+"""
+import re
+import sys
+import subprocess
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import List, Dict
+
+_LINE_PATTERN = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+
+@dataclass
+class ImportRecord:
+    """모듈 하나의 임포트 시간 (마이크로초)"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def measure_imports(target: str = "app") -> List[ImportRecord]:
+    """별도 프로세스에서 대상 모듈 임포트 시간 측정"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True,
+        text=True
+    )
+    records = []
+    for line in result.stderr.splitlines():
+        match = _LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), len(indent) // 2))
+
+    if result.returncode != 0:
+        error_lines = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"Importing {target} failed:\n" + "\n".join(error_lines[-10:]))
+    return records
+
+
+def summarize_by_package(records: List[ImportRecord]) -> Dict[str, int]:
+    """최상위 패키지별 자체 임포트 시간 합계"""
+    totals: Dict[str, int] = defaultdict(int)
+    for record in records:
+        totals[record.module.split(".")[0]] += record.self_us
+    return dict(sorted(totals.items(), key=lambda item: item[1], reverse=True))
+
+
+def format_report(records: List[ImportRecord], top_n: int = 25) -> str:
+    """임포트 비용 보고서 문자열"""
+    total_us = sum(record.self_us for record in records)
+    lines = [f"Total import time: {total_us / 1000:.1f} ms ({len(records)} modules)", ""]
+
+    lines.append("By top-level package (self time):")
+    for package, self_us in list(summarize_by_package(records).items())[:top_n]:
+        share = self_us / total_us * 100 if total_us else 0.0
+        lines.append(f"  {self_us / 1000:9.1f} ms  {share:5.1f}%  {package}")
+
+    lines.append("")
+    lines.append("Slowest modules (cumulative time):")
+    for record in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[:top_n]:
+        lines.append(f"  {record.cumulative_us / 1000:9.1f} ms  {record.module}")
+    return "\n".join(lines)
+
+
+def profile_startup(target: str = "app", top_n: int = 25) -> str:
+    """대상 모듈의 시작 시간 보고서 생성"""
+    return format_report(measure_imports(target), top_n)
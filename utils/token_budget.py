@@ -0,0 +1,146 @@
+"""
+프롬프트 토큰 계산 및 예산 관리
+tiktoken으로 렌더링된 프롬프트의 토큰 수를 측정하고, 호출 주체별 누적량을 기록하며,
+JSON 직렬화 결과가 예산을 넘지 않도록 목록을 줄이는 도구를 제공합니다.
+tiktoken이 없으면 문자 수 기반 추정치를 사용합니다.
+"""
+import json
+import logging
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, Any, Optional, Callable
+
+logger = logging.getLogger(__name__)
+
+# tiktoken이 없을 때 사용하는 토큰당 평균 문자 수 (영문 기준 보수적 추정)
+_CHARS_PER_TOKEN = 3
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str):
+    """
+    모델의 tiktoken 인코딩 (사용할 수 없으면 None)
+
+    토큰 계산은 모든 LLM 호출 경로에서 수행되므로 최선 노력으로 동작합니다. 오프라인/프록시 환경에서
+    BPE 파일 다운로드가 실패하는 등 어떤 오류든 한 번만 기록하고 결과(None)를 캐시하여 문자 수 추정을 사용합니다.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding for {model} is unavailable, using character estimate: {e}")
+        return None
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """텍스트의 토큰 수"""
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // _CHARS_PER_TOKEN + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, budget: int, model: str = "gpt-4o") -> str:
+    """토큰 예산 이내로 텍스트 자르기"""
+    if budget <= 0:
+        return ""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        limit = budget * _CHARS_PER_TOKEN
+        return text if len(text) <= limit else text[:limit]
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= budget:
+        return text
+    return encoding.decode(tokens[:budget])
+
+
+def _json_default(value: Any) -> Any:
+    # 레코드 모델 등 to_dict를 제공하는 객체는 사전으로 직렬화
+    return value.to_dict() if hasattr(value, "to_dict") else str(value)
+
+
+def to_prompt_json(value: Any) -> str:
+    """프롬프트 삽입용 간결한 JSON 직렬화"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_json_default)
+
+
+def fit_lists_to_budget(data: Dict[str, Any], budget: int, model: str = "gpt-4o",
+                        measure: Optional[Callable[[str], int]] = None) -> Dict[str, Any]:
+    """
+    직렬화 결과가 예산 이내가 되도록 목록 값을 뒤에서부터 줄임
+
+    목록은 이미 중요도 순으로 정렬되어 있다고 가정하며, 가장 긴 목록부터
+    비율에 맞춰 이분 탐색으로 남길 개수를 찾습니다.
+
+    Args:
+        data: 값이 목록 또는 스칼라인 사전
+        budget: 토큰 상한
+
+    Returns:
+        목록이 잘린 사본 (원본은 변경하지 않음)
+    """
+    measure = measure or (lambda text: count_tokens(text, model))
+    if measure(to_prompt_json(data)) <= budget:
+        return dict(data)
+
+    lists = {key: value for key, value in data.items() if isinstance(value, list)}
+
+    def build(ratio: float) -> Dict[str, Any]:
+        result = dict(data)
+        for key, value in lists.items():
+            result[key] = value[:int(len(value) * ratio)]
+        return result
+
+    low, high = 0.0, 1.0
+    best = build(0.0)
+    for _ in range(12):
+        middle = (low + high) / 2
+        candidate = build(middle)
+        if measure(to_prompt_json(candidate)) <= budget:
+            best, low = candidate, middle
+        else:
+            high = middle
+    return best
+
+
+class TokenLedger:
+    """호출 주체별 프롬프트 토큰 누적 기록"""
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._usage: Dict[str, Dict[str, int]] = defaultdict(lambda: {"calls": 0, "prompt_tokens": 0, "max_prompt_tokens": 0})
+
+    def record(self, label: str, prompt_tokens: int) -> None:
+        with self._lock:
+            usage = self._usage[label]
+            usage["calls"] += 1
+            usage["prompt_tokens"] += prompt_tokens
+            usage["max_prompt_tokens"] = max(usage["max_prompt_tokens"], prompt_tokens)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {label: dict(usage) for label, usage in self._usage.items()}
+
+    @property
+    def total_tokens(self) -> int:
+        with self._lock:
+            return sum(usage["prompt_tokens"] for usage in self._usage.values())
+
+    def summary(self) -> str:
+        parts = [
+            f"{label}={usage['prompt_tokens']} ({usage['calls']} calls)"
+            for label, usage in sorted(self.snapshot().items(), key=lambda item: -item[1]["prompt_tokens"])
+        ]
+        return f"total={self.total_tokens} " + ", ".join(parts)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._usage.clear()